@@ -46,6 +46,13 @@ import numpy as np
 # 
 # Done!
 #
+# NOTE:
+# The results parsers' CSV files start with the 5 columns ALGORITHM, FILE_NAME,
+# PATH_LENGTH, ELAPSED_TIME and MEMORY_CONSUMED, and (from newer versions of the
+# pathfinding programs) go on with the phase time columns LOAD_TIME, BUILD_TIME,
+# SEARCH_TIME and RECONSTRUCT_TIME. Every column is carried through, under its
+# own name plus the suffix (e.g., 'SEARCH_TIME_a').
+#
 # NOTE: 
 # Make sure that if you are writing to a new file, that the file doesn't already
 # exist but is empty. In that case, just delete it, and let this script create the file
@@ -254,8 +261,11 @@ def main():
     #Read the input file, pass in full directory path + filename:
     column_names = ['ALGORITHM_' + suffix, 'FILE_NAME_' + suffix, 'PATH_LENGTH_' + suffix, 'ELAPSED_TIME_' + suffix, 'MEMORY_CONSUMED_' + suffix]
     #print('Column names = %s' % column_names)
-    #Pandas: pass in "header=0" to be able to replace existing column names in file with new ones:
-    df1 = pd.read_csv(inpathfile, sep=",", header=0, names = column_names)
+    #Pandas: pass in "header=0" to be able to replace existing column names in file with new ones.
+    # Any columns after the first 5 (the phase times, e.g. 'LOAD_TIME') keep their own names:
+    df1 = pd.read_csv(inpathfile, sep=",", header=0)
+    column_names += [ str(name) + '_' + suffix for name in df1.columns[len(column_names):] ]
+    df1.columns = column_names
     #print ("Input file contents:")
     #print (df1)
 
@@ -277,11 +287,8 @@ def main():
         #print ("Output file contents:")
         #print(df2)
         #Now append input of dataframe1 to target (dataframe2) file contents, then write df2.
-        df2['ALGORITHM_' + suffix] = df1['ALGORITHM_' + suffix]
-        df2['FILE_NAME_' + suffix] = df1['FILE_NAME_' + suffix]
-        df2['PATH_LENGTH_' + suffix] = df1['PATH_LENGTH_' + suffix]
-        df2['ELAPSED_TIME_' + suffix] = df1['ELAPSED_TIME_' + suffix]
-        df2['MEMORY_CONSUMED_' + suffix] = df1['MEMORY_CONSUMED_' + suffix]
+        for name in column_names:
+            df2[name] = df1[name]
         df2.to_csv(outputfile, sep=',', encoding='utf-8', index=False, header=True)
         print("Done.")
 
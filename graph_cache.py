@@ -0,0 +1,179 @@
+import os
+import json
+import time
+import shutil
+import hashlib
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Local cache of generated graph files, used by the graph generator so that a
+workload that was already generated (same size, k, p, seed, ...) is copied
+from the cache rather than generated again.
+
+Each cache entry holds the files of one graph (e.g., its '.csv', '.graphml'
+and '.csr' files), and is addressed by a hash of the parameters that fully
+determine the graph's contents. The cache directory holds:
+
+    index.json            the index: parameters, file sizes, and last use time
+                          of every entry
+    <hh>/<hash>/graph.*   the cached files of the entry with that hash
+
+When the cache grows past its size limit, the least recently used entries are
+evicted first.
+"""
+
+
+INDEX_FILE_NAME = 'index.json'
+INDEX_VERSION = 1
+
+
+############################################################
+#
+# Returns the cache key (a SHA-256 hex digest) for the given graph parameters,
+# which must be JSON serializable (e.g., size, k, p, seed, graph ID).
+#
+def cacheKey( params ):
+    text = json.dumps( params, sort_keys=True, separators=(',', ':') )
+    return hashlib.sha256( text.encode('utf-8') ).hexdigest()
+
+
+############################################################
+#
+# Size-bounded graph file cache.
+#
+# 'mode' is 'copy' (the default) or 'link'. In 'link' mode, cache hits are
+# hard linked into place (falling back to a copy across file systems), so
+# the linked output files share storage with the cache and must not be
+# modified in place: the generator's writers replace an existing file (see
+# graph_formats.openGraphFile()) rather than write through it.
+#
+# The index is only read and written by the process that owns this object
+# (e.g., the main process of the generator, never its workers).
+#
+class GraphCache(object):
+
+    def __init__(self, cacheDir, maxBytes, mode='copy', debug=False):
+        self.cacheDir = cacheDir
+        self.maxBytes = int(maxBytes)
+        self.mode = mode
+        self.debug = debug
+        self.indexPathFile = os.path.join( cacheDir, INDEX_FILE_NAME )
+
+        if not os.path.isdir(cacheDir):
+            os.makedirs(cacheDir)
+        self.entries = self._loadIndex()
+
+    def _loadIndex(self):
+        try:
+            with open(self.indexPathFile, 'r') as inFile:
+                index = json.load(inFile)
+        except (IOError, OSError, ValueError):
+            return {}
+        if index.get('version') != INDEX_VERSION:
+            print("Cache index %s has an unknown version, starting a new index." % self.indexPathFile)
+            return {}
+        return index.get('entries', {})
+
+    def _entryDir(self, key):
+        return os.path.join( self.cacheDir, key[:2], key )
+
+    def _entryFile(self, key, extension):
+        return os.path.join( self._entryDir(key), 'graph.' + extension )
+
+    def totalBytes(self):
+        return sum( entry['bytes'] for entry in self.entries.values() )
+
+    ############################################################
+    #
+    # Returns True if the entry 'key' holds a file for every one of 'extensions'.
+    #
+    def contains(self, key, extensions):
+        entry = self.entries.get(key)
+        if entry is None:
+            return False
+        for extension in extensions:
+            if extension not in entry['files'] or not os.path.isfile( self._entryFile(key, extension) ):
+                return False
+        return True
+
+    ############################################################
+    #
+    # On a cache hit, places the cached files of entry 'key' at
+    # destPathPrefix + '.' + extension (for each of 'extensions') and returns
+    # True. Returns False on a miss.
+    #
+    def fetch(self, key, extensions, destPathPrefix):
+        if not self.contains(key, extensions):
+            return False
+
+        for extension in extensions:
+            source = self._entryFile(key, extension)
+            dest = destPathPrefix + '.' + extension
+            if os.path.lexists(dest):
+                os.remove(dest)
+            if self.mode == 'link':
+                try:
+                    os.link(source, dest)
+                    continue
+                except OSError:
+                    pass    #e.g., a different file system; copy it instead
+            shutil.copyfile(source, dest)
+
+        self.entries[key]['lastUsed'] = time.time()
+        if self.debug: print(">> cache hit: %s" % key)
+        return True
+
+    ############################################################
+    #
+    # Copies the generated files into the cache, under entry 'key'.
+    # 'files' maps each file extension to the path of the generated file.
+    #
+    def store(self, key, params, files):
+        entryDir = self._entryDir(key)
+        if not os.path.isdir(entryDir):
+            os.makedirs(entryDir)
+
+        entry = self.entries.get(key, { 'params': params, 'files': {} })
+        for extension, pathFile in files.items():
+            cachedPathFile = self._entryFile(key, extension)
+            if os.path.lexists(cachedPathFile):
+                os.remove(cachedPathFile)   #(it may be linked to an output file, see fetch())
+            shutil.copyfile( pathFile, cachedPathFile )
+            entry['files'][extension] = os.path.getsize(pathFile)
+        entry['bytes'] = sum( entry['files'].values() )
+        entry['lastUsed'] = time.time()
+        self.entries[key] = entry
+        if self.debug: print(">> cached: %s" % key)
+
+    ############################################################
+    #
+    # Removes the least recently used entries until the cache fits in
+    # maxBytes. Returns the number of entries evicted.
+    #
+    def evict(self):
+        evicted = 0
+        total = self.totalBytes()
+        for key in sorted( self.entries, key=lambda k: self.entries[k]['lastUsed'] ):
+            if total <= self.maxBytes:
+                break
+            total -= self.entries[key]['bytes']
+            shutil.rmtree( self._entryDir(key), ignore_errors=True )
+            del self.entries[key]
+            evicted += 1
+        return evicted
+
+    ############################################################
+    #
+    # Writes the index (to a temporary file first, so an interrupted run
+    # never leaves a half-written index behind).
+    #
+    def save(self):
+        tempPathFile = self.indexPathFile + '.tmp'
+        with open(tempPathFile, 'w') as outFile:
+            json.dump( { 'version': INDEX_VERSION, 'entries': self.entries }, outFile, indent=1, sort_keys=True )
+        os.replace( tempPathFile, self.indexPathFile )
@@ -0,0 +1,557 @@
+import numpy as np
+import os
+import sys
+import io
+import gzip
+import lzma
+import struct
+import zlib
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Graph file format readers and writers, shared by the graph generator and
+the pathfinding scripts.
+
+The writers here work straight from an in-memory edge list, i.e. an (E x 2)
+NumPy array holding each undirected edge once, as (u, v) where u < v, sorted
+by u then v. They write the file in chunks, without building an intermediate
+Pandas DataFrame or NetworkX graph first.
+
+The GraphML and Pajek output matches what NetworkX writes for the same graph
+(nx.write_graphml() and nx.write_pajek() on nx.Graph(adjacency matrix)), so the
+files load the same way in Graph-Tool (gt.load_graph) and in NetworkX.
+
+The edge list CSV format (see writeEdgeListStream()) holds one 'u,v' line per
+edge, after a '# nodes: N' line.
+
+Any of the text files can be gzip or xz compressed (see openGraphFile()); the
+compression is told by the file name suffix ('.gz' or '.xz').
+
+The CSR (compressed sparse row) binary format holds the same graph as an
+int32 'offsets' array (numNodes + 1 entries) and an int32 'neighbors' array
+(both directions of every edge, sorted), after a small header:
+
+    magic 'GCSR' | version (uint16) | flags (uint16) | numNodes (int32) |
+    numEntries (int32) | CRC-32 of the two arrays (uint32)
+
+The neighbors of node i are neighbors[offsets[i]:offsets[i+1]]. The arrays
+are memory-mapped when loaded, so no parsing is needed.
+
+The adjacency matrix CSV writer serializes whole blocks of rows at once from
+a NumPy array, with one write() call per block, instead of building each line
+one cell at a time.
+
+The delta binary format stores a small-world graph as the differences from
+the k-regular ring lattice it was rewired from (see latticeEdges()): the
+lattice edges that were removed, and the edges that were added, as int32
+(u, v) pairs with u < v, sorted, after a small header:
+
+    magic 'GDLT' | version (uint16) | flags (uint16) | numNodes (int32) | k (int32) |
+    numRemoved (int32) | numAdded (int32) | CRC-32 of the two arrays (uint32)
+
+At low rewiring probabilities that is only a few edges per graph. k = 0 means
+no base lattice (every edge is an added edge).
+"""
+
+
+#file name suffixes of the supported compression types:
+COMPRESSION_SUFFIXES = { 'gzip': '.gz', 'xz': '.xz' }
+
+
+#number of nodes or edges formatted per write() call:
+CHUNK_SIZE = 8192
+
+
+############################################################
+#
+# Writes an edge list CSV file for an undirected graph with nodes 0..numNodes-1,
+# each edge once, e.g.:
+#
+#       # nodes: 1000
+#       source,target
+#       0,1
+#       0,2
+#       ...
+#
+# The first (comment) line holds the node count, so nodes without any links
+# are kept too. The file size is O(E), rather than the O(N*N) of an
+# adjacency matrix CSV file.
+#
+def writeEdgeListStream( outFile, numNodes, edges, chunkSize=CHUNK_SIZE ):
+
+    outFile.write('# nodes: %d\n' % numNodes)
+    outFile.write('source,target\n')
+    for start in range(0, len(edges), chunkSize):
+        chunk = edges[start:start + chunkSize].tolist()
+        outFile.write( ''.join( '%d,%d\n' % (u, v) for u, v in chunk ) )
+
+
+############################################################
+#
+# Reads an edge list CSV file (see writeEdgeListStream()), which may be gzip or
+# xz compressed. Returns (numNodes, edges), where edges is an (E x 2) NumPy array.
+#
+# Raises ValueError if the file doesn't start with the '# nodes: N' line.
+#
+def readEdgeList( pathFile ):
+    with openGraphFile( pathFile, 'r' ) as inFile:
+        header = inFile.readline()
+        if not header.startswith('# nodes:'):
+            raise ValueError("%s: not an edge list file (no '# nodes:' line)" % pathFile)
+        numNodes = int( header.split(':')[1] )
+        edges = np.loadtxt( inFile, dtype=np.int64, delimiter=',', skiprows=1, ndmin=2 )
+    return numNodes, edges.reshape(-1, 2)
+
+
+############################################################
+#
+# Returns the compression type ('gzip', 'xz', or None) of a file, from its name.
+#
+def getCompression( fileName ):
+    for compression, suffix in COMPRESSION_SUFFIXES.items():
+        if fileName.endswith(suffix):
+            return compression
+    return None
+
+
+############################################################
+#
+# Returns the file name without its compression suffix (if any), e.g.
+# 'graph_1.csv.gz' --> 'graph_1.csv'.
+#
+def stripCompressionSuffix( fileName ):
+    compression = getCompression( fileName )
+    if compression is None:
+        return fileName
+    return fileName[:-len(COMPRESSION_SUFFIXES[compression])]
+
+
+############################################################
+#
+# Opens a graph file for reading or writing, in 'mode' ('r', 'w', 'rb', 'wb',
+# ...). If 'compression' is 'gzip' or 'xz', the file is (de)compressed on the
+# fly, else it's a plain file. With compression=None, it's told from the
+# file name (see getCompression()).
+#
+# An existing file is removed before it's written, rather than truncated in
+# place: it may be a hard link into the generator's graph cache (see
+# graph_cache.py, 'link' mode), which writing through would corrupt.
+#
+def openGraphFile( pathFile, mode, compression=None ):
+    if 'r' not in mode and os.path.lexists( pathFile ):
+        os.remove( pathFile )
+    if compression is None:
+        compression = getCompression( pathFile )
+    if compression is None:
+        return open( pathFile, mode )
+
+    binaryMode = mode.replace('t', '').replace('b', '') + 'b'
+    if compression == 'gzip':
+        #mtime=0 keeps the compressed bytes the same from run to run:
+        stream = gzip.GzipFile( pathFile, binaryMode, compresslevel=6, mtime=0 )
+    else:
+        stream = lzma.open( pathFile, binaryMode )
+
+    if 'b' in mode:
+        return stream
+    return io.TextIOWrapper( stream, encoding='ascii' )
+
+
+############################################################
+#
+# Writes a GraphML file for an undirected graph with nodes 0..numNodes-1,
+# where every edge has an integer 'weight' of 1 (same as NetworkX does for
+# a graph loaded from an adjacency matrix).
+#
+# With 'coords' (a numNodes x 2 integer array, e.g. for grid maps), every node
+# also gets integer 'x' and 'y' attributes, again as NetworkX writes them.
+#
+def writeGraphmlStream( outFile, numNodes, edges, chunkSize=CHUNK_SIZE, coords=None ):
+
+    outFile.write("<?xml version='1.0' encoding='utf-8'?>\n")
+    outFile.write('<graphml xmlns="http://graphml.graphdrawing.org/xmlns" '
+        'xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" '
+        'xsi:schemaLocation="http://graphml.graphdrawing.org/xmlns '
+        'http://graphml.graphdrawing.org/xmlns/1.0/graphml.xsd">\n')
+    weightKey = 'd0'
+    if coords is not None:
+        weightKey = 'd2'
+        outFile.write('  <key id="d2" for="edge" attr.name="weight" attr.type="long" />\n')
+        outFile.write('  <key id="d1" for="node" attr.name="y" attr.type="long" />\n')
+        outFile.write('  <key id="d0" for="node" attr.name="x" attr.type="long" />\n')
+    else:
+        outFile.write('  <key id="d0" for="edge" attr.name="weight" attr.type="long" />\n')
+    outFile.write('  <graph edgedefault="undirected">\n')
+
+    nodeTemplate = '    <node id="%d" />\n'
+    if coords is not None:
+        nodeTemplate = '    <node id="%d">\n      <data key="d0">%d</data>\n      <data key="d1">%d</data>\n    </node>\n'
+    for start in range(0, numNodes, chunkSize):
+        stop = min(start + chunkSize, numNodes)
+        if coords is None:
+            outFile.write( ''.join( nodeTemplate % n for n in range(start, stop) ) )
+        else:
+            chunk = coords[start:stop].tolist()
+            outFile.write( ''.join( nodeTemplate % (n, x, y) for n, (x, y) in enumerate(chunk, start) ) )
+
+    edgeTemplate = '    <edge source="%d" target="%d">\n      <data key="' + weightKey + '">1</data>\n    </edge>\n'
+    for start in range(0, len(edges), chunkSize):
+        chunk = edges[start:start + chunkSize].tolist()
+        outFile.write( ''.join( edgeTemplate % (u, v) for u, v in chunk ) )
+
+    outFile.write('  </graph>\n')
+    outFile.write('</graphml>\n')
+
+
+############################################################
+#
+# Writes a Pajek file for an undirected graph with nodes 0..numNodes-1.
+# Pajek numbers the vertices from 1, and labels them with the node index.
+# With 'coords' (see writeGraphmlStream()), the vertices get those x, y positions.
+#
+def writePajekStream( outFile, numNodes, edges, chunkSize=CHUNK_SIZE, coords=None ):
+
+    outFile.write('*vertices %d\n' % numNodes)
+    for start in range(0, numNodes, chunkSize):
+        stop = min(start + chunkSize, numNodes)
+        if coords is None:
+            outFile.write( ''.join( '%d %d 0.0 0.0 ellipse\n' % (n + 1, n) for n in range(start, stop) ) )
+        else:
+            chunk = coords[start:stop].tolist()
+            outFile.write( ''.join( '%d %d %d %d ellipse\n' % (n + 1, n, x, y) for n, (x, y) in enumerate(chunk, start) ) )
+
+    outFile.write('*edges\n')
+    for start in range(0, len(edges), chunkSize):
+        chunk = edges[start:start + chunkSize].tolist()
+        outFile.write( ''.join( '%d %d 1\n' % (u + 1, v + 1) for u, v in chunk ) )
+
+
+#target size (in bytes) of the text produced per adjacency CSV write() call:
+CSV_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+############################################################
+#
+# Returns how many adjacency CSV rows of 'width' cells fit in one chunk.
+#
+def rowsPerChunk( width ):
+    return max( 1, CSV_CHUNK_BYTES // max(1, 2 * width) )
+
+
+############################################################
+#
+# Yields the rows of a dense (list-of-lists or NumPy) matrix, in blocks of
+# consecutive rows, as 2D NumPy arrays.
+#
+# Like the original writeCsvFile(), output row y holds the cells matrix[x][y]
+# for x = 0..maxWidth-1 (i.e., the rows are the columns of 'matrix').
+#
+def denseRowBlocks( matrix, maxWidth, maxHeight, chunkRows=None ):
+    dense = np.asarray(matrix)[:maxWidth, :maxHeight].T
+    if chunkRows is None: chunkRows = rowsPerChunk(maxWidth)
+    for start in range(0, maxHeight, chunkRows):
+        yield dense[start:start + chunkRows]
+
+
+############################################################
+#
+# Yields the rows of the numNodes x numNodes adjacency matrix of an undirected
+# graph, given its (E x 2) edge array, in blocks of consecutive rows, as
+# 2D uint8 NumPy arrays. Only one block is ever held in memory.
+#
+def edgeRowBlocks( numNodes, edges, chunkRows=None ):
+    edges = np.asarray(edges).reshape(-1, 2)
+
+    #both directions of each edge, sorted by the row they land in:
+    rows = np.concatenate( (edges[:, 0], edges[:, 1]) )
+    cols = np.concatenate( (edges[:, 1], edges[:, 0]) )
+    order = np.argsort(rows, kind='stable')
+    rows, cols = rows[order], cols[order]
+
+    if chunkRows is None: chunkRows = rowsPerChunk(numNodes)
+    for start in range(0, numNodes, chunkRows):
+        stop = min(start + chunkRows, numNodes)
+        lo, hi = np.searchsorted(rows, [start, stop])
+        block = np.zeros( (stop - start, numNodes), dtype=np.uint8 )
+        block[ rows[lo:hi] - start, cols[lo:hi] ] = 1
+        yield block
+
+
+############################################################
+#
+# Writes adjacency matrix rows as CSV text, e.g.:
+#
+#       0,1,1
+#       1,0,0
+#       1,0,0
+#
+# 'rowBlocks' yields 2D arrays of consecutive rows (see denseRowBlocks() and
+# edgeRowBlocks()). 'outFile' must be opened in binary mode ('wb').
+#
+# Each block is serialized as a whole and written with a single write() call.
+# When the cells are all single digits (e.g., 0 or 1) and the delimiter is a
+# single character, the text is laid out directly in a byte array: digit,
+# delimiter, digit, ..., newline. Otherwise each row is joined as strings.
+#
+def writeAdjacencyCsv( outFile, rowBlocks, delimiter=',' ):
+
+    for block in rowBlocks:
+        block = np.asarray(block)
+        if block.size == 0:
+            continue
+        numRows, numCols = block.shape
+
+        if (len(delimiter) == 1 and block.dtype.kind in 'biu'
+                and block.min() >= 0 and block.max() <= 9):
+            text = np.empty( (numRows, 2 * numCols), dtype=np.uint8 )
+            text[:, 0::2] = block + ord('0')
+            text[:, 1::2] = ord(delimiter)
+            text[:, -1] = ord('\n')
+            outFile.write( text.tobytes() )
+        else:
+            lines = [ delimiter.join( str(cell) for cell in row ) for row in block.tolist() ]
+            outFile.write( ('\n'.join(lines) + '\n').encode('ascii') )
+
+
+CSR_MAGIC = b'GCSR'
+CSR_VERSION = 1
+CSR_HEADER = struct.Struct('<4sHHiiI')
+
+
+############################################################
+#
+# Returns the CSR (offsets, neighbors) int32 arrays of an undirected graph with
+# nodes 0..numNodes-1, given its (E x 2) edge array. Every edge is stored in
+# both directions, and each node's neighbors are sorted.
+#
+def edgesToCsr( numNodes, edges ):
+    edges = np.asarray(edges).reshape(-1, 2)
+    rows = np.concatenate( (edges[:, 0], edges[:, 1]) )
+    cols = np.concatenate( (edges[:, 1], edges[:, 0]) )
+    order = np.lexsort( (cols, rows) )
+
+    offsets = np.zeros( numNodes + 1, dtype=np.int32 )
+    np.cumsum( np.bincount(rows, minlength=numNodes), out=offsets[1:] )
+    return offsets, cols[order].astype(np.int32)
+
+
+############################################################
+#
+# Returns the (E x 2) edge array (each edge once, as (u, v) where u < v,
+# sorted) of an undirected graph given as a dense adjacency matrix (e.g., the
+# values of an adjacency matrix CSV file read into Pandas). A link in either
+# direction counts as an edge; the main diagonal (loops) is ignored.
+#
+def denseToEdges( matrix ):
+    links = ( np.asarray(matrix) != 0 )
+    us, vs = np.nonzero( np.triu( links | links.T, k=1 ) )
+    return np.column_stack( (us, vs) )
+
+
+############################################################
+#
+# Returns the (E x 2) edge array (each edge once, as (u, v) where u < v,
+# sorted) held by the CSR arrays.
+#
+def csrToEdges( offsets, neighbors ):
+    numNodes = len(offsets) - 1
+    rows = np.repeat( np.arange(numNodes, dtype=np.int32), np.diff(offsets) )
+    upper = rows < neighbors
+    return np.column_stack( (rows[upper], neighbors[upper]) )
+
+
+############################################################
+#
+# Writes a CSR binary graph file. 'outFile' must be opened in binary mode ('wb').
+#
+def writeCsr( outFile, offsets, neighbors ):
+    offsets = np.ascontiguousarray(offsets, dtype='<i4')
+    neighbors = np.ascontiguousarray(neighbors, dtype='<i4')
+    checksum = zlib.crc32( neighbors, zlib.crc32(offsets) )
+
+    outFile.write( CSR_HEADER.pack(CSR_MAGIC, CSR_VERSION, 0, len(offsets) - 1, len(neighbors), checksum) )
+    outFile.write( offsets.tobytes() )
+    outFile.write( neighbors.tobytes() )
+
+
+############################################################
+#
+# Memory-maps a CSR binary graph file, and returns its (offsets, neighbors)
+# arrays. These are read-only views onto the file, i.e. nothing is copied.
+#
+# Raises ValueError if the file isn't a CSR graph file, is truncated, or (when
+# 'verify' is set) fails its checksum.
+#
+def loadCsr( fileName, verify=True ):
+    with open(fileName, 'rb') as inFile:
+        header = inFile.read( CSR_HEADER.size )
+    if len(header) < CSR_HEADER.size:
+        raise ValueError("%s: not a CSR graph file (too short)" % fileName)
+
+    magic, version, flags, numNodes, numEntries, checksum = CSR_HEADER.unpack(header)
+    if magic != CSR_MAGIC:
+        raise ValueError("%s: not a CSR graph file (bad magic number)" % fileName)
+    if version != CSR_VERSION:
+        raise ValueError("%s: unsupported CSR version %d" % (fileName, version))
+
+    expectedSize = CSR_HEADER.size + 4 * (numNodes + 1 + numEntries)
+    if os.path.getsize(fileName) != expectedSize:
+        raise ValueError("%s: truncated CSR graph file" % fileName)
+
+    data = np.memmap( fileName, dtype='<i4', mode='r', offset=CSR_HEADER.size )
+    offsets = data[:numNodes + 1]
+    neighbors = data[numNodes + 1:]
+
+    if verify and zlib.crc32( neighbors, zlib.crc32(offsets) ) != checksum:
+        raise ValueError("%s: CSR checksum mismatch" % fileName)
+
+    return offsets, neighbors
+
+
+DELTA_MAGIC = b'GDLT'
+DELTA_VERSION = 1
+DELTA_HEADER = struct.Struct('<4sHHiiiiI')
+
+
+############################################################
+#
+# Returns the (E x 2) edge array (each edge once, as (u, v) where u < v,
+# sorted) of the k-regular ring lattice with nodes 0..numNodes-1, where each
+# node links to the k nearest nodes on either side around the ring (the graph
+# the generator's createRegularMatrix() makes).
+#
+def latticeEdges( numNodes, k ):
+    if k < 1 or numNodes < 2:
+        return np.empty( (0, 2), dtype=np.int64 )
+    us = np.tile( np.arange(numNodes, dtype=np.int64), k )
+    vs = ( us + np.repeat( np.arange(1, k + 1, dtype=np.int64), numNodes ) ) % numNodes
+    keep = (us != vs)
+    codes = np.unique( np.minimum(us, vs)[keep] * numNodes + np.maximum(us, vs)[keep] )
+    return np.column_stack( (codes // numNodes, codes % numNodes) )
+
+
+############################################################
+#
+# Internal helpers: edge arrays <--> sorted unique codes u * numNodes + v.
+#
+def _edgeCodes( numNodes, edges ):
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    return np.unique( edges[:, 0] * numNodes + edges[:, 1] )
+
+
+def _codeEdges( numNodes, codes ):
+    return np.column_stack( (codes // numNodes, codes % numNodes) )
+
+
+############################################################
+#
+# Returns the (removed, added) edge arrays that turn the k-regular ring lattice
+# into the graph with the given (E x 2) edge array (each edge once, u < v).
+#
+def edgesToDelta( numNodes, k, edges ):
+    base = _edgeCodes( numNodes, latticeEdges(numNodes, k) )
+    codes = _edgeCodes( numNodes, edges )
+    removed = np.setdiff1d( base, codes, assume_unique=True )
+    added = np.setdiff1d( codes, base, assume_unique=True )
+    return _codeEdges( numNodes, removed ), _codeEdges( numNodes, added )
+
+
+############################################################
+#
+# Returns the (E x 2) edge array (each edge once, as (u, v) where u < v,
+# sorted) of the graph given as its differences from the k-regular ring lattice.
+#
+def deltaToEdges( numNodes, k, removed, added ):
+    base = _edgeCodes( numNodes, latticeEdges(numNodes, k) )
+    codes = np.setdiff1d( base, _edgeCodes(numNodes, removed), assume_unique=True )
+    codes = np.union1d( codes, _edgeCodes(numNodes, added) )
+    return _codeEdges( numNodes, codes )
+
+
+############################################################
+#
+# Writes a delta binary graph file. 'outFile' must be opened in binary mode ('wb').
+#
+def writeDelta( outFile, numNodes, k, removed, added ):
+    removed = np.ascontiguousarray( np.asarray(removed).reshape(-1, 2), dtype='<i4' )
+    added = np.ascontiguousarray( np.asarray(added).reshape(-1, 2), dtype='<i4' )
+    checksum = zlib.crc32( added, zlib.crc32(removed) )
+
+    outFile.write( DELTA_HEADER.pack(DELTA_MAGIC, DELTA_VERSION, 0, numNodes, k, len(removed), len(added), checksum) )
+    outFile.write( removed.tobytes() )
+    outFile.write( added.tobytes() )
+
+
+############################################################
+#
+# Reads a delta binary graph file, and returns (numNodes, k, removed, added).
+#
+# Raises ValueError if the file isn't a delta graph file, is truncated, or (when
+# 'verify' is set) fails its checksum.
+#
+def loadDelta( fileName, verify=True ):
+    with open(fileName, 'rb') as inFile:
+        data = inFile.read()
+    if len(data) < DELTA_HEADER.size:
+        raise ValueError("%s: not a delta graph file (too short)" % fileName)
+
+    magic, version, flags, numNodes, k, numRemoved, numAdded, checksum = DELTA_HEADER.unpack_from(data)
+    if magic != DELTA_MAGIC:
+        raise ValueError("%s: not a delta graph file (bad magic number)" % fileName)
+    if version != DELTA_VERSION:
+        raise ValueError("%s: unsupported delta version %d" % (fileName, version))
+    if len(data) != DELTA_HEADER.size + 8 * (numRemoved + numAdded):
+        raise ValueError("%s: truncated delta graph file" % fileName)
+
+    pairs = np.frombuffer( data, dtype='<i4', offset=DELTA_HEADER.size ).reshape(-1, 2)
+    removed, added = pairs[:numRemoved], pairs[numRemoved:]
+
+    if verify and zlib.crc32( added, zlib.crc32(removed) ) != checksum:
+        raise ValueError("%s: delta checksum mismatch" % fileName)
+
+    return numNodes, k, removed, added
+
+
+############################################################
+#
+# Loads a delta binary graph file, and returns (numNodes, edge array), e.g.
+# for NetworkX's add_edges_from() or Graph-Tool's add_edge_list().
+#
+def loadDeltaEdges( fileName, verify=True ):
+    numNodes, k, removed, added = loadDelta( fileName, verify )
+    return numNodes, deltaToEdges( numNodes, k, removed, added )
+
+
+############################################################
+#
+# Loads a delta binary graph file, and returns its CSR (offsets, neighbors) arrays.
+#
+def loadDeltaCsr( fileName, verify=True ):
+    numNodes, edges = loadDeltaEdges( fileName, verify )
+    return edgesToCsr( numNodes, edges )
+
+
+############################################################
+#
+# Command line helpers, shared by the graph generator, the pathfinding and
+# results parser scripts, etc.
+#
+# Returns the value following the optional command line flag 'name' (e.g.,
+# the 'csr' in '--format csr'), or 'default' if the flag wasn't given.
+# Optional flags go after all of the positional parameters.
+#
+def getOption( name, default=None ):
+    if name in sys.argv:
+        index = sys.argv.index(name)
+        if index + 1 < len(sys.argv):
+            return sys.argv[index + 1]
+    return default
+
+
+def isNotEmpty(s):
+    return bool(s and s.strip())
@@ -2,10 +2,17 @@ import random
 import math
 import pandas as pd
 import networkx as nx
-import pylab
-from pylab import rcParams
+import numpy as np
 import sys
 import os
+import functools
+import multiprocessing
+import collections
+import concurrent.futures
+
+import graph_formats
+import graph_cache
+import graph_metadata
 
 
 # Created: 12-17-2016
@@ -19,16 +26,29 @@ two-dimensional adjacency matrices.
 The graphs start as circular grids before the small-world rewiring is applied to them.
 This program creates adjacency matrix files, and corresponding Pajek and GraphML 
 format text files.
-It uses NetworkX to do the file transformations (adjacency matrix --> Pajek or GraphML).
+The Pajek and GraphML files are written straight from the in-memory graph (see
+graph_formats.py), in the same format that NetworkX writes them. The older
+writeGraphFile() still does the CSV --> NetworkX --> Pajek or GraphML transformation.
+With export type 'csr' (e.g., 'graphml,csr'), a compact CSR binary file is also
+written, which both pathfinding scripts can memory-map and load (option '--format csr').
+With export type 'edges', an edge list CSV file is written, which the NetworkX
+pathfinding script can load (option '--format edges').
+With export type 'delta', only the differences from the ring lattice are written
+(a few edges per graph at low p), which both pathfinding scripts can load
+(option '--format delta').
+Each graph also gets a small JSON metadata file (see graph_metadata.py), with its
+size, connectivity, and true start to destination distance.
+Besides the small-world graphs, option '--topology' gives Erdos-Renyi random,
+Barabasi-Albert scale-free, and 2-D grid map graphs (the latter with node coordinates).
+All of a graph's files are written from one in-memory snapshot of it, on a small
+pool of writer threads (option '--writers'), while the next graph is generated.
 GraphTool matrices are stored in GraphML text format (i.e., not raw adjacency matrices).
 NetworkX matrices are stored in CSV text format as adjacency matrices.
 
 Initialize and create a small-world matrix.
 Then print the entire matrix.
 Then save the matrix to CSV file format.
-Then read the CSV file with Pandas library.
-Then create a NetworkX graph based on the CSV file input.
-Save the map in Pajek or GraphML format.
+Then save the same map in Pajek or GraphML format.
 
 So during each iteration of the main loop, two maps are created that are identical 
 (in terms of network connectivity), the only difference is that one is stored as a CSV 
@@ -36,6 +56,14 @@ text file containing a raw adjacency matrix for use by NetworkX.
 The other graph is stored in GraphML text format (i.e., not a raw adjacency matrix) for 
 use by Graph-Tool. 
 
+Internally, each graph is held as a SparseGraph (one set of neighbors per node)
+rather than a dense list-of-lists matrix, so generation time and memory scale with
+the number of edges (N*k) instead of the number of matrix cells (N*N).
+With option '--matrix bits', it is held as a BitMatrix instead: a dense matrix of
+one bit per cell (N*N/8 bytes), which writes the adjacency matrix CSV file straight
+from its rows. The dense
+matrix functions still accept plain list-of-lists matrices, and NumPy 2D arrays.
+
 May drop Pajek support later, since Graph-Tool doesn't support it.
 The goal is for these graph files to be read by NetworkX and Graph-Tool, and for
 subsequent pathfinding operations to be performed on these files, as appropriate,
@@ -54,29 +82,196 @@ http://stackoverflow.com/questions/29572623/plot-networkx-graph-from-adjacency-m
 
 """
 
+
+#largest graph size allowed when no adjacency matrix CSV file is written (see '--csv off'):
+MAX_SPARSE_SIZE = 200000
+
+#largest graph size allowed with a bit-packed matrix (see '--matrix bits'), 50 MB per graph:
+MAX_BIT_MATRIX_SIZE = 20000
+
+#descriptions of the file formats, as printed in the 'Wrote network graph ...' messages:
+EXPORT_FORMAT_NAMES = { 'csv': 'CSV', 'graphml': 'GraphML', 'pajek': 'Pajek',
+                        'edges': 'edge list CSV', 'csr': 'CSR binary', 'delta': 'delta binary',
+                        'meta': 'JSON metadata' }
+
+
 ############################################################
-def isNotEmpty(s):
-    return bool(s and s.strip())
-    
+#
+# Sparse (adjacency-set) graph used by the generator core.
+#
+# A dense maxWidth x maxHeight matrix holds N*N cells, but a k-regular ring
+# lattice only holds N*k undirected edges. This class keeps one set of
+# neighbor node indexes per node instead, so building, rewiring and walking
+# the graph cost O(N*k) time and memory, rather than O(N*N).
+#
+# The graph is undirected and never holds self-loops, so hasEdge(x, y) is
+# always the same as hasEdge(y, x) (i.e., the matrix is symmetric).
+#
+class SparseGraph(object):
+
+    def __init__(self, size):
+        self.size = int(size)
+        self.adj = [ set() for i in range(self.size) ]
+        self.coords = None  #optional (size x 2) array of node x, y positions (e.g., grid maps)
+        self.lattice = None #k of the ring lattice the graph was built from (see createRegularMatrix())
+
+    def hasEdge(self, x, y):
+        return y in self.adj[x]
+
+    def addEdge(self, x, y):
+        if x == y: return   #don't create self-loops
+        self.adj[x].add(y)
+        self.adj[y].add(x)
+
+    def addEdges(self, edges):
+        #adds every (x, y) row of an (E x 2) array; repeated edges and self-loops are dropped:
+        for x, y in np.asarray(edges).reshape(-1, 2).tolist():
+            self.addEdge(x, y)
+
+    def removeEdge(self, x, y):
+        self.adj[x].discard(y)
+        self.adj[y].discard(x)
+
+    def neighbors(self, x):
+        return self.adj[x]
+
+    def numEdges(self):
+        return sum( len(s) for s in self.adj ) // 2
+
+    def edges(self):
+        #each undirected edge once, as (x, y) where x < y, in sorted order:
+        for x in range(self.size):
+            for y in sorted(self.adj[x]):
+                if x < y:
+                    yield (x, y)
+
+    def edgeArray(self):
+        #same as edges(), as an (E x 2) NumPy array:
+        edges = np.array( list(self.edges()), dtype=np.int64 )
+        return edges.reshape(-1, 2)
+
+
+############################################################
+#
+# Bit-packed, dense adjacency matrix: one bit per cell, each row packed 8
+# cells to a byte (NumPy packbits layout, big-endian bit order), so an N x N
+# matrix takes N*N/8 bytes (0.5 MB at 2000 x 2000, 50 MB at 20000 x 20000),
+# rather than a Python object reference per cell.
+#
+# It has the same methods as SparseGraph (links are always symmetric), so
+# the generator can build, rewire and write either one, and the output is the
+# same. Whole rows (and blocks of rows) are unpacked with NumPy at once.
+#
+class BitMatrix(object):
+
+    #number of set bits in each byte value:
+    POPCOUNT = np.array( [ bin(i).count('1') for i in range(256) ], dtype=np.int64 )
+
+    def __init__(self, size):
+        self.size = int(size)
+        self.bits = np.zeros( (self.size, (self.size + 7) // 8), dtype=np.uint8 )
+        self.coords = None  #optional (size x 2) array of node x, y positions (e.g., grid maps)
+        self.lattice = None #k of the ring lattice the graph was built from (see createRegularMatrix())
+
+    @staticmethod
+    def _masks(ys):
+        return ( 0x80 >> (np.asarray(ys) & 7) ).astype(np.uint8)
+
+    def hasEdge(self, x, y):
+        return bool( self.bits[x, y >> 3] & (0x80 >> (y & 7)) )
+
+    def addEdge(self, x, y):
+        if x == y: return   #don't create self-loops
+        self.bits[x, y >> 3] |= 0x80 >> (y & 7)
+        self.bits[y, x >> 3] |= 0x80 >> (x & 7)
+
+    def addEdges(self, edges):
+        #sets both (x, y) and (y, x) for every row of an (E x 2) array, in one go:
+        edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+        edges = edges[ edges[:, 0] != edges[:, 1] ]
+        xs = np.concatenate( (edges[:, 0], edges[:, 1]) )
+        ys = np.concatenate( (edges[:, 1], edges[:, 0]) )
+        np.bitwise_or.at( self.bits, (xs, ys >> 3), self._masks(ys) )
+
+    def removeEdge(self, x, y):
+        self.bits[x, y >> 3] &= 0xFF ^ (0x80 >> (y & 7))
+        self.bits[y, x >> 3] &= 0xFF ^ (0x80 >> (x & 7))
+
+    def clearDiagonal(self):
+        xs = np.arange( self.size )
+        self.bits[xs, xs >> 3] &= ~self._masks(xs)
+
+    def row(self, x):
+        return np.unpackbits( self.bits[x], count=self.size )
+
+    def neighbors(self, x):
+        return np.flatnonzero( self.row(x) )
+
+    def rowBlocks(self, chunkRows=None):
+        #yields the unpacked rows, in blocks of consecutive rows (2D uint8 arrays):
+        if chunkRows is None: chunkRows = graph_formats.rowsPerChunk( self.size )
+        for start in range(0, self.size, chunkRows):
+            yield np.unpackbits( self.bits[start:start + chunkRows], axis=1, count=self.size )
+
+    def numEdges(self):
+        return int( self.POPCOUNT[self.bits].sum() ) // 2
+
+    def edges(self):
+        return iter( map(tuple, self.edgeArray().tolist()) )
+
+    def edgeArray(self):
+        #each undirected edge once, as (x, y) where x < y, in sorted order:
+        blocks = [ np.empty( (0, 2), dtype=np.int64 ) ]
+        start = 0
+        for block in self.rowBlocks():
+            xs, ys = np.nonzero( block )
+            xs = xs + start
+            upper = ys > xs
+            blocks.append( np.column_stack( (xs[upper], ys[upper]) ).astype(np.int64) )
+            start += len(block)
+        return np.concatenate( blocks )
+
+
+#the graph classes (as opposed to plain list-of-lists or NumPy matrices):
+GRAPH_TYPES = (SparseGraph, BitMatrix)
+
+#the in-memory graph types of option '--matrix':
+MATRIX_TYPES = { 'sparse': SparseGraph, 'bits': BitMatrix }
+
+
 ############################################################
 def printMatrix( maxWidth, maxHeight, matrix ):
     x,y = 0, 0
     for y in range(maxHeight):
         for x in range(maxWidth):
-            print matrix[x][y],     #the ',' keeps printing on same line
-        print   #now print new line to wrap the row.
+            if isinstance(matrix, GRAPH_TYPES):
+                sys.stdout.write("%d " % int(matrix.hasEdge(x, y)) )
+            else:
+                sys.stdout.write("%s " % matrix[x][y] )  #keep printing on same line
+        sys.stdout.write("\n")   #now print new line to wrap the row.
 
 
 ############################################################
 def removeLoops( maxWidth, maxHeight, matrix ):
+    if isinstance(matrix, BitMatrix):
+        matrix.clearDiagonal()
+        return
+    if isinstance(matrix, SparseGraph):
+        #only the node's own set can hold a loop:
+        for x in range(matrix.size):
+            matrix.adj[x].discard(x)
+        return
+
     #Set the values of the main diagonal to zero to remove loops.
     newValue = 0
-    x,y = 0, 0
-    for y in range(maxHeight):
-        for x in range(maxWidth):
-            if x == y:
-                matrix[x][y] = newValue
-                #print "Setting cell [%d][%d] to %d" % (x, y, newValue)
+    if isinstance(matrix, np.ndarray):
+        np.fill_diagonal(matrix, newValue)
+        return
+
+    #only the cells where x == y are on the main diagonal:
+    for x in range( min(maxWidth, maxHeight) ):
+        matrix[x][x] = newValue
+        #print "Setting cell [%d][%d] to %d" % (x, x, newValue)
     #print("Removed the self-loops (i.e., main diagonal cleared).")
 
 
@@ -130,27 +325,45 @@ def checkFilePath( fileName, path, debug=False):
         return False
 
 
+############################################################
+#
+# Returns the file name suffix for compression type 'gzip' or 'xz', or '' for
+# no compression (None).
+#
+def compressionSuffix( compression ):
+    if compression is None:
+        return ''
+    return graph_formats.COMPRESSION_SUFFIXES[compression]
+
+
 ############################################################
 #def writeCsvFile( fileName, path, delimiter, maxWidth, maxHeight, matrix, debug=False ):
-def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHeight, matrix, debug=False ):
+#
+# With compression 'gzip' or 'xz', the file is written compressed, and its name
+# gets a '.gz' or '.xz' suffix (e.g., 'graph_1.csv.gz').
+#
+# The matrix can also be given as a (number of nodes, edge array) pair, as
+# returned by getEdgeArray().
+#
+def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHeight, matrix, debug=False, compression=None ):
 
-    csvFileName = fileNamePrefix + '.' + csvExtention
+    csvFileName = fileNamePrefix + '.' + csvExtention + compressionSuffix( compression )
     
     finalPathFileName = createFilePath( csvFileName, path, debug)
 
-    file = open(finalPathFileName, 'w')
-    file.truncate() #delete existing file contents (if any)
-    x,y = 0, 0
-    delim = delimiter
-    for y in range(maxHeight):
-        line = ""
-        for x in range(maxWidth):
-            line += str(matrix[x][y])
-            if (x < maxWidth-1):
-                line = line + delim
-            if (x >= maxWidth-1):
-                file.write(line + "\n")
-    file.close()
+    if isinstance(matrix, BitMatrix):
+        rowBlocks = matrix.rowBlocks( graph_formats.rowsPerChunk(maxWidth) )
+    elif isinstance(matrix, SparseGraph):
+        #only the connected cells need setting, the rest of each row stays 0:
+        rowBlocks = graph_formats.edgeRowBlocks( maxWidth, matrix.edgeArray() )
+    elif isinstance(matrix, tuple):
+        rowBlocks = graph_formats.edgeRowBlocks( maxWidth, matrix[1] )
+    else:
+        rowBlocks = graph_formats.denseRowBlocks( matrix, maxWidth, maxHeight )
+
+    #serialize whole blocks of rows at a time (see graph_formats.py):
+    with graph_formats.openGraphFile(finalPathFileName, 'wb', compression) as file:
+        graph_formats.writeAdjacencyCsv( file, rowBlocks, delimiter )
     return finalPathFileName #return output filename
 
 
@@ -165,17 +378,42 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
 # This method doesn't change the main diagonal cells, to 
 # prevent generation of self-loops.
 #
-def createSmallWorldMatrix( prob, maxWidth, maxHeight, matrix, debug=False ):
+# There are two rewiring modes:
+#
+#   legacy=False (the default): each undirected edge gets exactly one chance
+#       (probability 'prob') of being rewired. One Bernoulli mask is drawn
+#       over the whole edge list, and the new endpoints are drawn in bulk,
+#       so the cost is proportional to the number of edges.
+#
+#   legacy=True: the original cell-by-cell walk. Since both the (x,y) and the
+#       (y,x) cells of an edge are visited, each edge gets two chances of
+#       being rewired (i.e., roughly double the probability 'prob').
+#
+# The random numbers come from the NumPy Generator 'rng' (a new, randomly
+# seeded one is created if none is given).
+#
+# Returns the number of edges that were rewired.
+#
+def createSmallWorldMatrix( prob, maxWidth, maxHeight, matrix, debug=False, legacy=False, rng=None ):
     # check boundaries:
     if prob < 0.0:  prob = 0.0      #a 0-percent chance of rewiring
     if prob > 1.0:  prob = 1.0      #a 100-percent chance of rewiring
+
+    if rng is None: rng = np.random.default_rng()
+
+    if not legacy:
+        return _smallWorldEdgeListCalc( prob, maxHeight, matrix, rng, debug )
+
+    if isinstance(matrix, GRAPH_TYPES):
+        return _smallWorldSparseCalc( prob, matrix, rng, debug )
     
+    rewired = 0
     x,y = 0, 0
     for y in range(maxHeight):
         for x in range(maxWidth):
             #Ignore the main diagonal (where x = y), don't create self-loops:
             if x != y: 
-                rand = random.random()
+                rand = rng.random()
                 if (rand <= prob) and matrix[x][y] != 0:
                 
                     #time to rewire...
@@ -191,16 +429,14 @@ def createSmallWorldMatrix( prob, maxWidth, maxHeight, matrix, debug=False ):
                     
                     #2. find new random connection for (x,y) and (y,x), and ensure
                     # that we don't reconnect to the already existing links. 
-                    newY = y
-                    done = False
-                    while done != True:
-                        newY = random.randint(0, maxHeight-1)
-                        
-                        #Don't create edges to already existing edges, and don't
-                        # create self-loops:
-                        if y != newY and x != newY and matrix[x][newY] != 1 \
-                            and matrix[newY][x] != 1:
-                            done = True
+                    #Don't create edges to already existing edges, and don't
+                    # create self-loops:
+                    newY = sampleNonNeighbor( matrix, x, maxHeight, rng, y )
+                    if newY is None:
+                        #x is already linked to every other node, put the link back:
+                        matrix[x][y] = 1
+                        matrix[y][x] = 1
+                        continue
                     
                     if debug==True:
                         print (">> original x,y = [%d][%d], and y,x = [%d][%d]" % (x,y,y,x) )
@@ -210,6 +446,223 @@ def createSmallWorldMatrix( prob, maxWidth, maxHeight, matrix, debug=False ):
                     # Now set new matrix cells to connected:
                     matrix[x][newY] = 1
                     matrix[newY][x] = 1
+                    rewired += 1
+
+    return rewired
+
+
+############################################################
+#
+# This internal method does the legacy small-world rewiring on a SparseGraph
+# (or a BitMatrix).
+# It should only be called by the method createSmallWorldMatrix().
+#
+# It visits the connected cells in the same (row by row, then column by
+# column) order as the dense version, and gives each of them the same
+# chance of being rewired. The unconnected cells are skipped, since the
+# dense version never does anything with them but roll the dice.
+#
+# During the scan of row y, the only cell of row y that changes is the one
+# being visited (rewiring (x,y) touches rows x and newY, never y), so a
+# sorted snapshot of the row's neighbors gives the dense visiting order.
+#
+def _smallWorldSparseCalc( prob, matrix, rng, debug=False ):
+
+    rewired = 0
+    size = matrix.size
+    for y in range(size):
+        for x in sorted(matrix.neighbors(y)):
+            rand = rng.random()
+            if rand <= prob:
+
+                #time to rewire...
+                if debug==True:
+                    print ("Rand = %f, Prob = %f. [x,y]: [%d,%d] = 1" % (rand, prob, x, y) )
+
+                #1. disconnect the 2-way (x,y) and (y,x) connections:
+                matrix.removeEdge(x, y)
+
+                #2. find new random connection for x, and ensure that we don't
+                # reconnect to the already existing links, nor create self-loops:
+                newY = sampleNonNeighbor( matrix, x, size, rng, y )
+                if newY is None:
+                    matrix.addEdge(x, y)    #nowhere else to go, put the link back.
+                    continue
+
+                if debug==True:
+                    print (">> original x,y = [%d][%d], new [x]-->[y] = [%d][%d]" % (x, y, x, newY) )
+
+                matrix.addEdge(x, newY)
+                rewired += 1
+
+    return rewired
+
+
+############################################################
+#
+# This internal method does the (default) edge list small-world rewiring.
+# It should only be called by the method createSmallWorldMatrix().
+#
+# Works on a SparseGraph, a BitMatrix, a NumPy 2D array, or a list-of-lists matrix:
+#  1. Get the list of existing (undirected) edges, each one listed once.
+#  2. Draw one Bernoulli(prob) mask over that list to pick the edges to rewire.
+#  3. For each picked edge, pick (at random) which endpoint x stays put, and
+#     draw all the candidate new endpoints newY in one go.
+#  4. Apply the rewirings in order. A candidate that would create a self-loop,
+#     go back to the old endpoint, or duplicate an existing edge, is redrawn
+#     with sampleNonNeighbor().
+#
+def _smallWorldEdgeListCalc( prob, size, matrix, rng, debug=False ):
+
+    if isinstance(matrix, GRAPH_TYPES):
+        edges = matrix.edgeArray()
+    else:
+        edges = np.argwhere( np.triu( np.asarray(matrix), 1 ) != 0 )
+
+    picked = edges[ rng.random( len(edges) ) < prob ]
+    flip = rng.random( len(picked) ) < 0.5
+    xs = np.where( flip, picked[:, 1], picked[:, 0] )
+    ys = np.where( flip, picked[:, 0], picked[:, 1] )
+    newYs = rng.integers( 0, size, size=len(picked) )
+
+    return _applyRewirings( xs, ys, newYs, size, matrix, rng, debug )
+
+
+############################################################
+#
+# This internal method applies a batch of rewirings, in order: for each i,
+# the link (xs[i], ys[i]) is moved to (xs[i], newYs[i]). Returns the number
+# of links actually moved.
+#
+# A candidate newY that would create a self-loop, go back to the old endpoint,
+# or duplicate an existing edge, is redrawn with sampleNonNeighbor().
+#
+def _applyRewirings( xs, ys, newYs, size, matrix, rng, debug=False ):
+
+    rewired = 0
+    for x, y, newY in zip( xs.tolist(), ys.tolist(), newYs.tolist() ):
+
+        #1. disconnect the 2-way (x,y) and (y,x) connections:
+        _setLink( matrix, x, y, 0 )
+
+        #2. make sure the new connection is valid, else redraw it:
+        if newY == y or newY == x or _hasLink( matrix, x, newY ):
+            newY = sampleNonNeighbor( matrix, x, size, rng, y )
+            if newY is None:
+                _setLink( matrix, x, y, 1 )     #nowhere else to go, put the link back.
+                continue
+
+        if debug==True:
+            print (">> original x,y = [%d][%d], new [x]-->[y] = [%d][%d]" % (x, y, x, newY) )
+
+        _setLink( matrix, x, newY, 1 )
+        rewired += 1
+
+    return rewired
+
+
+############################################################
+#
+# Rewiring probability sweep: rewires the same k-regular lattice for each of
+# the (increasing) probabilities in 'probs', one after the other, and yields
+# (prob, total edges rewired so far) after each one. The matrix is changed in
+# place, so write it out (or copy it) before moving on to the next level.
+#
+# The randomness is coupled across the levels: every lattice edge draws one
+# uniform number u (plus which endpoint stays put, and a candidate new
+# endpoint) up front, and is rewired at every level where u < p. So each
+# level's graph is the previous level's graph plus more rewired edges, and
+# all levels come out of one pass over the lattice. At each level, every edge
+# is rewired with probability p, just like the (default) edge list rewiring.
+#
+def createSmallWorldSweep( probs, maxWidth, maxHeight, matrix, debug=False, rng=None ):
+
+    if rng is None: rng = np.random.default_rng()
+    size = maxHeight
+
+    numNodes, edges = getEdgeArray( matrix )
+    u = rng.random( len(edges) )
+    flip = rng.random( len(edges) ) < 0.5
+    xs = np.where( flip, edges[:, 1], edges[:, 0] )
+    ys = np.where( flip, edges[:, 0], edges[:, 1] )
+    newYs = rng.integers( 0, size, size=len(edges) )
+
+    #visit the edges in order of u, so each level only adds the edges with
+    # previous p <= u < p:
+    order = np.argsort( u, kind='stable' )
+    sortedU = u[order]
+
+    rewired = 0
+    done = 0
+    for prob in sorted(probs):
+        prob = min( max(prob, 0.0), 1.0 )
+        upto = int( np.searchsorted( sortedU, prob, side='left' ) )
+        batch = order[done:upto]
+        rewired += _applyRewirings( xs[batch], ys[batch], newYs[batch], size, matrix, rng, debug )
+        done = upto
+        yield prob, rewired
+
+
+############################################################
+#
+# Draws a new endpoint for node x, uniformly at random from the nodes in
+# [0, size) that are not x itself, not already linked to x, and not the
+# node 'exclude' (e.g., the endpoint of the link that was just removed).
+#
+# It first tries plain rejection sampling, for up to 'maxTries' draws. When
+# those all fail (likely when p and k are high and x has many links), it
+# falls back to an exact draw: pick r uniformly from the number of allowed
+# nodes, then map r to the r-th allowed node with a binary search over the
+# sorted array of disallowed nodes. So the time taken is always bounded,
+# unlike the old "draw until it fits" loop.
+#
+# Returns None if no allowed node is left.
+#
+def sampleNonNeighbor( matrix, x, size, rng, exclude=None, maxTries=32 ):
+
+    for attempt in range(maxTries):
+        newY = int( rng.integers(0, size) )
+        if newY != x and newY != exclude and not _hasLink( matrix, x, newY ):
+            return newY
+
+    #exact fallback:
+    banned = [x] if exclude is None else [x, exclude]
+    banned = np.union1d( _neighborArray(matrix, x), banned )    #sorted, unique
+    free = size - len(banned)
+    if free <= 0:
+        return None
+
+    r = int( rng.integers(0, free) )
+    #banned[i] - i is the number of allowed nodes below banned[i], so the
+    # r-th allowed node comes after all banned nodes where that is <= r:
+    shifted = banned - np.arange( len(banned) )
+    return r + int( np.searchsorted(shifted, r, side='right') )
+
+
+############################################################
+#
+# Internal helpers, so the rewiring code can treat a SparseGraph (or BitMatrix)
+# and a dense (list-of-lists or NumPy) matrix the same way. Links are always symmetric.
+#
+def _hasLink( matrix, x, y ):
+    if isinstance(matrix, GRAPH_TYPES):
+        return matrix.hasEdge(x, y)
+    return matrix[x][y] != 0
+
+
+def _neighborArray( matrix, x ):
+    if isinstance(matrix, GRAPH_TYPES):
+        return np.fromiter( matrix.neighbors(x), dtype=np.int64 )
+    return np.flatnonzero( np.asarray(matrix[x]) )
+
+
+def _setLink( matrix, x, y, value ):
+    if isinstance(matrix, GRAPH_TYPES):
+        if value: matrix.addEdge(x, y)
+        else:     matrix.removeEdge(x, y)
+    else:
+        matrix[x][y] = value
+        matrix[y][x] = value
 
 
 ############################################################
@@ -218,17 +671,23 @@ def createSmallWorldMatrix( prob, maxWidth, maxHeight, matrix, debug=False ):
 # This method calls in the internal function _regularMatrixCalc()
 # which does the actual link creation for the regular network graph.
 #
-def createRegularMatrix( k, maxWidth, maxHeight, matrix):
+# The matrix can be a SparseGraph, a BitMatrix, a NumPy 2D array (e.g., dtype
+# uint8), or a plain list-of-lists. All of them end up with the same connections.
+#
+def createRegularMatrix( k, maxWidth, maxHeight, matrix, verbose=True):
 
     #check the boundaries:
     if maxWidth < 5 or maxHeight < 5: maxWidth, maxHeight, k = 5, 5, 2
     if k < 1: k = 1
     if k > 4: k = 4
-    print("Creating k-regular matrix with x = %d, y = %d, k = %d" % (width, height, k) )
+    if verbose: print("Creating k-regular matrix with x = %d, y = %d, k = %d" % (maxWidth, maxHeight, k) )
     
     #Set the values of the main diagonal to zero to remove loops.
     removeLoops( maxWidth, maxHeight, matrix ) #clear the diagonal, just in case.
 
+    #remember the lattice, for writing the graph as a delta from it (export type 'delta'):
+    if isinstance(matrix, GRAPH_TYPES): matrix.lattice = k
+
     #call the method that does the actual work.
     count = 1
     while count <= k:
@@ -236,42 +695,232 @@ def createRegularMatrix( k, maxWidth, maxHeight, matrix):
         count += 1
 
 
+############################################################
+#
+# This internal method returns the [x][y] cell indexes that the k-regular
+# network link creation sets to 1 (connected), for one value of k, as two
+# NumPy arrays (xs, ys). They are, in order:
+#   - the row k-below the diagonal (cells where y-x == k),
+#   - the row k-above the diagonal (cells where x-y == k),
+#   - the wrap-around corner cells that link the ends of the chain together.
+#
+# For a square matrix, this is the link between each node x and node
+# (x + k) around the ring, in both directions.
+#
+def _regularCellIndexes(k, maxWidth, maxHeight):
+
+    #k-below the diagonal: x in [0, maxHeight-k), and x must also fit the width.
+    belowX = np.arange( max(0, min(maxHeight - k, maxWidth)) )
+    belowY = belowX + k
+
+    #k-above the diagonal: y in [0, maxWidth-k), and y must also fit the height.
+    aboveY = np.arange( max(0, min(maxWidth - k, maxHeight)) )
+    aboveX = aboveY + k
+
+    #the SW and NE corner cells:
+    corner = np.arange(k)
+    cornerSwX, cornerSwY = corner, maxHeight - k + corner
+    cornerNeX, cornerNeY = maxWidth - k + corner, corner
+
+    xs = np.concatenate( (belowX, aboveX, cornerSwX, cornerNeX) )
+    ys = np.concatenate( (belowY, aboveY, cornerSwY, cornerNeY) )
+    return xs, ys
+
+
 ############################################################
 #
 # This internal method does the k-regular network link creation.
 # It should only be called by the method createRegularMatrix().
 #
+# The cells to connect come from _regularCellIndexes(), so this only does
+# O(N) work per value of k, instead of comparing every cell in the matrix.
+#
 def _regularMatrixCalc(k, maxWidth, maxHeight, matrix):
 
-    #set the row k-below the diagonal to 1 (connected)
-    x = 0
-    y = k
-    while y <= maxHeight-1:
-        x = 0
-        while x <= maxWidth-1:
-            if y-x == (1*k):
-                matrix[x][y] = 1
-            x += 1
-        y += 1
-
-    #set the row k-above the diagonal to 1 (connected)
-    x = k
-    y = 0
-    while y <= maxHeight-1:
-        x = k
-        while x <= maxWidth-1:
-            if x-y == (1*k):
-                matrix[x][y] = 1
-            x += 1
-        y += 1
-
-    #now link the ends of the chain together (i.e., connect
-    # the SW, and NE nodes in the matrix):
-    count = 0
-    while count < k:
-        matrix[count][maxHeight - k + count] = 1
-        matrix[maxWidth - k + count][count] = 1
-        count += 1
+    xs, ys = _regularCellIndexes(k, maxWidth, maxHeight)
+
+    if isinstance(matrix, BitMatrix):
+        matrix.addEdges( np.column_stack( (xs, ys) ) )     #set all of the links in one go.
+    elif isinstance(matrix, SparseGraph):
+        for x, y in zip( xs.tolist(), ys.tolist() ):
+            matrix.addEdge(x, y)
+    elif isinstance(matrix, np.ndarray):
+        matrix[xs, ys] = 1     #fill the diagonals and corners in one go.
+    else:
+        for x, y in zip( xs.tolist(), ys.tolist() ):
+            matrix[x][y] = 1
+
+
+############################################################
+#
+# Graph topologies other than the small-world ring lattice (see '--topology'),
+# generated straight onto an empty SparseGraph (or BitMatrix), in time proportional to the
+# number of edges. All of them draw from the NumPy Generator 'rng', so they are
+# seeded per graph the same way as the small-world graphs (see graphRng()).
+#
+TOPOLOGIES = { 'ws': 'Watts-Strogatz small-world', 'er': 'Erdos-Renyi random',
+               'ba': 'Barabasi-Albert scale-free', 'grid': '2-D grid map' }
+
+
+############################################################
+#
+# Erdos-Renyi G(n, m) random graph with m = k*n edges, i.e. the same number of
+# edges (and mean degree 2k) as the k-regular lattice of the same size.
+#
+# Node pairs are drawn in bulk, and repeats and self-loops are thrown away, until
+# there are m distinct edges (kept in the order they were first drawn).
+#
+def createRandomMatrix( k, size, matrix, rng=None ):
+    if k < 1: k = 1
+    if rng is None: rng = np.random.default_rng()
+    numEdges = min( k * size, size * (size - 1) // 2 )
+
+    codes = np.empty( 0, dtype=np.int64 )   #edge (u, v), u < v, encoded as u * size + v
+    while len(codes) < numEdges:
+        draws = numEdges - len(codes) + 16
+        us = rng.integers( 0, size, draws )
+        vs = rng.integers( 0, size, draws )
+        keep = (us != vs)
+        codes = np.concatenate( (codes, np.minimum(us, vs)[keep] * size + np.maximum(us, vs)[keep]) )
+        unique, first = np.unique( codes, return_index=True )
+        codes = codes[ np.sort(first) ]
+    codes = codes[:numEdges]
+
+    matrix.addEdges( np.column_stack( (codes // size, codes % size) ) )
+    return numEdges
+
+
+############################################################
+#
+# Barabasi-Albert scale-free graph (preferential attachment), where each node
+# brings k edges, by the Batagelj & Brandes (2005) method: edge j (of node
+# j // k) goes to the node at a uniformly random position of the list of all
+# of the edge endpoints so far, so nodes are picked in proportion to their degree.
+#
+# The random positions are drawn in bulk, and the endpoint list is resolved by
+# following the positions back to the nodes that own them, all at once, rather
+# than edge by edge. As in the original method, the few self-loops and repeated
+# edges it draws are dropped.
+#
+# Returns the number of edges.
+#
+def createScaleFreeMatrix( k, size, matrix, rng=None ):
+    if k < 1: k = 1
+    if rng is None: rng = np.random.default_rng()
+    numEdges = k * size
+
+    #endpoint list M: M[2j] = j // k (the node edge j belongs to), and
+    # M[2j + 1] = M[r[j]], for a random position r[j] in 0..2j:
+    j = np.arange( numEdges, dtype=np.int64 )
+    r = ( rng.random(numEdges) * (2 * j + 1) ).astype(np.int64)
+    target = r.copy()
+    odd = (target % 2 == 1)
+    while odd.any():
+        #an odd position is the far end of an earlier edge, so look at where it points:
+        target[odd] = r[ (target[odd] - 1) // 2 ]
+        odd = (target % 2 == 1)
+
+    matrix.addEdges( np.column_stack( (j // k, (target // 2) // k) ) )
+    return matrix.numEdges()
+
+
+############################################################
+#
+# 2-D grid map of side x side nodes, where each node (x, y) links to its 4
+# neighbors (up, down, left, right). Node (x, y) is node number y * side + x,
+# and the graph keeps the node positions (matrix.coords), which the GraphML and
+# Pajek files store, e.g. for A* distance heuristics.
+#
+# With 'prob' > 0, each node is an obstacle (all of its links removed) with
+# probability 'prob', except for the nodes in 'keep' (e.g., the pathfinding
+# start and destination nodes).
+#
+# Returns the number of obstacles.
+#
+def createGridMatrix( side, prob, matrix, rng=None, keep=() ):
+    if rng is None: rng = np.random.default_rng()
+    ids = np.arange( side * side, dtype=np.int64 ).reshape(side, side)
+
+    horizontal = np.column_stack( (ids[:, :-1].ravel(), ids[:, 1:].ravel()) )
+    vertical = np.column_stack( (ids[:-1, :].ravel(), ids[1:, :].ravel()) )
+    edges = np.concatenate( (horizontal, vertical) )
+
+    blocked = np.zeros( side * side, dtype=bool )
+    if prob > 0.0:
+        blocked = rng.random( side * side ) < prob
+        blocked[ list(keep) ] = False
+        edges = edges[ ~(blocked[edges[:, 0]] | blocked[edges[:, 1]]) ]
+
+    matrix.addEdges( edges )
+    matrix.coords = np.column_stack( (ids.ravel() % side, ids.ravel() // side) )
+    return int( blocked.sum() )
+
+
+############################################################
+#
+# Creates the graph of topology 'er', 'ba' or 'grid' (see above) on the empty
+# SparseGraph (or BitMatrix) 'matrix', and prints a one line summary of it
+# (if 'verbose').
+#
+def createTopologyMatrix( topology, k, p, size, matrix, rng=None, verbose=True ):
+    if topology == 'er':
+        numEdges = createRandomMatrix( k, size, matrix, rng )
+        if verbose: print("Created an Erdos-Renyi random graph with %d nodes and %d edges." % (size, numEdges) )
+    elif topology == 'ba':
+        numEdges = createScaleFreeMatrix( k, size, matrix, rng )
+        if verbose: print("Created a Barabasi-Albert scale-free graph with %d nodes and %d edges." % (size, numEdges) )
+    else:
+        side = int( math.isqrt(size) )
+        obstacles = createGridMatrix( side, p, matrix, rng, keep=(1, size // 2 + 1) )
+        if verbose: print("Created a %d x %d grid map with %d edges and %d obstacles." % (side, side, matrix.numEdges(), obstacles) )
+
+
+############################################################
+#
+# Connectivity guarantee (see '--connected'). Rewiring (or a random topology,
+# or grid obstacles) can split a graph into pieces, and then the pathfinding
+# destination may not be reachable. The pieces (connected components) are found
+# with a union-find over the whole edge array (see graph_metadata.componentLabels()).
+#
+MAX_CONNECT_ATTEMPTS = 100
+
+
+############################################################
+#
+# Returns True if the graph is connected.
+#
+def isConnected( matrix ):
+    numNodes, edges = getEdgeArray( matrix )
+    labels = graph_metadata.componentLabels( numNodes, edges )
+    return not labels.any()     #every node's label is the smallest node in its component
+
+
+############################################################
+#
+# Joins a disconnected SparseGraph (or BitMatrix) into one piece, by adding an edge from a
+# random node of every other component to a random node of the largest one.
+# Returns the number of edges added.
+#
+def repairConnectivity( matrix, rng=None ):
+    if rng is None: rng = np.random.default_rng()
+    numNodes, edges = getEdgeArray( matrix )
+    labels = graph_metadata.componentLabels( numNodes, edges )
+    roots, sizes = np.unique( labels, return_counts=True )
+    if len(roots) == 1:
+        return 0
+
+    #the nodes grouped by component (in the order of 'roots'), and one random node of each:
+    order = np.argsort( labels, kind='stable' )
+    firsts = np.cumsum(sizes) - sizes
+    picks = order[ firsts + ( rng.random(len(roots)) * sizes ).astype(np.int64) ]
+
+    largest = np.argmax( sizes )
+    others = np.delete( np.arange(len(roots)), largest )
+    mainNodes = order[ firsts[largest]:firsts[largest] + sizes[largest] ]
+    targets = mainNodes[ rng.integers( 0, len(mainNodes), len(others) ) ]
+
+    matrix.addEdges( np.column_stack( (picks[others], targets) ) )
+    return len(others)
 
 
 ############################################################
@@ -289,7 +938,10 @@ def _regularMatrixCalc(k, maxWidth, maxHeight, matrix):
 # The export file type can be "graphml" for GraphML format, or
 # it can be "pajek" for Pajek file format.
 #
-def writeGraphFile( csvFileNamePrefix, csvExtention, path, exportType, debug=False ):
+# With compression 'gzip' or 'xz', the CSV file is read from (and the export
+# file is written to) the compressed file, e.g. 'graph_1.csv.gz' --> 'graph_1.graphml.gz'.
+#
+def writeGraphFile( csvFileNamePrefix, csvExtention, path, exportType, debug=False, compression=None ):
 
     exportType = str.lower(exportType)
 
@@ -302,7 +954,7 @@ def writeGraphFile( csvFileNamePrefix, csvExtention, path, exportType, debug=Fal
         return False
 
 
-    csvFileName = csvFileNamePrefix + '.' + csvExtention
+    csvFileName = csvFileNamePrefix + '.' + csvExtention + compressionSuffix( compression )
 
     csvPathFile = os.path.join(path, csvFileName)
 
@@ -314,7 +966,7 @@ def writeGraphFile( csvFileNamePrefix, csvExtention, path, exportType, debug=Fal
         if debug: print("Found input CSV file %s" % csvPathFile )
 
 
-    #read adjacency matrix file into pandas:
+    #read adjacency matrix file into pandas (which decompresses '.gz' and '.xz' files):
     #input_data = pd.read_csv(adjMatrixFileName, index_col=0)
     #input_data = pd.read_csv(adjMatrixFileName, header=None)
     input_data = pd.read_csv(csvPathFile, header=None)
@@ -327,125 +979,638 @@ def writeGraphFile( csvFileNamePrefix, csvExtention, path, exportType, debug=Fal
     #Use NetworkX to translate/write graph to Pajek graph file (text) format.
     #extention = "pajek"
     extention = exportType
-    exportFile = csvFileNamePrefix + "." + extention
+    exportFile = csvFileNamePrefix + "." + extention + compressionSuffix( compression )
     exportPathFile = os.path.join(path, exportFile)
     if exportType == 'pajek':
-        nx.write_pajek(G, exportPathFile)
-        print ("Wrote network graph (Pajek format) to text file: %s") % exportPathFile
+        with graph_formats.openGraphFile(exportPathFile, 'wb', compression) as outFile:
+            nx.write_pajek(G, outFile)
+        print ("Wrote network graph (Pajek format) to text file: %s" % exportPathFile)
     elif exportType == 'graphml':
-        nx.write_graphml(G, exportPathFile)
-        print ("Wrote network graph (GraphML format) to text file: %s") % exportPathFile    
+        with graph_formats.openGraphFile(exportPathFile, 'wb', compression) as outFile:
+            nx.write_graphml(G, outFile)
+        print ("Wrote network graph (GraphML format) to text file: %s" % exportPathFile)
     else:
         print ("Error: unknown export type '%s'" % exportType)
         return False
 
 
 ############################################################
+#
+# Writes the in-memory graph straight to a GraphML, Pajek, edge list CSV ('edges'),
+# or CSR binary file,
+# in chunks, without the CSV --> Pandas --> NetworkX round trip of writeGraphFile().
+# The GraphML and Pajek output is the same as writeGraphFile() gives for the same graph.
+#
+# The matrix can be a SparseGraph, a BitMatrix, a NumPy 2D array, a list-of-lists, or a
+# (number of nodes, edge array) pair as returned by getEdgeArray().
+#
+# With compression 'gzip' or 'xz', GraphML and Pajek files are written compressed
+# (see writeCsvFile()). CSR files are never compressed, so they can be memory-mapped.
+#
+# With verbose=False, nothing is printed (except errors), e.g. on the writer
+# threads of a GraphExporter.
+#
+# Node positions ('coords', by default those of a SparseGraph grid map) are
+# stored in the GraphML and Pajek files.
+#
+# Export type 'delta' writes the graph as its differences from the ring lattice
+# it was built from ('lattice' = its k, by default the one the graph remembers
+# from createRegularMatrix(); see graph_formats.py). Like CSR files, delta files
+# are never compressed.
+#
+def streamGraphFile( fileNamePrefix, path, exportType, matrix, debug=False, compression=None, verbose=True, coords=None, lattice=None ):
 
+    exportType = str.lower(exportType)
 
-# Main Graph Generator Test Harness:
-#For the doc study, consider (a) 50x50, k=2, p=.05; and (b) 1000x1000, k=2, p=0.0025
-
-print ("\nUsage:\n %s [#iterations: int] [size: int] [k: int] [p: float] [path: str] [filename: str] [exportType: 'graphml' or 'pajek'] [starting ID: 1] [debugMode: 0 or 1]\n" % str(sys.argv[0]) )
-print ("e.g., for small '50x50' maps (GraphML text format): \n  python  %s  10  50  2  0.05  outputDir  small_   graphml  1  0\n" % str(sys.argv[0]) )
-print ("e.g., for large '1000x1000' maps (GraphML text format):\n  python  %s  10  1000  2  0.0025  outputDir  large_   graphml  1  1\n" % str(sys.argv[0]) )
+    if exportType in ('graphml', 'pajek', 'csr', 'edges', 'delta'):
+        if verbose: print (">> Export file type = '%s'" % exportType)
+    else:
+        print("Error: file type for export can only be (a) 'graphml', (b) 'pajek', (c) 'csr', (d) 'edges', or (e) 'delta'")
+        return False
 
+    numNodes, edges = getEdgeArray( matrix )
+    if coords is None: coords = getattr( matrix, 'coords', None )
+    if lattice is None: lattice = getattr( matrix, 'lattice', None )
+
+    if exportType in ('csr', 'delta'): compression = None
+    exportFile = fileNamePrefix + "." + exportType + compressionSuffix( compression )
+    exportPathFile = createFilePath( exportFile, path, debug )
+    if exportType == 'delta':
+        removed, added = graph_formats.edgesToDelta( numNodes, lattice or 0, edges )
+        with graph_formats.openGraphFile(exportPathFile, 'wb', compression) as outFile:
+            graph_formats.writeDelta( outFile, numNodes, lattice or 0, removed, added )
+        if verbose: print ("Wrote network graph (%s format) to file: %s  (%d edges removed, %d added)" % (EXPORT_FORMAT_NAMES[exportType], exportPathFile, len(removed), len(added)))
+        return exportPathFile
+    if exportType == 'csr':
+        offsets, neighbors = graph_formats.edgesToCsr( numNodes, edges )
+        with graph_formats.openGraphFile(exportPathFile, 'wb', compression) as outFile:
+            graph_formats.writeCsr( outFile, offsets, neighbors )
+        if verbose: print ("Wrote network graph (%s format) to file: %s" % (EXPORT_FORMAT_NAMES[exportType], exportPathFile))
+        return exportPathFile
+
+    with graph_formats.openGraphFile(exportPathFile, 'w', compression) as outFile:
+        if exportType == 'pajek':
+            graph_formats.writePajekStream( outFile, numNodes, edges, coords=coords )
+        elif exportType == 'edges':
+            graph_formats.writeEdgeListStream( outFile, numNodes, edges )
+        else:
+            graph_formats.writeGraphmlStream( outFile, numNodes, edges, coords=coords )
 
-iterations = int(sys.argv[1]) #get first command line parameter after script name (argv[0])
-if iterations <= 1: 
-    iterations = 1
-    print ("Changing iterations to %d" % iterations)
-if iterations > 2000: 
-    iterations = 2000
-    print ("Changing iterations to %d" % iterations)
+    if verbose:
+        print ("Wrote network graph (%s format) to text file: %s" % (EXPORT_FORMAT_NAMES[exportType], exportPathFile))
+    return exportPathFile
 
-maxLen1 = int(sys.argv[2])
-if maxLen1 < 10: 
-    maxLen1 = 10
-    print ("Changing max dimension (size) to %d" % maxLen1)
-if maxLen1 > 2000: 
-    maxLen1 = 2000
-    print ("Changing max dimension (size) to %d" % maxLen1)
 
-k = int(sys.argv[3])
-if k < 0: 
-    k = 1
-    print ("Changing k to %d" % k)
-if k > 4: 
-    k = 4
-    print ("Changing k to %d" % k)
+############################################################
+#
+# Returns the number of nodes, and the (E x 2) NumPy array of undirected
+# edges (each edge once, as (u, v) where u < v, sorted), for a SparseGraph, a BitMatrix,
+# a NumPy 2D array, or a list-of-lists matrix. A (number of nodes, edge array)
+# pair is returned as is.
+#
+def getEdgeArray( matrix ):
+    if isinstance(matrix, GRAPH_TYPES):
+        return matrix.size, matrix.edgeArray()
+    if isinstance(matrix, tuple):
+        return matrix
 
-p = float(sys.argv[4])
-if p < 0.0: 
-    p = 0.0
-    print ("Changing p to %f" % p)
-if p > 1.0: 
-    p = 1.0
-    print ("Changing p to %f" % p)
+    dense = np.asarray(matrix)
+    dense = (dense != 0) | (dense.T != 0)   #symmetric, like nx.Graph( matrix )
+    return len(dense), np.argwhere( np.triu(dense, 1) )
 
-path = str(sys.argv[5])
-if isNotEmpty(path) == False: path = "outputPath"
 
-fileNamePrefix = str(sys.argv[6])
-if isNotEmpty(fileNamePrefix) == False: fileNamePrefix = "outGraph_"
+############################################################
+#
+# Returns the parameters that fully determine the files of graph 'graphId'
+# (the generation cache key is a hash of these, see graph_cache.py).
+#
+# Bump CACHE_VERSION whenever a change to this script changes the graphs (or
+# the files) it writes for the same parameters, so stale entries are not reused.
+#
+CACHE_VERSION = 1
 
-exportType = str(sys.argv[7])
-if isNotEmpty(exportType) == False: exportType="graphml"
+def cacheParams( graphId, settings ):
+    params = { 'version': CACHE_VERSION, 'size': settings['size'], 'k': settings['k'],
+             'p': repr(settings['p']), 'rewire': 'legacy' if settings['legacy'] else 'vectorized',
+             'seed': settings['masterSeed'], 'graphId': graphId }
+    if settings.get('topology', 'ws') != 'ws':
+        params['topology'] = settings['topology']    #(small-world keys stay as they were)
+    if settings.get('connected', 'off') != 'off':
+        params['connected'] = settings['connected']
+    return params
 
-startId = int(sys.argv[8])
-if startId < 1: startId = 1
 
-debug = int(sys.argv[9])
-if debug == 1: debug = True
-elif debug == 0: debug = False
-else: debug = False
+############################################################
+#
+# Returns the file extensions written for every graph, e.g. ['csv', 'graphml',
+# 'meta.json'], or ['csv.gz', 'graphml.gz', 'meta.json'] with gzip compression.
+#
+def graphFileExtensions( settings ):
+    suffix = compressionSuffix( settings['compression'] )
+    extensions = ['csv' + suffix] if settings['matrixCsv'] else []
+    for exportType in settings['exportType'].split(','):
+        exportType = exportType.strip().lower()
+        extensions.append( exportType if exportType in ('csr', 'delta') else exportType + suffix )
+    if settings.get('meta'):
+        extensions.append( graph_metadata.METADATA_SUFFIX.lstrip('.') )
+    return extensions
 
-print("Running with options:\n  #iterations=%d\n  size=%d\n  cluster depth k=%d\n  rewiring percentage p=%f\n  path=%s\n  fileName=%s\n  export file type=%s\n  starting file ID number=%s\n  debugMode=%s\n" % (iterations, maxLen1, k, p, path, fileNamePrefix, exportType, startId, debug) )
 
+############################################################
+#
+# Returns the random number generator for graph number 'graphId'.
+#
+# The stream depends only on the master seed and the graph ID, so a given
+# graph comes out the same whether it's generated alone, in a serial batch,
+# or by any worker of a process pool.
+#
+def graphRng( masterSeed, graphId ):
+    return np.random.default_rng( np.random.SeedSequence([masterSeed, graphId]) )
 
-count = startId #(startID is the starting number used in numbering the output files.) 
-if count < 0: count = 0
 
-while count < (iterations + startId):
+############################################################
+#
+# Creates graph number 'graphId' and writes its files. This is one iteration
+# of the main loop; 'settings' holds the (already validated) command line
+# parameters (see main()).
+#
+# Kept at module level so a multiprocessing.Pool can run it.
+#
+def generateGraph( graphId, settings, exporter=None ):
+    count = graphId
+    width = settings['size']
+    height = settings['size']
+    k = settings['k']
+    p = settings['p']
+    path = settings['path']
+    fileNamePrefix = settings['fileNamePrefix']
+    exportType = settings['exportType']
+    debug = settings['debug']
+    rng = graphRng( settings['masterSeed'], graphId )
+
+    topology = settings.get('topology', 'ws')
+    connected = settings.get('connected', 'off')
     print("\nIteration: %d\n" % count)
 
-    width = maxLen1 
-    height = maxLen1
+    fileName = str(fileNamePrefix + str(count)) #append count to file name
+
+    #write the graph's files now, or hand them to the export stage's writer threads
+    # (along with the generation parameters, for the metadata sidecar file):
+    def exportGraph( matrix, outputPath, p=p, rewired=None ):
+        info = None
+        if settings.get('meta'):
+            info = { 'graphId': graphId, 'topology': topology, 'k': k, 'p': p,
+                     'seed': settings['masterSeed'], 'rewired': rewired }
+            if connected != 'off': info['connectedMode'] = connected
+        if exporter is not None:
+            exporter.submit( fileName, outputPath, matrix, info )
+        else:
+            writeGraphFiles( fileName, outputPath, exportType, width, height, matrix, debug, settings['compression'], settings['matrixCsv'], info )
+
+    #Sweep mode: rewire the same lattice for each p in turn (see createSmallWorldSweep()),
+    # and write each level's graph into its own sub folder of the output path:
+    if settings.get('sweep'):
+        matrix1 = MATRIX_TYPES[ settings.get('matrixType', 'sparse') ]( width )
+        createRegularMatrix( k, width, height, matrix1)
+        if debug: print("Created a k-regular matrix (where cluster depth k = %d)." % k)
+        for p, rewired in createSmallWorldSweep( settings['sweep'], width, height, matrix1, debug, rng ):
+            print("Rewiring probability p = %s: %d edges rewired" % (repr(p), rewired) )
+            exportGraph( matrix1, sweepPath(path, p), p, rewired )
+        return fileName
+
+    matrix1, rewired, connected = createConnectedGraph( settings, rng, connected )
+
+    exportGraph( matrix1, path, p, rewired )
+    return fileName
+
+
+############################################################
+#
+# Creates one graph (see createGraph()), and optionally makes sure it is
+# connected (see '--connected'): 'reject' generates it again (drawing on from
+# the same random stream, so the result is still reproducible), and 'repair'
+# links its pieces together. Returns (matrix, rewired), as createGraph() does,
+# and the connectivity mode that was used in the end ('repair' if 'reject'
+# gave up).
+#
+def createConnectedGraph( settings, rng, connected='off', verbose=True ):
+    matrix1, rewired = createGraph( settings, rng, verbose )
+
+    if connected == 'reject':
+        attempts = 1
+        while not isConnected( matrix1 ) and attempts < MAX_CONNECT_ATTEMPTS:
+            attempts += 1
+            matrix1, rewired = createGraph( settings, rng, verbose=False )
+        if verbose and attempts > 1: print("Rejected %d disconnected graph(s)." % (attempts - 1) )
+        if not isConnected( matrix1 ):
+            if verbose: print("Still disconnected after %d attempts, repairing it instead." % attempts)
+            connected = 'repair'
+    if connected == 'repair':
+        added = repairConnectivity( matrix1, rng )
+        if verbose and added: print("Repaired a disconnected graph: added %d edges between its components." % added)
+    return matrix1, rewired, connected
+
 
-    #Initialize the 2D matrix, and set each cell value to desired initial value:
-    initialValue = 0 #zero means unconnected.
-    matrix1 = [[ initialValue for x in range(width) ] for y in range(height) ]
+############################################################
+#
+# Creates one graph with the settings' topology, size, k and p, from the NumPy
+# Generator 'rng'. Returns the graph (a SparseGraph, or a BitMatrix, see
+# '--matrix'), and the number of edges
+# that were rewired (or None, for the topologies other than 'ws').
+#
+def createGraph( settings, rng, verbose=True ):
+    width = height = settings['size']
+    k = settings['k']
+    p = settings['p']
+    debug = settings['debug']
+    topology = settings.get('topology', 'ws')
+
+    #Initialize the (sparse) graph. Every cell starts as zero (unconnected), and
+    # only the connected cells are ever stored:
+    matrix = MATRIX_TYPES[ settings.get('matrixType', 'sparse') ]( width )
     if debug: print("Created initial empty matrix.")
-    if debug: printMatrix( width, height, matrix1 )
+    if debug: printMatrix( width, height, matrix )
+
+    #the other topologies are generated in one step (see createTopologyMatrix()):
+    if topology != 'ws':
+        createTopologyMatrix( topology, k, p, width, matrix, rng, verbose )
+        if debug: printMatrix( width, height, matrix )
+        return matrix, None
 
     #Create a regular matrix, of type k-regular (where k is a positive integer).
-    createRegularMatrix( k, width, height, matrix1)
+    createRegularMatrix( k, width, height, matrix, verbose )
     if debug: print("Created a k-regular matrix (where cluster depth k = %d)." % k)
-    if debug: printMatrix( width, height, matrix1 )
+    if debug: printMatrix( width, height, matrix )
 
-    #Take the regular matrix created above, and make it a small-world matrix, with 
-    # rewiring probability 'p' equal to a user-defined value between 0.0 and 1.0 
+    #Take the regular matrix created above, and make it a small-world matrix, with
+    # rewiring probability 'p' equal to a user-defined value between 0.0 and 1.0
     # (i.e., rewiring percentage is between 0% and 100%):
-    smallWorld = matrix1
-    createSmallWorldMatrix( p, width, height, smallWorld, debug )
-    if debug: print("Created a small-world matrix with rewiring probability p = %f" % p)
-    if debug: printMatrix( width, height, smallWorld )
+    rewired = createSmallWorldMatrix( p, width, height, matrix, debug, settings['legacy'], rng )
+    if debug: print("Created a small-world matrix with rewiring probability p = %f (%d edges rewired)" % (p, rewired) )
+    if debug: printMatrix( width, height, matrix )
+    return matrix, rewired
+
+
+############################################################
+#
+# Returns the output sub folder for rewiring probability p in sweep mode,
+# e.g. 'outputDir/p0.0025'.
+#
+def sweepPath( path, p ):
+    return os.path.join( path, 'p' + repr(p) )
+
+
+############################################################
+#
+# Writes the metadata sidecar file of the in-memory graph, '<prefix>.meta.json'
+# (see graph_metadata.py): its size, connectivity, and the true distance between
+# the pathfinding start and destination nodes, along with the generation
+# parameters in 'info'. Returns the file name.
+#
+def writeMetadataFile( fileNamePrefix, path, matrix, info, debug=False ):
+    numNodes, edges = getEdgeArray( matrix )
+    metadata = graph_metadata.graphMetadata( numNodes, edges, info )
+    metaPathFile = createFilePath( fileNamePrefix + graph_metadata.METADATA_SUFFIX, path, debug )
+    graph_metadata.writeMetadata( metaPathFile, metadata )
+    return metaPathFile
+
+
+############################################################
+#
+# Writes all of the files for one graph: the CSV adjacency matrix (unless
+# 'matrixCsv' is False), then one file for each of the (comma separated) export types,
+# then (given the generation parameters 'info') the metadata sidecar file.
+#
+def writeGraphFiles( fileName, path, exportType, width, height, matrix1, debug=False, compression=None, matrixCsv=True, info=None ):
+
+    exportTypes = exportType.split(',')
+    numFiles = int(matrixCsv) + len(exportTypes) + int(info is not None)
+
+    #now write raw adjacency matrix to CSV text file format for NetworkX use
+    # (unless turned off, e.g. for graphs too big for a dense N x N matrix file):
+    if matrixCsv:
+        csvExtention = 'csv'
+        results = writeCsvFile( fileName, csvExtention, path, ",", width, height, matrix1, debug, compression)
+        print ("1 of %d:" % numFiles)
+        print ("Wrote network graph file (CSV format) to text file: %s" % results )
+
+    #Write the same graph as a GraphML or Pajek format graph text file for Graph-Tool
+    # use (and/or as a compact CSR binary file, which both pathfinding scripts can
+    # load). Note this is the same map (in terms of network connectivity) that was
+    # saved earlier, the only difference is that it's stored in GraphML text
+    # format for Graph-Tool use, since Graph-Tool doesn't take raw adjacency matrix input.
+    # (It's written straight from the in-memory graph, rather than by reading the
+    # CSV file back in with NetworkX, as writeGraphFile() does.)
+    for fileNumber, exportType in enumerate(exportTypes, 1 + int(matrixCsv)):
+        print ("%d of %d:" % (fileNumber, numFiles))
+        streamGraphFile( fileName, path, exportType.strip(), matrix1, debug, compression)
+
+    if info is not None:
+        print ("%d of %d:" % (numFiles, numFiles))
+        print ("Wrote graph metadata (JSON format) to text file: %s" % writeMetadataFile( fileName, path, matrix1, info, debug ))
+
+
+############################################################
+#
+# Export stage that writes the files of each graph on a small pool of writer
+# threads, so that writing one graph's files overlaps with generating the next
+# graph (and with writing its other files).
+#
+# submit() takes one snapshot of the graph's edge array (so the matrix can be
+# changed, or reused, straight away, e.g. by the next level of a rewiring sweep),
+# and queues one write per file: the adjacency matrix CSV (unless 'matrixCsv'
+# is False), one file per export type, and the metadata sidecar file (given
+# 'info'). Every file is written from the same snapshot, straight from memory,
+# and is the same file writeGraphFiles() writes.
+#
+# The writer threads don't print; the 'Wrote ...' messages are printed by the
+# submitting thread, in submission order, as each graph's files are finished.
+# At most 2 x 'writers' graphs are queued up at once: past that, submit() waits
+# for the oldest one, so a slow disk throttles the generation (back-pressure).
+#
+class GraphExporter(object):
+
+    def __init__(self, writers, exportType, debug=False, compression=None, matrixCsv=True):
+        self.exportTypes = [ t.strip() for t in exportType.split(',') if graph_formats.isNotEmpty(t) ]
+        self.debug = debug
+        self.compression = compression
+        self.matrixCsv = matrixCsv
+        self.maxPending = 2 * writers
+        self.pool = concurrent.futures.ThreadPoolExecutor( max_workers=writers )
+        self.pending = collections.deque()  #(fileName, [(format, future), ...]), oldest first
+
+    def submit(self, fileName, path, matrix, info=None):
+        snapshot = getEdgeArray( matrix )
+        numNodes = snapshot[0]
+        coords = getattr( matrix, 'coords', None )  #(never changed once set)
+        lattice = getattr( matrix, 'lattice', None )
+
+        futures = []
+        if self.matrixCsv:
+            futures.append( ('csv', self.pool.submit( writeCsvFile, fileName, 'csv', path, ",",
+                numNodes, numNodes, snapshot, self.debug, self.compression )) )
+        for exportType in self.exportTypes:
+            futures.append( (exportType.lower(), self.pool.submit( streamGraphFile, fileName, path,
+                exportType, snapshot, self.debug, self.compression, False, coords, lattice )) )
+        if info is not None:
+            futures.append( ('meta', self.pool.submit( writeMetadataFile, fileName, path, snapshot, info, self.debug )) )
+        self.pending.append( (fileName, futures) )
+
+        self.finish( block=False )
+        while len(self.pending) > self.maxPending:
+            self._finishOldest()
+
+    #prints the results of the oldest graph, once all of its files are written
+    # (re-raising any error of its writer threads):
+    def _finishOldest(self):
+        fileName, futures = self.pending.popleft()
+        for exportType, future in futures:
+            exportPathFile = future.result()
+            if exportPathFile:
+                print ("Wrote network graph (%s format) to file: %s" % (EXPORT_FORMAT_NAMES.get(exportType, exportType), exportPathFile))
+
+    ############################################################
+    #
+    # Prints the results of the finished graphs (in submission order). With
+    # block=True, waits for all of the queued graphs to be written first.
+    #
+    def finish(self, block=True):
+        while self.pending:
+            if not block and not all( future.done() for exportType, future in self.pending[0][1] ):
+                break
+            self._finishOldest()
+
+    def close(self):
+        try:
+            self.finish()
+        finally:
+            self.pool.shutdown( wait=True )
 
-    #now write raw adjacency matrix to CSV text file format for NetworkX use:
-    csvExtention = 'csv'
-    fileName = str(fileNamePrefix + str(count)) #append count to file name
-    results = writeCsvFile( fileName, csvExtention, path, ",", width, height, matrix1, debug)
-    print ("1 of 2:")
-    print ("Wrote network graph file (CSV format) to text file: %s" % results )
 
-    #Call NetworkX to translate the CSV file into a GraphML or Pajek format graph text 
-    # for Graph-Tool use. Note this is the same map (in terms of network connectivity)
-    # that was saved earlier, the only difference is that it's stored in GraphML text 
-    # format for Graph-Tool use, since Graph-Tool doesn't take raw adjacency matrix input:
-    print ("2 of 2:")
-    writeGraphFile( fileName, csvExtention, path, exportType, debug)
+############################################################
 
-    count += 1
 
+# Main Graph Generator Test Harness:
+#For the doc study, consider (a) 50x50, k=2, p=.05; and (b) 1000x1000, k=2, p=0.0025
+#
+def main():
+
+    print ("\nUsage:\n %s [#iterations: int] [size: int] [k: int] [p: float] [path: str] [filename: str] [exportType: 'graphml', 'pajek', 'csr', 'edges', 'delta', or a list such as 'graphml,edges'] [starting ID: 1] [debugMode: 0 or 1]\n" % str(sys.argv[0]) )
+    print ("e.g., for small '50x50' maps (GraphML text format): \n  python  %s  10  50  2  0.05  outputDir  small_   graphml  1  0\n" % str(sys.argv[0]) )
+    print ("e.g., for large '1000x1000' maps (GraphML text format):\n  python  %s  10  1000  2  0.0025  outputDir  large_   graphml  1  1\n" % str(sys.argv[0]) )
+    print ("Options (after the parameters above):")
+    print ("  --rewire vectorized|legacy   vectorized (default) gives each edge one chance of being rewired;")
+    print ("                               legacy walks every matrix cell, giving each edge two chances.")
+    print ("  --workers N                  generate the graphs in N processes (default 1).")
+    print ("  --writers N                  write each graph's files on N writer threads, overlapping the")
+    print ("                               generation of the next graph (default 2; 0 = write them in line).")
+    print ("                               With --workers > 1, each process writes its own files in line.")
+    print ("  --seed S                     master random seed; each graph's seed is derived from S and its ID.")
+    print ("  --topology ws|er|ba|grid     ws = Watts-Strogatz small-world (default); er = Erdos-Renyi random")
+    print ("                               with k*N edges; ba = Barabasi-Albert scale-free with k edges per node;")
+    print ("                               grid = 2-D grid map (size rounded down to a square), with node")
+    print ("                               coordinates, and each node an obstacle with probability p.")
+    print ("  --connected off|reject|repair  off (default) = keep disconnected graphs; reject = generate them")
+    print ("                               again (up to %d times); repair = add an edge from each smaller" % MAX_CONNECT_ATTEMPTS)
+    print ("                               piece to the largest one. (Not used with --sweep.)")
+    print ("  --matrix sparse|bits         in-memory graph: sparse (default) = neighbor sets; bits = bit-packed")
+    print ("                               dense matrix (N*N/8 bytes), for sizes up to %d with the CSV file." % MAX_BIT_MATRIX_SIZE)
+    print ("  --csv on|off                 off = don't write the (dense, N x N) adjacency matrix CSV file, e.g.")
+    print ("                               with export type 'edges'; then sizes up to %d are allowed." % MAX_SPARSE_SIZE)
+    print ("  --meta on|off                on (default) = also write each graph's metadata sidecar file")
+    print ("                               '<filename><ID>.meta.json' (size, connectivity, start to destination distance).")
+    print ("  --compress gzip|xz           write compressed CSV, GraphML and Pajek files ('.gz' or '.xz' suffix).")
+    print ("  --sweep P1,P2,...            rewire each lattice for every p in the list (coupled, see")
+    print ("                               createSmallWorldSweep()); the 'p' parameter is then ignored, and")
+    print ("                               each p's graphs go in sub folder 'p<value>' of the output path.")
+    print ("  --cache DIR                  (needs --seed) copy graphs that were already generated with the same")
+    print ("                               parameters from cache folder DIR, and add newly generated ones to it.")
+    print ("  --cache-max-mb M             evict the least recently used cache entries past M megabytes (default 2048).")
+    print ("  --cache-mode copy|link       copy (default) or hard link the cached files into the output folder.\n")
+
+
+    iterations = int(sys.argv[1]) #get first command line parameter after script name (argv[0])
+    if iterations <= 1: 
+        iterations = 1
+        print ("Changing iterations to %d" % iterations)
+    if iterations > 2000: 
+        iterations = 2000
+        print ("Changing iterations to %d" % iterations)
+
+    #without the dense N x N adjacency matrix CSV file, much bigger graphs are practical:
+    matrixCsv = ( str( graph_formats.getOption('--csv', 'on') ).lower() != 'off' )
+    meta = ( str( graph_formats.getOption('--meta', 'on') ).lower() != 'off' )
+    maxSize = 2000 if matrixCsv else MAX_SPARSE_SIZE
+
+    #a bit-packed matrix makes much bigger dense matrices practical (but is never worth it past that):
+    matrixType = str( graph_formats.getOption('--matrix', 'sparse') ).lower()
+    if matrixType not in MATRIX_TYPES: matrixType = 'sparse'
+    if matrixType == 'bits': maxSize = MAX_BIT_MATRIX_SIZE
+
+    maxLen1 = int(sys.argv[2])
+    if maxLen1 < 10: 
+        maxLen1 = 10
+        print ("Changing max dimension (size) to %d" % maxLen1)
+    if maxLen1 > maxSize: 
+        maxLen1 = maxSize
+        print ("Changing max dimension (size) to %d" % maxLen1)
+
+    k = int(sys.argv[3])
+    if k < 0: 
+        k = 1
+        print ("Changing k to %d" % k)
+    if k > 4: 
+        k = 4
+        print ("Changing k to %d" % k)
+
+    topology = str( graph_formats.getOption('--topology', 'ws') ).lower()
+    if topology not in TOPOLOGIES:
+        print ("Unknown topology '%s', using 'ws'." % topology)
+        topology = 'ws'
+    if topology == 'grid' and math.isqrt(maxLen1) ** 2 != maxLen1:
+        maxLen1 = max( 3, math.isqrt(maxLen1) ) ** 2
+        print ("Changing max dimension (size) to %d (a square grid)" % maxLen1)
+
+    p = float(sys.argv[4])
+    if p < 0.0: 
+        p = 0.0
+        print ("Changing p to %f" % p)
+    if p > 1.0: 
+        p = 1.0
+        print ("Changing p to %f" % p)
+
+    path = str(sys.argv[5])
+    if graph_formats.isNotEmpty(path) == False: path = "outputPath"
+
+    fileNamePrefix = str(sys.argv[6])
+    if graph_formats.isNotEmpty(fileNamePrefix) == False: fileNamePrefix = "outGraph_"
+
+    exportType = str(sys.argv[7])
+    if graph_formats.isNotEmpty(exportType) == False: exportType="graphml"
+
+    startId = int(sys.argv[8])
+    if startId < 1: startId = 1
+
+    debug = int(sys.argv[9])
+    if debug == 1: debug = True
+    elif debug == 0: debug = False
+    else: debug = False
+
+    rewireMode = str( graph_formats.getOption('--rewire', 'vectorized') ).lower()
+    if rewireMode != 'legacy': rewireMode = 'vectorized'
+    legacy = (rewireMode == 'legacy')
+
+    workers = int( graph_formats.getOption('--workers', 1) )
+    if workers < 1: workers = 1
+
+    writers = max( 0, int( graph_formats.getOption('--writers', 2) ) )
+
+    print("Running with options:\n  #iterations=%d\n  size=%d\n  cluster depth k=%d\n  rewiring percentage p=%f\n  path=%s\n  fileName=%s\n  export file type=%s\n  starting file ID number=%s\n  debugMode=%s\n  rewire mode=%s\n  workers=%d\n  writers=%d\n  topology=%s\n  matrix=%s\n" % (iterations, maxLen1, k, p, path, fileNamePrefix, exportType, startId, debug, rewireMode, workers, writers, TOPOLOGIES[topology], matrixType) )
+
+    #master seed, from which each graph's own random number stream is derived:
+    masterSeed = graph_formats.getOption('--seed')
+    if masterSeed is None: masterSeed = np.random.SeedSequence().entropy
+    masterSeed = int(masterSeed)
+    print("Master seed = %d  (re-run with '--seed %d' to re-create these graphs)\n" % (masterSeed, masterSeed) )
+
+    compression = graph_formats.getOption('--compress')
+    if compression is not None:
+        compression = compression.lower()
+        if compression not in graph_formats.COMPRESSION_SUFFIXES:
+            print("Unknown compression type '%s', writing uncompressed files." % compression)
+            compression = None
+
+    sweep = graph_formats.getOption('--sweep')
+    if sweep is not None and topology != 'ws':
+        print("Note: '--sweep' only applies to the 'ws' topology, so it won't be used.\n")
+        sweep = None
+    connected = str( graph_formats.getOption('--connected', 'off') ).lower()
+    if connected not in ('off', 'reject', 'repair'):
+        print("Unknown connectivity mode '%s', using 'off'." % connected)
+        connected = 'off'
+    if sweep is not None and connected != 'off':
+        print("Note: '--connected' isn't used with '--sweep'.\n")
+        connected = 'off'
+
+    if sweep is not None:
+        sweep = sorted( set( min( max( float(x), 0.0 ), 1.0 ) for x in sweep.split(',') if graph_formats.isNotEmpty(x) ) )
+        print("Rewiring probability sweep: p = %s  (output sub folders: %s)\n" % (sweep, ', '.join( 'p' + repr(x) for x in sweep )) )
+        if legacy: print("Note: '--sweep' always uses vectorized rewiring.\n")
+
+    settings = { 'size': maxLen1, 'k': k, 'p': p, 'path': path, 'fileNamePrefix': fileNamePrefix,
+                 'exportType': exportType, 'debug': debug, 'legacy': legacy, 'masterSeed': masterSeed,
+                 'sweep': sweep, 'compression': compression, 'matrixCsv': matrixCsv, 'topology': topology,
+                 'meta': meta, 'connected': connected, 'matrixType': matrixType }
+
+    #optional generation cache (only usable with an explicit seed, since otherwise
+    # every run generates different graphs):
+    cache = None
+    cacheDir = graph_formats.getOption('--cache')
+    if cacheDir is not None:
+        if sweep is not None:
+            print("Note: the generation cache isn't used with '--sweep'.\n")
+        elif graph_formats.getOption('--seed') is None:
+            print("Note: '--cache' needs an explicit '--seed', so the cache won't be used.\n")
+        else:
+            cacheMaxMb = float( graph_formats.getOption('--cache-max-mb', 2048) )
+            cacheMode = str( graph_formats.getOption('--cache-mode', 'copy') ).lower()
+            if cacheMode != 'link': cacheMode = 'copy'
+            cache = graph_cache.GraphCache( cacheDir, cacheMaxMb * 1024 * 1024, cacheMode, debug )
+            print("Using generation cache: %s  (%d entries, %.1f MB)\n" % (cacheDir, len(cache.entries), cache.totalBytes() / (1024.0 * 1024.0)) )
+
+    count = startId #(startID is the starting number used in numbering the output files.) 
+    if count < 0: count = 0
+    graphIds = range( count, iterations + startId )
+
+    if cache is not None:
+        extensions = graphFileExtensions( settings )
+        missing = []
+        for graphId in graphIds:
+            key = graph_cache.cacheKey( cacheParams(graphId, settings) )
+            destPathPrefix = createFilePath( fileNamePrefix + str(graphId), path, debug )
+            if cache.fetch( key, extensions, destPathPrefix ):
+                print("Iteration: %d  (from cache)" % graphId)
+            else:
+                missing.append( graphId )
+        print("\nCache hits: %d, graphs to generate: %d\n" % (len(graphIds) - len(missing), len(missing)) )
+        graphIds = missing
+
+    if workers == 1:
+        exporter = None
+        if writers > 0:
+            exporter = GraphExporter( writers, exportType, debug, compression, matrixCsv )
+        try:
+            for graphId in graphIds:
+                generateGraph( graphId, settings, exporter )
+        finally:
+            if exporter is not None: exporter.close()
+    else:
+        #every graph is independent, so spread the graph IDs over a pool of processes.
+        # Each graph draws from its own seeded stream (see graphRng()), so the output
+        # files are the same no matter how many workers run, or in what order:
+        print("Generating %d graphs with %d worker processes.\n" % (len(graphIds), workers) )
+        pool = multiprocessing.Pool( workers )
+        try:
+            pool.map( functools.partial(generateGraph, settings=settings), graphIds, chunksize=1 )
+        finally:
+            pool.close()
+            pool.join()
+
+    if cache is not None:
+        for graphId in graphIds:
+            params = cacheParams( graphId, settings )
+            destPathPrefix = createFilePath( fileNamePrefix + str(graphId), path, debug )
+            files = dict( (extension, destPathPrefix + '.' + extension) for extension in extensions )
+            cache.store( graph_cache.cacheKey(params), params, files )
+        evicted = cache.evict()
+        if evicted: print("Evicted %d least recently used cache entries." % evicted)
+        cache.save()
+
+
+    print ("\nDone.\n")
+
+
+############################################################
 
-print ("\nDone.\n")
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,201 @@
+import sys
+import os
+import json
+import time
+import shutil
+import platform
+import tempfile
+import tracemalloc
+import subprocess
+import contextlib
+
+import numpy as np
+import pandas as pd
+import networkx as nx
+
+import graph_formats
+import graph_generator
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Stage-level benchmark of the graph generator.
+
+For every combination of size, k and p in the sweep, this times each stage of
+generating one graph, as the generator runs them:
+
+    lattice     createRegularMatrix()      build the k-regular ring lattice
+    rewire      createSmallWorldMatrix()   small-world rewiring
+    csvWrite    writeCsvFile()             write the adjacency matrix CSV file
+    graphWrite  writeGraphFile()           re-read the CSV, and export GraphML via NetworkX
+    graphStream streamGraphFile()          write GraphML straight from memory
+
+Each stage is run '--repeat' times, and its median, min and max wall clock times
+are reported. Peak (Python heap) memory of each stage is measured in a separate
+run under tracemalloc, so the tracing overhead doesn't skew the timings.
+
+The results are printed as a table, and written as JSON (see '--out') so runs on
+different commits can be compared.
+
+e.g.,
+  python  graph_generator_benchmark.py  --sizes 50,200,1000  --k 2  --p 0.01,0.05  --repeat 5  --out bench.json
+"""
+
+
+#default sweep:
+DEFAULT_SIZES = '50,200,500,1000,2000'
+DEFAULT_KS = '1,2,3,4'
+DEFAULT_PS = '0.0025,0.01,0.05'
+DEFAULT_REPEAT = 3
+
+STAGES = ['lattice', 'rewire', 'csvWrite', 'graphWrite', 'graphStream']
+
+
+############################################################
+#
+# Returns the current git commit of this script's folder, or None.
+#
+def getGitCommit():
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    try:
+        output = subprocess.check_output( ['git', 'rev-parse', 'HEAD'], cwd=script_dir, stderr=subprocess.DEVNULL )
+        return output.decode('ascii').strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+############################################################
+#
+# Returns the stage functions for one graph. Each stage works on the state
+# left by the previous stages (the graph, and the CSV file name).
+#
+def makeStages( size, k, p, path, rng ):
+    state = {}
+    fileName = 'bench_%d_k%d' % (size, k)
+
+    def lattice():
+        state['matrix'] = graph_generator.SparseGraph( size )
+        graph_generator.createRegularMatrix( k, size, size, state['matrix'] )
+
+    def rewire():
+        graph_generator.createSmallWorldMatrix( p, size, size, state['matrix'], False, False, rng )
+
+    def csvWrite():
+        graph_generator.writeCsvFile( fileName, 'csv', path, ",", size, size, state['matrix'] )
+
+    def graphWrite():
+        graph_generator.writeGraphFile( fileName, 'csv', path, 'graphml' )
+
+    def graphStream():
+        graph_generator.streamGraphFile( fileName + '_stream', path, 'graphml', state['matrix'] )
+
+    return [ ('lattice', lattice), ('rewire', rewire), ('csvWrite', csvWrite),
+             ('graphWrite', graphWrite), ('graphStream', graphStream) ]
+
+
+############################################################
+#
+# Runs all of the stages for one graph once, and returns the elapsed
+# time of each stage (in seconds). With 'traceMemory', returns the peak
+# traced memory of each stage (in bytes) instead.
+#
+def runStagesOnce( size, k, p, path, rng, traceMemory=False ):
+    results = {}
+    #the generator prints progress messages, keep them out of the results:
+    with open(os.devnull, 'w') as devnull, contextlib.redirect_stdout(devnull):
+        for stage, function in makeStages( size, k, p, path, rng ):
+            if traceMemory:
+                tracemalloc.start()
+                function()
+                results[stage] = tracemalloc.get_traced_memory()[1]
+                tracemalloc.stop()
+            else:
+                start_time = time.perf_counter()
+                function()
+                results[stage] = time.perf_counter() - start_time
+    return results
+
+
+############################################################
+#
+# Benchmarks one (size, k, p) combination, and returns one result record
+# per stage.
+#
+def benchmark( size, k, p, repeat, path, seed ):
+    rng = np.random.default_rng( seed )
+
+    timings = dict( (stage, []) for stage in STAGES )
+    for i in range(repeat):
+        for stage, elapsed in runStagesOnce( size, k, p, path, rng ).items():
+            timings[stage].append( elapsed )
+
+    peaks = runStagesOnce( size, k, p, path, rng, traceMemory=True )
+
+    records = []
+    for stage in STAGES:
+        times = np.array( timings[stage] )
+        records.append( { 'size': size, 'k': k, 'p': p, 'stage': stage, 'runs': repeat,
+                          'median_s': float(np.median(times)), 'min_s': float(times.min()),
+                          'max_s': float(times.max()), 'peak_mb': peaks[stage] / (1024.0 * 1024.0) } )
+    return records
+
+
+############################################################
+def main():
+
+    print ("\nUsage:\n %s [--sizes 50,200,...] [--k 1,2,...] [--p 0.01,...] [--repeat N] [--seed S] [--path DIR] [--out FILE.json]\n" % str(sys.argv[0]) )
+    print ("Defaults: --sizes %s  --k %s  --p %s  --repeat %d  (temporary --path, no --out)\n" % (DEFAULT_SIZES, DEFAULT_KS, DEFAULT_PS, DEFAULT_REPEAT) )
+
+    sizes = [ int(x) for x in str( graph_formats.getOption('--sizes', DEFAULT_SIZES) ).split(',') ]
+    ks = [ int(x) for x in str( graph_formats.getOption('--k', DEFAULT_KS) ).split(',') ]
+    ps = [ float(x) for x in str( graph_formats.getOption('--p', DEFAULT_PS) ).split(',') ]
+    repeat = max( 1, int( graph_formats.getOption('--repeat', DEFAULT_REPEAT) ) )
+    seed = int( graph_formats.getOption('--seed', 12345) )
+    outFile = graph_formats.getOption('--out')
+
+    path = graph_formats.getOption('--path')
+    removePath = path is None
+    if removePath:
+        path = tempfile.mkdtemp( prefix='graph_bench_' )
+    path = os.path.abspath(path)
+
+    print("Running with options:\n  sizes=%s\n  k=%s\n  p=%s\n  repeat=%d\n  seed=%d\n  path=%s\n  out=%s\n" % (sizes, ks, ps, repeat, seed, path, outFile) )
+
+    records = []
+    try:
+        print("%6s %2s %8s  %-12s %12s %12s %10s" % ('size', 'k', 'p', 'stage', 'median(ms)', 'min(ms)', 'peak(MB)') )
+        for size in sizes:
+            for k in ks:
+                for p in ps:
+                    for record in benchmark( size, k, p, repeat, path, seed ):
+                        records.append( record )
+                        print("%6d %2d %8.4f  %-12s %12.3f %12.3f %10.2f" % (size, k, p, record['stage'],
+                            record['median_s'] * 1000, record['min_s'] * 1000, record['peak_mb']) )
+                    sys.stdout.flush()
+    finally:
+        if removePath:
+            shutil.rmtree( path, ignore_errors=True )
+
+    if outFile:
+        report = { 'commit': getGitCommit(),
+                   'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+                   'machine': { 'platform': platform.platform(), 'processor': platform.processor(),
+                                'python': platform.python_version(), 'numpy': np.__version__,
+                                'pandas': pd.__version__, 'networkx': nx.__version__ },
+                   'config': { 'sizes': sizes, 'k': ks, 'p': ps, 'repeat': repeat, 'seed': seed },
+                   'results': records }
+        with open(outFile, 'w') as file:
+            json.dump( report, file, indent=1 )
+        print("\nWrote benchmark results (JSON) to: %s" % outFile)
+
+    print ("\nDone.\n")
+
+
+############################################################
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+import os
+import json
+
+import numpy as np
+
+import graph_formats
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Graph metadata sidecar files.
+
+The graph generator writes one small JSON file per graph next to its graph
+files (e.g., 'small_1.meta.json' next to 'small_1.csv' and 'small_1.graphml'),
+with properties that are cheap to work out from the in-memory graph at
+generation time, but expensive to get afterwards without loading and solving it:
+
+    nodes, edges          graph size (e.g., to order work by size)
+    rewired               number of edges the small-world rewiring moved (or null)
+    components            number of connected components, and 'connected'
+    startNode, destNode   the pathfinding start and destination nodes (1 and N/2 + 1)
+    distance              true shortest path length (in hops, every edge has a
+                          weight of 1) from startNode to destNode, or null if
+                          the destination can't be reached
+
+The pathfinding scripts use 'distance' to check the path lengths they find.
+
+The generation parameters (graph ID, topology, k, p, seed) are stored too.
+"""
+
+
+METADATA_SUFFIX = '.meta.json'
+METADATA_VERSION = 1
+
+
+############################################################
+#
+# Returns the metadata file of a graph file, e.g. 'dir/small_1.csv.gz' -->
+# 'dir/small_1.meta.json'.
+#
+def metadataPathFile( graphPathFile ):
+    prefix = os.path.splitext( graph_formats.stripCompressionSuffix(graphPathFile) )[0]
+    return prefix + METADATA_SUFFIX
+
+
+############################################################
+#
+# Returns the pathfinding start and destination nodes of a graph with
+# numNodes nodes: node 1, and the node in the middle (as the pathfinding
+# scripts use).
+#
+def pathfindingNodes( numNodes ):
+    return 1, numNodes // 2 + 1
+
+
+############################################################
+#
+# Returns the (unweighted) breadth-first search distance from 'source' to
+# every node of the CSR graph (offsets, neighbors), as a NumPy array, with -1
+# for the nodes that can't be reached. Each level of the search is expanded
+# in one go. With 'target', the search stops once the target is reached.
+#
+def bfsDistances( offsets, neighbors, source, target=None ):
+    numNodes = len(offsets) - 1
+    dist = np.full( numNodes, -1, dtype=np.int64 )
+    dist[source] = 0
+    frontier = np.array( [source], dtype=np.int64 )
+
+    level = 0
+    while len(frontier) and (target is None or dist[target] < 0):
+        level += 1
+        starts = offsets[frontier].astype(np.int64)
+        counts = offsets[frontier + 1] - starts
+        #positions of all of the frontier's neighbors in 'neighbors':
+        firsts = np.repeat( starts - (np.cumsum(counts) - counts), counts )
+        found = neighbors[ firsts + np.arange(counts.sum()) ]
+        frontier = np.unique( found[ dist[found] < 0 ] )
+        dist[frontier] = level
+    return dist
+
+
+############################################################
+#
+# Returns the connected component label of every node of an undirected graph
+# with nodes 0..numNodes-1 and an (E x 2) edge array: the smallest node number
+# in its component.
+#
+# This is a union-find over all of the edges at once: each round links the
+# root of every edge's larger end to the root of its smaller end, then
+# collapses the trees (pointer jumping), until every edge's ends share a root.
+#
+def componentLabels( numNodes, edges ):
+    parent = np.arange( numNodes, dtype=np.int64 )
+    edges = np.asarray(edges, dtype=np.int64).reshape(-1, 2)
+    us, vs = edges[:, 0], edges[:, 1]
+
+    while True:
+        rootUs, rootVs = parent[us], parent[vs]
+        split = (rootUs != rootVs)
+        if not split.any():
+            return parent
+        np.minimum.at( parent, np.maximum(rootUs, rootVs)[split], np.minimum(rootUs, rootVs)[split] )
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal( grandparent, parent ):
+                break
+            parent = grandparent
+
+
+############################################################
+#
+# Works out the metadata of a graph with nodes 0..numNodes-1 and an (E x 2)
+# edge array. 'info' holds the generation parameters to store along with it
+# (e.g., graphId, topology, k, p, seed, rewired).
+#
+def graphMetadata( numNodes, edges, info=None ):
+    startNode, destNode = pathfindingNodes( numNodes )
+    offsets, neighbors = graph_formats.edgesToCsr( numNodes, edges )
+    labels = componentLabels( numNodes, edges )
+    numComponents = len( np.unique(labels) )
+
+    distance = None
+    if labels[startNode] == labels[destNode]:
+        distance = int( bfsDistances( offsets, neighbors, startNode, destNode )[destNode] )
+
+    metadata = { 'version': METADATA_VERSION }
+    metadata.update( info or {} )
+    metadata.update( { 'nodes': int(numNodes), 'edges': int(len(edges)),
+                       'maxDegree': int( np.diff(offsets).max() ) if numNodes else 0,
+                       'components': numComponents, 'connected': numComponents == 1,
+                       'startNode': startNode, 'destNode': destNode, 'distance': distance } )
+    return metadata
+
+
+############################################################
+#
+# Writes (and reads) a metadata file.
+#
+def writeMetadata( pathFile, metadata ):
+    with graph_formats.openGraphFile(pathFile, 'w') as outFile:
+        json.dump( metadata, outFile, indent=1, sort_keys=True )
+        outFile.write('\n')
+
+
+def readMetadata( pathFile ):
+    with open(pathFile, 'r') as inFile:
+        return json.load(inFile)
+
+
+############################################################
+#
+# Returns the metadata of graph file 'graphPathFile' from its sidecar file,
+# or None if there isn't one (or it can't be read).
+#
+def findMetadata( graphPathFile ):
+    pathFile = metadataPathFile( graphPathFile )
+    if not os.path.isfile(pathFile):
+        return None
+    try:
+        return readMetadata( pathFile )
+    except (IOError, OSError, ValueError):
+        return None
@@ -0,0 +1,304 @@
+import sys
+import csv
+import math
+import time
+import queue
+import threading
+
+import numpy as np
+import networkx as nx
+
+import graph_formats
+import graph_generator
+import graph_workers
+
+try:
+    import graph_tool.all as gt
+except ImportError:
+    gt = None   #Graph-Tool engine not available; the NetworkX engine still works.
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Program to generate small-world graphs and run the pathfinding on them in one
+process, without writing the graphs to disk and parsing them back in.
+
+A producer thread builds the graphs with the graph generator's core (the same
+topologies, rewiring, connectivity handling, and per-graph seeds as
+graph_generator.py, with the same '--topology', '--connected', and '--matrix'
+options, so graph N of a given '--seed' is the same graph either way), and
+hands each one over through a bounded queue. When the pathfinding falls behind,
+the queue fills up and the producer blocks (back-pressure), so at most
+'--queue-depth' + 2 graphs are ever held in memory at once: the full queue, the
+graph the producer is building, and the one being searched.
+
+The main thread loads each graph into NetworkX or Graph-Tool, runs the selected
+algorithm from node 1 to node N/2 + 1 (like the pathfinding scripts), and
+prints the results in the same record format:
+
+    ALGORITHM|A-star
+    INFILECOUNTER|1
+    INFILENAME|small_1
+    RESULTS|A-star|pathLength|12
+    RESULTS|A-star|path|[1, ...]
+    RESULTS|A-star|buildTime(ns)|410200
+    RESULTS|A-star|searchTime(ns)|120500
+    RESULTS|A-star|reconstructTime(ns)|3100
+    RESULTS|A-star|elapsedTime|0.0012
+
+The elapsed time here covers the algorithm call only (no process start up, or
+file loading). Memory consumption isn't measured; use the pathfinding scripts
+for that. With '--out', the results are also written to a CSV file, with the
+columns ALGORITHM, FILE_NAME, PATH_LENGTH, ELAPSED_TIME, BUILD_TIME,
+SEARCH_TIME, and RECONSTRUCT_TIME (in seconds). There is no MEMORY_CONSUMED or
+LOAD_TIME column, so this isn't the layout the results parsers write, and the
+file can't go through the CSV collation scripts (csv_combiner.py).
+
+Writing the graph files is optional (see '--write'), e.g. to keep the graphs
+for later reruns.
+"""
+
+
+ALGORITHM_NAMES = { 1: 'A-star', 2: 'Bellman-Ford', 3: 'Dijkstra' }
+
+
+############################################################
+#
+# Producer: generates the graphs 'graphIds' one at a time, and puts each one
+# on 'graphQueue' as (graphId, matrix). Ends with None.
+#
+# graphQueue.put() blocks while the queue is full, which throttles the
+# generation down to the speed of the pathfinding.
+#
+# Nothing is printed here, so the output of the two threads never interleaves.
+#
+def produceGraphs( graphQueue, graphIds, settings, errors ):
+    try:
+        for graphId in graphIds:
+            rng = graph_generator.graphRng( settings['masterSeed'], graphId )
+            matrix, rewired, connected = graph_generator.createConnectedGraph( settings, rng, settings['connected'], verbose=False )
+            graphQueue.put( (graphId, matrix) )
+    except Exception as e:
+        errors.append(e)
+    finally:
+        graphQueue.put(None)
+
+
+############################################################
+#
+# Runs the pathfinding algorithm with NetworkX, on the graph given by its
+# edge array. Returns (path, elapsed time of the algorithm call, phase times in
+# ns, see graph_workers.PHASES); the path is empty if the destination can't be
+# reached.
+#
+def runNetworkX( numNodes, edges, algorithm, startNode, destNode ):
+    build_start = time.perf_counter_ns()
+    G = nx.Graph()
+    G.add_nodes_from( range(numNodes) )
+    G.add_edges_from( edges.tolist(), weight=1 )
+
+    search_start = time.perf_counter_ns()
+    try:
+        if algorithm == 1:
+            path = nx.astar_path(G, startNode, destNode )
+        elif algorithm == 2:
+            path = nx.bellman_ford_path(G, startNode, destNode )
+        else:
+            path = nx.dijkstra_path(G, startNode, destNode )
+    except nx.NetworkXNoPath:
+        path = []
+    search_end = time.perf_counter_ns()
+
+    phaseTimes = graph_workers.phaseTimes( [build_start, search_start, search_end, search_end], graph_workers.PHASES[1:] )
+    return path, (search_end - search_start) / 1e9, phaseTimes
+
+
+############################################################
+#
+# Runs the pathfinding algorithm with Graph-Tool, on the graph given by its
+# edge array. Returns (path, elapsed time of the algorithm call, phase times in
+# ns, see graph_workers.PHASES); the path is empty if the destination can't be
+# reached.
+#
+def runGraphTool( numNodes, edges, algorithm, startNode, destNode ):
+    build_start = time.perf_counter_ns()
+    g = gt.Graph( directed=False )
+    g.add_vertex( numNodes )
+    g.add_edge_list( edges )
+    weights = g.new_edge_property("int")
+    weights.a[:] = 1    #give all edges a weight of 1
+
+    source = g.vertex( startNode )
+    target = g.vertex( destNode )
+
+    search_start = time.perf_counter_ns()
+    if algorithm == 1:
+        dist, pred = gt.astar_search(g, source, weight=weights)
+    elif algorithm == 2:
+        vertList, edgeList = gt.shortest_path(g, source, target, negative_weights=True)
+    else:
+        dist, pred = gt.dijkstra_search(g, source, weight=weights)
+    search_end = time.perf_counter_ns()
+    elapsed_time = (search_end - search_start) / 1e9
+
+    if algorithm == 2:
+        path = [ int(v) for v in vertList ]
+        return path, elapsed_time, graph_workers.phaseTimes( [build_start, search_start, search_end, time.perf_counter_ns()], graph_workers.PHASES[1:] )
+
+    #an unreachable destination keeps an 'infinite' distance (and is its own
+    # predecessor, so the walk below would never end):
+    distance = dist.a[destNode]
+    if np.issubdtype( dist.a.dtype, np.integer ):
+        unreachable = ( distance == np.iinfo(dist.a.dtype).max )
+    else:
+        unreachable = np.isinf( distance )
+    path = []
+    if not unreachable:
+        #walk the predecessor map back from the destination to the start node:
+        pred = pred.a
+        path = [destNode]
+        while path[-1] != startNode:
+            path.append( int(pred[ path[-1] ]) )
+        path.reverse()
+    return path, elapsed_time, graph_workers.phaseTimes( [build_start, search_start, search_end, time.perf_counter_ns()], graph_workers.PHASES[1:] )
+
+
+############################################################
+def main():
+
+    print ("\nUsage:\n %s [#graphs: int] [size: int] [k: int] [p: float] [algorithm: 1, 2, or 3] [engine: 'networkx' or 'graphtool'] [debugMode: 0 or 1]\n" % str(sys.argv[0]) )
+    print ("Where algorithm: 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra.\n")
+    print ("e.g.,\n  python  %s  100  1000  2  0.01  3  networkx  0  --seed 42  >  ./temp/output.txt \n" % str(sys.argv[0]) )
+    print ("Options (after the parameters above):")
+    print ("  --seed S              master random seed (as for graph_generator.py).")
+    print ("  --rewire vectorized|legacy")
+    print ("  --topology ws|er|ba|grid   graph topology (as for graph_generator.py, default ws).")
+    print ("  --connected off|reject|repair   make sure each graph is connected (default off).")
+    print ("  --matrix sparse|bits  in-memory graph type (default sparse).")
+    print ("  --start-id N          ID of the first graph (default 1).")
+    print ("  --queue-depth N       most graphs generated ahead of the pathfinding (default 4).")
+    print ("  --write TYPES         also write the graph files, e.g. 'csv,graphml' (default: none).")
+    print ("  --path DIR            folder for the graph files (default 'outputPath').")
+    print ("  --prefix NAME         graph file name prefix (default 'outGraph_').")
+    print ("  --out FILE            also write the results to CSV file FILE.\n")
+
+
+    iterations = max( 1, int(sys.argv[1]) )
+    size = min( max( 10, int(sys.argv[2]) ), 2000 )
+    k = min( max( 1, int(sys.argv[3]) ), 4 )
+
+    #the same graph options as graph_generator.py:
+    topology = str( graph_formats.getOption('--topology', 'ws') ).lower()
+    if topology not in graph_generator.TOPOLOGIES:
+        print ("Unknown topology '%s', using 'ws'." % topology)
+        topology = 'ws'
+    if topology == 'grid' and math.isqrt(size) ** 2 != size:
+        size = max( 3, math.isqrt(size) ) ** 2
+        print ("Changing size to %d (a square grid)" % size)
+    connected = str( graph_formats.getOption('--connected', 'off') ).lower()
+    if connected not in ('off', 'reject', 'repair'):
+        print("Unknown connectivity mode '%s', using 'off'." % connected)
+        connected = 'off'
+    matrixType = str( graph_formats.getOption('--matrix', 'sparse') ).lower()
+    if matrixType not in graph_generator.MATRIX_TYPES: matrixType = 'sparse'
+    p = min( max( 0.0, float(sys.argv[4]) ), 1.0 )
+
+    algorithm = int(sys.argv[5])
+    if algorithm < 1: algorithm = 1
+    if algorithm > 3: algorithm = 3
+    algorithmName = ALGORITHM_NAMES[algorithm]
+
+    engine = str(sys.argv[6]).lower()
+    if engine != 'graphtool': engine = 'networkx'
+    if engine == 'graphtool' and gt is None:
+        print("Graph-Tool is not installed; cannot use the 'graphtool' engine.")
+        sys.exit(1)
+
+    debug = (int(sys.argv[7]) == 1)
+
+    masterSeed = graph_formats.getOption('--seed')
+    if masterSeed is None: masterSeed = np.random.SeedSequence().entropy
+    masterSeed = int(masterSeed)
+
+    legacy = ( str( graph_formats.getOption('--rewire', 'vectorized') ).lower() == 'legacy' )
+    startId = max( 1, int( graph_formats.getOption('--start-id', 1) ) )
+    queueDepth = max( 1, int( graph_formats.getOption('--queue-depth', 4) ) )
+    writeTypes = [ t.strip().lower() for t in str( graph_formats.getOption('--write', '') ).split(',') if graph_formats.isNotEmpty(t) ]
+    outputPath = str( graph_formats.getOption('--path', 'outputPath') )
+    fileNamePrefix = str( graph_formats.getOption('--prefix', 'outGraph_') )
+    outFile = graph_formats.getOption('--out')
+
+    print("Running with options:\n  #graphs=%d\n  size=%d\n  cluster depth k=%d\n  rewiring percentage p=%f\n  algorithm=%s\n  engine=%s\n  master seed=%d\n  queue depth=%d\n  write files=%s\n  debugMode=%s\n  topology=%s\n  connected=%s\n  matrix=%s\n"
+        % (iterations, size, k, p, algorithmName, engine, masterSeed, queueDepth, writeTypes, debug, graph_generator.TOPOLOGIES[topology], connected, matrixType) )
+
+    settings = { 'size': size, 'k': k, 'p': p, 'path': outputPath, 'fileNamePrefix': fileNamePrefix,
+                 'legacy': legacy, 'masterSeed': masterSeed, 'debug': False, 'topology': topology,
+                 'connected': connected, 'matrixType': matrixType }
+    graphIds = range( startId, startId + iterations )
+
+    graphQueue = queue.Queue( maxsize=queueDepth )
+    errors = []
+    producer = threading.Thread( target=produceGraphs, args=(graphQueue, graphIds, settings, errors) )
+    producer.daemon = True
+    producer.start()
+
+    runPathfinding = runGraphTool if engine == 'graphtool' else runNetworkX
+    results = []
+    count = 0
+    while True:
+        item = graphQueue.get()
+        if item is None:
+            break
+        graphId, matrix = item
+        fileName = fileNamePrefix + str(graphId)
+        count += 1
+
+        numNodes, edges = graph_generator.getEdgeArray( matrix )
+        startNode = 1                   #start node will always be node 1.
+        destNode = numNodes // 2 + 1    #destination node will always be in the middle.
+        path, elapsed_time, phaseTimes = runPathfinding( numNodes, edges, algorithm, startNode, destNode )
+
+        elapsed_time = format( float(elapsed_time), '.4f')
+        print ("ALGORITHM|%s" % algorithmName)
+        print ("INFILECOUNTER|%d" % count)
+        print ("INFILENAME|%s" % fileName)
+        print ("RESULTS|%s|pathLength|%d" % (algorithmName, len(path) - 1) )
+        print ("RESULTS|%s|path|%s" % (algorithmName, str(path)) )
+        for phase in graph_workers.PHASES[1:]:
+            print ("RESULTS|%s|%sTime(ns)|%d" % (algorithmName, phase, phaseTimes[phase]) )
+        print ("RESULTS|%s|elapsedTime|%s\n" % (algorithmName, elapsed_time) )
+        results.append( [algorithmName, fileName, len(path) - 1, elapsed_time] +
+                        [ format( phaseTimes[phase] / 1e9, '.9f') for phase in graph_workers.PHASES[1:] ] )
+
+        #optionally, keep the graph files too:
+        for writeType in writeTypes:
+            if writeType == 'csv':
+                graph_generator.writeCsvFile( fileName, 'csv', outputPath, ",", numNodes, numNodes, matrix )
+            else:
+                graph_generator.streamGraphFile( fileName, outputPath, writeType, matrix )
+        sys.stdout.flush()
+
+    producer.join()
+    if errors:
+        raise errors[0]
+
+    if outFile:
+        with open(outFile, 'w') as file:
+            writer = csv.writer(file, lineterminator='\n')
+            #(not the results parsers' columns, see above: no MEMORY_CONSUMED or LOAD_TIME)
+            writer.writerow( ['ALGORITHM', 'FILE_NAME', 'PATH_LENGTH', 'ELAPSED_TIME'] +
+                             [ phase.upper() + '_TIME' for phase in graph_workers.PHASES[1:] ] )
+            writer.writerows( results )
+        print("Wrote results (CSV format) to: %s" % outFile)
+
+    print ("\nDone.\n")
+
+
+############################################################
+
+if __name__ == '__main__':
+    main()
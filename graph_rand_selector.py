@@ -8,6 +8,8 @@ import sys
 import os
 import shutil
 
+import graph_formats
+
 
 # Created: 12-17-2016
 #
@@ -83,11 +85,6 @@ Done!
 
 """
 
-############################################################
-def isNotEmpty(s):
-    return bool(s and s.strip())
-
-
 ############################################################
 def createFilePathName( fileName, path, debug=False):
 
@@ -165,21 +162,12 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
 
     csvFileName = fileNamePrefix + '.' + csvExtention
     
-    finalPathFileName = createFilePath( csvFileName, path, debug)
-
-    file = open(finalPathFileName, 'w')
-    file.truncate() #delete existing file contents (if any)
-    x,y = 0, 0
-    delim = delimiter
-    for y in range(maxHeight):
-        line = ""
-        for x in range(maxWidth):
-            line += str(matrix[x][y])
-            if (x < maxWidth-1):
-                line = line + delim
-            if (x >= maxWidth-1):
-                file.write(line + "\n")
-    file.close()
+    finalPathFileName = createFilePathName( csvFileName, path, debug)
+
+    #serialize whole blocks of rows at a time (see graph_formats.py):
+    with open(finalPathFileName, 'wb') as file:
+        rowBlocks = graph_formats.denseRowBlocks( matrix, maxWidth, maxHeight )
+        graph_formats.writeAdjacencyCsv( file, rowBlocks, delimiter )
     return finalPathFileName #return output filename
 
 
@@ -202,7 +190,7 @@ def getFilenamesByExtention( path, extension ):
 
 def main():
 
-    print ("\nUsage:\n %s [source files subdir: str] [target subdir: str] [# files to randomly select: int] [file type: 0 = 'csv', 1 = 'graphml'] [[debugMode: 0 or 1]\n" % str(sys.argv[0]) )
+    print ("\nUsage:\n %s [source files subdir: str] [target subdir: str] [# files to randomly select: int] [file type: 0 = 'csv', 1 = 'graphml', 2 = 'edges' (edge list CSV)] [[debugMode: 0 or 1]\n" % str(sys.argv[0]) )
     print ("e.g., python  %s  small_maps_100x100  group1  100  0  1\n" % str(sys.argv[0]) )
     print ("e.g., python  %s  large_maps_1000x1000  group2  75  1  0\n" % str(sys.argv[0]) )
 
@@ -216,22 +204,24 @@ def main():
 
     fileType = int(sys.argv[4])
     if fileType < 0: fileType = 0   #csv
-    if fileType > 1: fileType = 1   #graphml
+    if fileType > 2: fileType = 2   #edges
 
     debug = int(sys.argv[5])
     if debug == 1: debug = True
     elif debug == 0: debug = False
     else: debug = False
 
-    advert = "(where 0 = CSV files, and 1 = graphML files)"
+    advert = "(where 0 = CSV files, 1 = graphML files, and 2 = edge list CSV files)"
     print("Running with options:\n  source file path=%s\n  destination file path=%s\n  number of files to random select=%d\n  file type=%d  %s\n  debugMode=%s\n" % (sourceDir, destDir, numFilesToRandomSelect, fileType, advert, debug) )
 
 
     csvExtention = ".csv"
     graphmlExtention = ".graphml"
+    edgesExtention = ".edges"
     extention = ""
     if fileType == 0: extention = csvExtention
     elif fileType == 1: extention = graphmlExtention
+    elif fileType == 2: extention = edgesExtention
     else: fileType = -1 #error
 
 
@@ -247,8 +237,9 @@ def main():
     if checkPath(  destPath, debug  ) == False: sys.exit(-2)
 
 
-    #get count and names of desired files in source folder:
-    fileCount, fileNames = getFilenamesByExtention( sourcePath, extention )
+    #get count and names of desired files in source folder (including gzip or xz compressed ones):
+    extentions = (extention,) + tuple( extention + suffix for suffix in graph_formats.COMPRESSION_SUFFIXES.values() )
+    fileCount, fileNames = getFilenamesByExtention( sourcePath, extentions )
     if numFilesToRandomSelect > fileCount:
         print("Error: you want %d files, but only %d input files (with extention '%s') were found in directory:" % (numFilesToRandomSelect, fileCount, extention) )
         print(sourcePath)
@@ -0,0 +1,169 @@
+import sys
+import multiprocessing
+from multiprocessing import shared_memory
+import concurrent.futures
+from concurrent.futures.process import BrokenProcessPool
+
+import numpy as np
+
+
+# Created: 2026-10-18
+#
+# (c) Michael Moran
+#
+#
+"""
+Worker processes for the pathfinding scripts.
+
+Each pathfinding run happens in a child process (so its memory use can be
+measured on its own, and is handed back to the OS afterwards). Starting a new
+Python process per run, and importing NetworkX or Graph-Tool into it each time,
+costs far more than the pathfinding itself on small graphs, so the scripts hand
+their runs to a WorkerPool instead:
+
+  - the workers are forked from a 'forkserver' process, which has imported the
+    heavy modules (NetworkX or Graph-Tool, memory_profiler, etc.) once, up
+    front; a new worker starts with all of them already loaded, and only re-runs
+    the (then cheap) top level of the script, to find its run...() functions.
+  - the timing runs all go to one long-lived worker.
+  - the memory consumption runs each get a fresh worker (forked from the
+    forkserver), so the memory profile of one graph isn't skewed by the heap
+    left over from the graphs before it.
+
+A run is a call of one of the scripts' run...(state) functions, which return
+their results in state[0] (a dict). The job is sent to the worker as a plain
+list [args], and state[0] comes back, through the executor's pipe; no Manager
+(server) process is needed.
+
+Graphs are handed to the workers without pickling them: the parent puts the
+graph's CSR arrays in a block of shared memory (SharedCsr), and sends only a
+small descriptor of it along; the worker maps the same block (attachCsr()), so
+the hand-off costs the same whatever the size of the graph.
+"""
+
+
+############################################################
+#
+# Returns the multiprocessing context for the workers: 'forkserver', with the
+# modules 'preload' (e.g., ['networkx', 'pandas']) imported into the server,
+# where available (POSIX), else the default one.
+#
+def workerContext( preload=() ):
+    if 'forkserver' not in multiprocessing.get_all_start_methods():
+        return multiprocessing.get_context()
+    context = multiprocessing.get_context('forkserver')
+    context.set_forkserver_preload( list(preload) )
+    return context
+
+
+############################################################
+#
+# Runs one job in a worker: calls function(state), and returns its results
+# (state[0]). Anything the function printed (e.g., a memory profile) is flushed
+# first, so it stays in order with the output of the parent process.
+#
+def runJob( function, state ):
+    try:
+        function( state )
+    finally:
+        sys.stdout.flush()
+    return state[0]
+
+
+############################################################
+#
+# Worker processes for the pathfinding runs, see above. Use as:
+#
+#   workers = WorkerPool( ['networkx', 'pandas'] )
+#   results = workers.run( runAstarNoMem, {"input_data": ..., "debug": False} )
+#   ...
+#   workers.close()
+#
+# run() raises BrokenProcessPool if the worker died (e.g., ran out of memory);
+# the next run() then starts a new one.
+#
+class WorkerPool(object):
+
+    def __init__( self, preload=() ):
+        self.context = workerContext( preload )
+        self.executor = None    #the long-lived worker, started by the first run
+
+    def run( self, function, args, recycle=False ):
+        sys.stdout.flush()      #keep the parent's output ahead of the worker's
+        if recycle:
+            #a fresh worker, just for this job:
+            with concurrent.futures.ProcessPoolExecutor( max_workers=1, mp_context=self.context ) as executor:
+                return executor.submit( runJob, function, [args] ).result()
+
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor( max_workers=1, mp_context=self.context )
+        try:
+            return self.executor.submit( runJob, function, [args] ).result()
+        except BrokenProcessPool:
+            self.executor = None
+            raise
+
+    def close( self ):
+        if self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+
+
+############################################################
+#
+# The phases of a pathfinding run that the workers time on their own (with
+# time.perf_counter_ns()), so the algorithms can be compared by their search
+# time alone, without the process handling, file loading, etc.:
+#
+#   load          read the graph file
+#   build         build the graph object (and edge weights) from it
+#   search        the pathfinding algorithm call itself
+#   reconstruct   work out the path (and its length) from the search results
+#
+PHASES = ['load', 'build', 'search', 'reconstruct']
+
+
+############################################################
+#
+# Returns the time (in ns) of each phase, given the perf_counter_ns() time
+# stamps at the start of the first phase and the end of each phase, e.g.
+# phaseTimes( [load_start, build_start, search_start, search_end, reconstruct_end] ).
+#
+def phaseTimes( stamps, phases=PHASES ):
+    return dict( (phase, int(end - start)) for phase, start, end in zip(phases, stamps, stamps[1:]) )
+
+
+############################################################
+#
+# A graph's CSR (offsets, neighbors) arrays, copied once into a block of shared
+# memory (offsets first, then neighbors, as int32). Pass 'descriptor' (a small
+# dict) to the workers, which get the arrays back with attachCsr(), without
+# copying them. close() frees the block, once the workers are done with it.
+#
+class SharedCsr(object):
+
+    def __init__( self, offsets, neighbors ):
+        numOffsets, numNeighbors = len(offsets), len(neighbors)
+        self.shm = shared_memory.SharedMemory( create=True, size=max( 1, 4 * (numOffsets + numNeighbors) ) )
+        array = np.ndarray( numOffsets + numNeighbors, dtype=np.int32, buffer=self.shm.buf )
+        array[:numOffsets] = offsets
+        array[numOffsets:] = neighbors
+        del array   #(the block can't be closed while a view of it exists)
+        self.descriptor = { 'sharedCsr': self.shm.name, 'numNodes': numOffsets - 1, 'numNeighbors': numNeighbors }
+
+    def close( self ):
+        self.shm.close()
+        self.shm.unlink()
+
+
+############################################################
+#
+# Maps the shared memory block of a SharedCsr, given its descriptor. Returns
+# (shm, offsets, neighbors), where the arrays are views of the block; delete
+# them before calling shm.close().
+#
+def attachCsr( descriptor ):
+    shm = shared_memory.SharedMemory( name=descriptor['sharedCsr'] )
+    numOffsets = descriptor['numNodes'] + 1
+    array = np.ndarray( numOffsets + descriptor['numNeighbors'], dtype=np.int32, buffer=shm.buf )
+    return shm, array[:numOffsets], array[numOffsets:]
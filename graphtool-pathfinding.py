@@ -2,13 +2,26 @@ import graph_tool.all as gt
 import sys
 import os
 import gc
+import contextlib
 import timeit
+import time
+import numpy as np
 from memory_profiler import profile
-import multiprocessing
+
+import graph_formats
+import graph_metadata
+import graph_workers
 
 #from graph_tool.all import *
 
 
+ALGORITHM_NAMES = { 1: 'A-star', 2: 'Bellman-Ford', 3: 'Dijkstra' }
+
+#modules imported up front into the worker processes' forkserver (see graph_workers.py),
+# i.e., everything this script imports at the top:
+WORKER_PRELOAD = ['graph_tool.all', 'numpy', 'memory_profiler', 'graph_formats', 'graph_metadata']
+
+
 # Created: 12-17-2016
 #
 # (c) Michael Moran
@@ -27,11 +40,6 @@ http://stackoverflow.com/questions/5086430/how-to-pass-parameters-of-a-function-
 
 
 
-############################################################
-def isNotEmpty(s):
-    return bool(s and s.strip())
-
-
 ############################################################
 def createFilePath( fileName, path, debug=False):
 
@@ -112,6 +120,132 @@ def checkPath( path, debug=False):
 
 
 
+############################################################
+#
+# Returns the list of algorithms (1, 2, or 3) given on the command line: one
+# algorithm, a comma-separated list of them (e.g., '1,3'), or 'all'. Numbers
+# out of range are clamped to 1..3.
+#
+def parseAlgorithms( value ):
+    if str(value).lower() == 'all':
+        return sorted( ALGORITHM_NAMES )
+    algorithms = []
+    for item in str(value).split(','):
+        algorithm = min( max( int(item), 1 ), 3 )
+        if algorithm not in algorithms: algorithms.append( algorithm )
+    return algorithms
+
+
+############################################################
+#
+# Loads a GraphML graph file (optionally gzip or xz compressed), or a CSR binary
+# graph file (a '.csr' file, see graph_formats.py). The CSR arrays are memory-mapped,
+# and their edges are handed to Graph-Tool in bulk, as a NumPy array.
+# A delta graph file (a '.delta' file) is expanded against its ring lattice the
+# same way.
+#
+# Also builds the graph from CSR arrays in shared memory, given their descriptor
+# (see loadInputData(), and graph_workers.SharedCsr).
+#
+def loadGraph( input_path_file ):
+    if isinstance(input_path_file, dict):
+        shm, offsets, neighbors = graph_workers.attachCsr( input_path_file )
+        g = gt.Graph( directed=False )
+        g.add_vertex( len(offsets) - 1 )
+        g.add_edge_list( graph_formats.csrToEdges(offsets, neighbors) )
+        del offsets, neighbors  #(views of the shared memory, which can't be closed while they exist)
+        shm.close()
+        return g
+    if input_path_file.endswith('.csr'):
+        offsets, neighbors = graph_formats.loadCsr( input_path_file )
+        g = gt.Graph( directed=False )
+        g.add_vertex( len(offsets) - 1 )
+        g.add_edge_list( graph_formats.csrToEdges(offsets, neighbors) )
+        return g
+    if input_path_file.endswith('.delta'):
+        numNodes, edges = graph_formats.loadDeltaEdges( input_path_file )
+        g = gt.Graph( directed=False )
+        g.add_vertex( numNodes )
+        g.add_edge_list( edges )
+        return g
+
+    #decompress gzip or xz compressed files on the fly:
+    if graph_formats.getCompression( input_path_file ) is not None:
+        fileFormat = os.path.splitext( graph_formats.stripCompressionSuffix(input_path_file) )[1][1:]
+        with graph_formats.openGraphFile( input_path_file, 'rb' ) as inFile:
+            return gt.load_graph( inFile, fmt=fileFormat )
+    return gt.load_graph( input_path_file )
+
+
+############################################################
+#
+# Returns True if 'destNode' can't be reached from the start node of a search,
+# in O(1), from the search's distance map: Graph-Tool leaves the distance of an
+# unreachable node at infinity (or at the largest value of an integer distance
+# type), and its predecessor pointing at itself.
+#
+def isUnreachable( dist, destNode ):
+    distance = dist.a[ int(destNode) ]
+    if np.issubdtype( dist.a.dtype, np.integer ):
+        return distance == np.iinfo( dist.a.dtype ).max
+    return bool( np.isinf(distance) )
+
+
+############################################################
+#
+# Checks a path length found against the true distance from the graph's
+# metadata sidecar file (written by the graph generator, see graph_metadata.py),
+# when there is one: prints the expected path length, and a WARNING line if
+# they don't match. A path length of -1 (an unreachable destination) gets a
+# WARNING line too.
+#
+def checkPathLength( graphPathFile, algorithmName, pathLength ):
+    if pathLength < 0:
+        print("WARNING|%s|destination node unreachable" % algorithmName)
+    metadata = graph_metadata.findMetadata( graphPathFile )
+    if metadata is None or metadata.get('distance') is None:
+        return
+    print("RESULTS|%s|expectedPathLength|%d" % (algorithmName, metadata['distance']) )
+    if pathLength != metadata['distance']:
+        print("WARNING|%s|pathLength %d does not match the expected path length %d" % (algorithmName, pathLength, metadata['distance']) )
+
+
+############################################################
+#
+# Loads a graph file for the pathfinding, in the parent process, and returns
+# (input_data, sharedGraph, load time in ns): the graph's CSR arrays are put
+# in shared memory (sharedGraph, see graph_workers.SharedCsr), and the worker
+# processes build the graph from them (input_data, their descriptor; see
+# loadGraph()), without reading the file again.
+#
+# Loaded once, a graph can be used for any number of pathfinding runs; free it
+# with releaseInputData() afterwards.
+#
+def loadInputData( graphPathFile ):
+    load_start = time.perf_counter_ns()
+    g = loadGraph( graphPathFile )
+    edges = g.get_edges()[:, :2]
+    sharedGraph = graph_workers.SharedCsr( *graph_formats.edgesToCsr(g.num_vertices(), edges) )
+    return sharedGraph.descriptor, sharedGraph, time.perf_counter_ns() - load_start
+
+
+def releaseInputData( inputData ):
+    sharedGraph = inputData[1]
+    if sharedGraph is not None: sharedGraph.close()
+
+
+############################################################
+#
+# Prints the time of each phase of a timing run (see graph_workers.PHASES), in
+# nanoseconds, e.g. 'RESULTS|A-star|searchTime(ns)|52100', for the results parser.
+# These go ahead of the elapsedTime line, which ends the record block.
+#
+def printPhaseTimes( algorithmName, phaseTimes ):
+    for phase in graph_workers.PHASES:
+        if phase in phaseTimes:
+            print("RESULTS|%s|%sTime(ns)|%d" % (algorithmName, phase, phaseTimes[phase]) )
+
+
 ############################################################
 # Graph-Tool graph manipulations
 #
@@ -124,13 +258,22 @@ def checkPath( path, debug=False):
 # Additionally, this slows down the pathfinding operations!!!
 # So, set the drawGraph parameter to true only during testing.
 #
+# A CSR binary graph file (a '.csr' file), or a delta graph file (a '.delta'
+# file, see graph_formats.py) can be given instead of the GraphML file.
+#
 # The pathfinding algorithm parameter accepts a 1, 2, or 3, 
 # which (alphabetical order) indicates the following:
 #   1 = A* (A-star) algorithm   <--- this is the default
 #   2 = Bellman-Ford algorithm
 #   3 = Dijkstra's algorithm
 #
-def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=False, debug=False, memoryMode=False):
+# The pathfinding runs in a worker process of 'workers' (a graph_workers.WorkerPool,
+# shared by all of the calls); without one, a pool is started just for this call.
+#
+# The graph file is loaded by loadInputData(), unless it already has been
+# ('inputData'), e.g. to run several algorithms on it.
+#
+def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=False, debug=False, memoryMode=False, workers=None, inputData=None):
 
     algorithm = int(algorithm)
     drawGraph = bool(drawGraph)
@@ -154,6 +297,14 @@ def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=F
     #Get the path to the target GraphML file:
     graphmlPathFile = os.path.join(path, graphmlFileName)
 
+    ownWorkers = workers is None
+    if ownWorkers: workers = graph_workers.WorkerPool( WORKER_PRELOAD )
+
+    #load the graph file (unless the caller already has), see loadInputData():
+    ownInput = inputData is None
+    if ownInput: inputData = loadInputData( graphmlPathFile )
+    input_data, sharedGraph, load_time = inputData
+
     start_time = 0.0
 
     #Now calculate the shortest paths, based on the user-specified algorithm.
@@ -165,33 +316,27 @@ def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=F
         else:
             start_time = timeit.default_timer() #get the start time
 
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_path_file"] = graphmlPathFile
+        args["input_graph"] = input_data
         args["draw_graph"] = drawGraph
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runAstar(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runAstar, args=(state,) )
-        if (memoryMode): 
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runAstar, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
+        if (memoryMode):
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runAstar, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runAstarNoMem, args=(state,) )
-        
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runAstarNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|A-star|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|A-star|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|A-star|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|A-star|path|%s" % str(results["path"]) )
+            checkPathLength( graphmlPathFile, "A-star", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "A-star", dict(results["phaseTimes"], load=load_time) )
 
     elif algorithm == 2:
         if debug: print("Algorithm: Bellman-Ford")
@@ -201,33 +346,27 @@ def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=F
         else:
             start_time = timeit.default_timer() #get the start time
 
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_path_file"] = graphmlPathFile
+        args["input_graph"] = input_data
         args["draw_graph"] = drawGraph
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runBellmanFord(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runBellmanFord, args=(state,) )
-        if (memoryMode): 
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runBellmanFord, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
+        if (memoryMode):
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runBellmanFord, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runBellmanFordNoMem, args=(state,) )
-
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runBellmanFordNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|Bellman-Ford|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|Bellman-Ford|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|Bellman-Ford|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|Bellman-Ford|path|%s" % str(results["path"]) )
+            checkPathLength( graphmlPathFile, "Bellman-Ford", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "Bellman-Ford", dict(results["phaseTimes"], load=load_time) )
 
     elif algorithm == 3:
         if debug: print("Algorithm: Dijkstra")
@@ -237,36 +376,32 @@ def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=F
         else:
             start_time = timeit.default_timer() #get the start time
 
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_path_file"] = graphmlPathFile
+        args["input_graph"] = input_data
         args["draw_graph"] = drawGraph
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runDijkstra(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runDijkstra, args=(state,) )
-        if (memoryMode): 
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runDijkstra, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
+        if (memoryMode):
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runDijkstra, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runDijkstraNoMem, args=(state,) )
-
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runDijkstraNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|Dijkstra|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|Dijkstra|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|Dijkstra|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|Dijkstra|path|%s" % str(results["path"]) )
+            checkPathLength( graphmlPathFile, "Dijkstra", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "Dijkstra", dict(results["phaseTimes"], load=load_time) )
 
     #cleanup:
     del graphmlPathFile
+    if ownInput: releaseInputData( inputData )
+    if ownWorkers: workers.close()
     
     #Done:
     if (memoryMode):
@@ -287,6 +422,7 @@ def performGraphToolCalculations(graphmlFileName, path, algorithm=1, drawGraph=F
 def runAstarNoMem(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -295,8 +431,9 @@ def runAstarNoMem(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
     
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
 
 
     startNode = g.vertex(1) #always start at node index 1 (not index zero)
@@ -313,7 +450,9 @@ def runAstarNoMem(state):
 
 
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     dist, pred = gt.astar_search(g, startNode, weight=weights)
+    search_end = time.perf_counter_ns()
 
 
     #Graph-Tool's A* method doesn't return a simple path, nor
@@ -334,13 +473,19 @@ def runAstarNoMem(state):
     # The predecessor list is in [int][int] format, specifically [index][pred node index],
     # so pred[99][1] means that while on the way to searching from the source to the
     # destination node, the node at index 99 has a predecessor of node index 1.
-    while currNode != startNode:  #start with destination node...
+    #An unreachable destination (e.g., in a disconnected graph) is its own predecessor,
+    # so the walk back would never reach the start node; check its distance first:
+    unreachable = isUnreachable( dist, destNode )
+    while currNode != startNode and not unreachable:  #start with destination node...
         astarPath.append( path [int(currNode)][1] ) #append the predecessor node...
         currNode = path [int(currNode)][1]  #update the current node... keep looping backwards.
     astarPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: astarPath = []   #recorded as a path length of -1
     if debug: print("A-Star Path = %s" % astarPath)
     if debug: print("A-Star Path Length = %d" % (len(astarPath) -1) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -358,6 +503,7 @@ def runAstarNoMem(state):
     args = state[0]
     args["pathLength"] = len(astarPath) -1 #subtract 1 to not count starting node.
     args["path"] = astarPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -380,6 +526,7 @@ def runAstarNoMem(state):
 def runAstar(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -388,8 +535,9 @@ def runAstar(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
     
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
 
 
     startNode = g.vertex(1) #always start at node index 1 (not index zero)
@@ -406,7 +554,9 @@ def runAstar(state):
 
 
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     dist, pred = gt.astar_search(g, startNode, weight=weights)
+    search_end = time.perf_counter_ns()
 
 
     #Graph-Tool's A* method doesn't return a simple path, nor
@@ -427,13 +577,19 @@ def runAstar(state):
     # The predecessor list is in [int][int] format, specifically [index][pred node index],
     # so pred[99][1] means that while on the way to searching from the source to the
     # destination node, the node at index 99 has a predecessor of node index 1.
-    while currNode != startNode:  #start with destination node...
+    #An unreachable destination (e.g., in a disconnected graph) is its own predecessor,
+    # so the walk back would never reach the start node; check its distance first:
+    unreachable = isUnreachable( dist, destNode )
+    while currNode != startNode and not unreachable:  #start with destination node...
         astarPath.append( path [int(currNode)][1] ) #append the predecessor node...
         currNode = path [int(currNode)][1]  #update the current node... keep looping backwards.
     astarPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: astarPath = []   #recorded as a path length of -1
     if debug: print("A-Star Path = %s" % astarPath)
     if debug: print("A-Star Path Length = %d" % (len(astarPath) -1) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -451,6 +607,7 @@ def runAstar(state):
     args = state[0]
     args["pathLength"] = len(astarPath) -1 #subtract 1 to not count starting node.
     args["path"] = astarPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -466,6 +623,7 @@ def runAstar(state):
 def runBellmanFordNoMem(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -474,8 +632,9 @@ def runBellmanFordNoMem(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
 
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
     
     
     startNode = g.vertex(1) #always start at node index 1 (not zero)
@@ -495,7 +654,9 @@ def runBellmanFordNoMem(state):
     # will start a Bellman_Ford path search (no specific weights property needed).
     # For documentation and details, see: https://graph-tool.skewed.de/static/doc/topology.html?highlight=shortest_path#graph_tool.topology.shortest_path
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     vertList, edgeList = gt.shortest_path(g, startNode, destNode, negative_weights=True)
+    search_end = time.perf_counter_ns()
 
 
     bellmanFordPath = [] #create an empty path.
@@ -504,6 +665,8 @@ def runBellmanFordNoMem(state):
     if debug: print ("Bellman-Ford Path = %s" % ( str(bellmanFordPath) ) )
     if debug: print ("Bellman-Ford Path length = %d" % ( len(bellmanFordPath)-1 ) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -521,6 +684,7 @@ def runBellmanFordNoMem(state):
     args = state[0]
     args["pathLength"] = ( len(bellmanFordPath) -1) #subtract 1 to not count starting node.
     args["path"] = str(bellmanFordPath)
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -543,6 +707,7 @@ def runBellmanFordNoMem(state):
 def runBellmanFord(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -551,8 +716,9 @@ def runBellmanFord(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
 
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
     
     
     startNode = g.vertex(1) #always start at node index 1 (not zero)
@@ -572,7 +738,9 @@ def runBellmanFord(state):
     # will start a Bellman_Ford path search (no specific weights property needed).
     # For documentation and details, see: https://graph-tool.skewed.de/static/doc/topology.html?highlight=shortest_path#graph_tool.topology.shortest_path
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     vertList, edgeList = gt.shortest_path(g, startNode, destNode, negative_weights=True)
+    search_end = time.perf_counter_ns()
 
 
     bellmanFordPath = [] #create an empty path.
@@ -581,6 +749,8 @@ def runBellmanFord(state):
     if debug: print ("Bellman-Ford Path = %s" % ( str(bellmanFordPath) ) )
     if debug: print ("Bellman-Ford Path length = %d" % ( len(bellmanFordPath)-1 ) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -598,6 +768,7 @@ def runBellmanFord(state):
     args = state[0]
     args["pathLength"] = ( len(bellmanFordPath) -1) #subtract 1 to not count starting node.
     args["path"] = str(bellmanFordPath)
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -613,6 +784,7 @@ def runBellmanFord(state):
 def runDijkstraNoMem(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -621,8 +793,9 @@ def runDijkstraNoMem(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
 
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
 
 
     startNode = g.vertex(1) #always start at node index 1 (not index zero)
@@ -639,7 +812,9 @@ def runDijkstraNoMem(state):
 
 
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     dist, pred = gt.dijkstra_search(g, startNode, weight=weights)
+    search_end = time.perf_counter_ns()
 
     #Graph-Tool's Dijkstra method doesn't return a simple path, nor
     # a path length, unlike NetworkX. Instead it returns two lists: a predecessor, 
@@ -659,13 +834,19 @@ def runDijkstraNoMem(state):
     # The predecessor list is in [int][int] format, specifically [index][pred node index],
     # so pred[99][1] means that while on the way to searching from the source to the
     # destination node, the node at index 99 has a predecessor of node index 1.
-    while currNode != startNode:  #start with destination node...
+    #An unreachable destination (e.g., in a disconnected graph) is its own predecessor,
+    # so the walk back would never reach the start node; check its distance first:
+    unreachable = isUnreachable( dist, destNode )
+    while currNode != startNode and not unreachable:  #start with destination node...
         dijkPath.append( path [int(currNode)][1] ) #append the predecessor node...
         currNode = path [int(currNode)][1]  #update the current node... keep looping backwards.
     dijkPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: dijkPath = []   #recorded as a path length of -1
     #print("Dijkstra Path = %s" % dijkPath)
     #print("Dijkstra Path Length = %d" % (len(dijkPath) -1) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -683,6 +864,7 @@ def runDijkstraNoMem(state):
     args = state[0]
     args["pathLength"] = len(dijkPath) -1 #subtract 1 to not count starting node.
     args["path"] = dijkPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -705,6 +887,7 @@ def runDijkstraNoMem(state):
 def runDijkstra(state):
 
     input_path_file = state[0]["input_path_file"]
+    input_graph = state[0]["input_graph"]   #(in shared memory, see loadInputData())
     draw_graph = state[0]["draw_graph"]
     debug = state[0]["debug"]
 
@@ -713,8 +896,9 @@ def runDijkstra(state):
     if debug: print ("draw_graph = %s" % draw_graph)
     if debug: print ("debugMode = %s" % debug)
 
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
     g = gt.Graph()
-    g = gt.load_graph( input_path_file )
+    g = loadGraph( input_graph )
 
 
     startNode = g.vertex(1) #always start at node index 1 (not index zero)
@@ -731,7 +915,9 @@ def runDijkstra(state):
 
 
     #Call the Graph-Tool function that actually does the pathfinding:
+    search_start = time.perf_counter_ns()
     dist, pred = gt.dijkstra_search(g, startNode, weight=weights)
+    search_end = time.perf_counter_ns()
 
     #Graph-Tool's Dijkstra method doesn't return a simple path, nor
     # a path length, unlike NetworkX. Instead it returns two lists: a predecessor, 
@@ -751,13 +937,19 @@ def runDijkstra(state):
     # The predecessor list is in [int][int] format, specifically [index][pred node index],
     # so pred[99][1] means that while on the way to searching from the source to the
     # destination node, the node at index 99 has a predecessor of node index 1.
-    while currNode != startNode:  #start with destination node...
+    #An unreachable destination (e.g., in a disconnected graph) is its own predecessor,
+    # so the walk back would never reach the start node; check its distance first:
+    unreachable = isUnreachable( dist, destNode )
+    while currNode != startNode and not unreachable:  #start with destination node...
         dijkPath.append( path [int(currNode)][1] ) #append the predecessor node...
         currNode = path [int(currNode)][1]  #update the current node... keep looping backwards.
     dijkPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: dijkPath = []   #recorded as a path length of -1
     #print("Dijkstra Path = %s" % dijkPath)
     #print("Dijkstra Path Length = %d" % (len(dijkPath) -1) ) #subtract 1 to not count starting node.
 
+    reconstruct_end = time.perf_counter_ns()
+
 
     if draw_graph == True:
         #graph_draw(g, vertex_text=g.vertex_index, vertex_font_size=18, output_size=(300,300), output="small_100x100_k2_p05_1.png")
@@ -775,6 +967,7 @@ def runDijkstra(state):
     args = state[0]
     args["pathLength"] = len(dijkPath) -1 #subtract 1 to not count starting node.
     args["path"] = dijkPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -786,14 +979,23 @@ def runDijkstra(state):
 #
 def main():
 
-    print ("\nUsage:\n %s [path to input GraphML files] [algorithm: 1, 2, or 3] [drawGraphs: 0 or 1] [debugMode: 0 or 1] [forceGC: 0 or 1]\n" % str(sys.argv[0]) )
-    print ("Where algorithm: 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra.\n")
+    print ("\nUsage:\n %s [path to input GraphML files] [algorithm: 1, 2, 3, a list such as 1,3, or all] [drawGraphs: 0 or 1] [debugMode: 0 or 1] [forceGC: 0 or 1]\n" % str(sys.argv[0]) )
+    print ("Where algorithm: 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra.")
+    print ("With several algorithms, each graph file is loaded once, and every algorithm is run on it in turn.\n")
+    print ("Options (after the parameters above):")
+    print ("  --format graphml|csr|delta   input graph file format (default graphml); csr = compact CSR binary files,")
+    print ("                         delta = differences from the ring lattice.")
+    print ("                     GraphML files can also be gzip or xz compressed ('.gz' or '.xz' suffix).")
+    print ("  --repeat N               run each algorithm N times on each graph file (default 1), one record")
+    print ("                           block per run, each with a 'REPETITION|<run number>' line (if N > 1).")
+    print ("  --warmup M               first do M untimed (timing mode) runs of each algorithm on each graph")
+    print ("                           file, with their output discarded (default 0).\n")
     print ("To save program output for parsing, redirect ('>') stdout to text file.")
     print ("e.g.,\n  python  %s  inputSubDir  3  0  1  0  >  ./temp/output.txt \n\n" % str(sys.argv[0]) )
 
 
     path = str(sys.argv[1])
-    if isNotEmpty(path) == False:
+    if graph_formats.isNotEmpty(path) == False:
         print("Target folder cannot be null or blank.")
         sys.exit(1)
     else:
@@ -805,14 +1007,7 @@ def main():
             print("Found target folder: %s" % path)
 
 
-    algorithm = int(sys.argv[2])
-    if algorithm < 1: algorithm = 1
-    if algorithm > 3: algorithm = 3
-    algorithmName = ''
-    if algorithm == 1: algorithmName = 'A-star'
-    elif algorithm == 2: algorithmName = 'Bellman-Ford'
-    elif algorithm == 3: algorithmName = 'Dijkstra'
-    else: algorithmName = 'Unknown'
+    algorithms = parseAlgorithms( sys.argv[2] )
 
 
     drawGraphs = int(sys.argv[3])
@@ -831,10 +1026,26 @@ def main():
     print ("Forced garbage collection = %r" % forceGC)
 
 
+    inputFormat = str( graph_formats.getOption('--format', 'graphml') ).lower()
+    if inputFormat not in ('csr', 'delta'): inputFormat = 'graphml'
+    print ("Input graph file format = %s" % inputFormat)
+
+    #text graph files can also be gzip or xz compressed (e.g., 'graph_1.csv.gz'):
+    inputExtensions = ('.' + inputFormat,)
+    if inputFormat not in ('csr', 'delta'):
+        inputExtensions += tuple( '.' + inputFormat + suffix for suffix in graph_formats.COMPRESSION_SUFFIXES.values() )
+
+
+    #the runs of each algorithm on each graph file, in this process (the graph file is loaded once for all of them):
+    repeat = max( 1, int( graph_formats.getOption('--repeat', 1) ) )
+    warmup = max( 0, int( graph_formats.getOption('--warmup', 0) ) )
+    print ("Repetitions = %d, warm-up runs = %d" % (repeat, warmup))
+
+
     advert = "(where 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra)"
     print("Running Graph-Tool pathfinding with user-selected options:\n"),
-    print("  inputFilePath=%s\n  algorithm=%d  %s\n  drawGraphs=%s\n  debug=%s\n  forceGarbageCollection=%s\n" 
-        % (path, algorithm, advert, drawGraphs, debug, forceGC) )
+    print("  inputFilePath=%s\n  algorithm=%s  %s\n  drawGraphs=%s\n  debug=%s\n  forceGarbageCollection=%s\n" 
+        % (path, ','.join( str(a) for a in algorithms ), advert, drawGraphs, debug, forceGC) )
 
 
     #This version combined the elapsed time and memory consumption data collection:
@@ -864,34 +1075,52 @@ def main():
     #This version separates the elapsed time measurement from the memory consumption 
     #measurement, so that one measurement has no potential to interfere with the other.
     memoryMode = False # True = collect memory consumption statistics only (no elapsed time stats). False = collect elapsed time statistics only (not memory stats).
-    print("\nProcessing GraphML graph files (text format) in subdir: '%s'" % path)
+    workers = graph_workers.WorkerPool( WORKER_PRELOAD ) #the pathfinding worker processes, for all of the files
+    print("\nProcessing graph files (%s format) in subdir: '%s'" % (inputFormat.upper(), path) )
     count = 0
     for root, dirs, files in os.walk (path):
         for fileName in files:
-            if fileName.endswith('.graphml'):
+            if fileName.endswith(inputExtensions):
                 count += 1
 
-                #Force a garbage collection before data collection:
-                if forceGC:
-                    gc.enable()
-                    gc.collect()
+                #load the graph file once, for all of the algorithms' runs:
+                inputData = loadInputData( os.path.join(path, fileName) )
+
+                for algorithm in algorithms:
+                    algorithmName = ALGORITHM_NAMES[algorithm]
+
+                    #Warm-up runs (timing mode only: the memory runs each start a fresh
+                    # worker process anyway), with their output discarded:
+                    with open(os.devnull, 'w') as devNull, contextlib.redirect_stdout(devNull):
+                        for _ in range(warmup):
+                            performGraphToolCalculations( fileName, path, algorithm, False, debug, False, workers, inputData )
+
+                    for repetition in range(1, repeat + 1):
+                        #Force a garbage collection before data collection:
+                        if forceGC:
+                            gc.enable()
+                            gc.collect()
+
+                        print ("ALGORITHM|%s" % algorithmName)
+                        print ("INFILECOUNTER|%d" % count)
+                        print ("INFILENAME|%s" % fileName)
+                        if repeat > 1: print ("REPETITION|%d" % repetition)
 
-                print ("ALGORITHM|%s" % algorithmName)
-                print ("INFILECOUNTER|%d" % count)
-                print ("INFILENAME|%s" % fileName)
+                        #Part 1 of 2: Do the MEMORY CONSUMPTION assessment:
+                        memoryMode = True # assess (collect) memory consumption statistics only (no elapsed time stats).
+                        #call the function that does the (memory aware) pathfinding:
+                        performGraphToolCalculations( fileName, path, algorithm, drawGraphs, debug, memoryMode, workers, inputData )
 
-                #Part 1 of 2: Do the MEMORY CONSUMPTION assessment:
-                memoryMode = True # assess (collect) memory consumption statistics only (no elapsed time stats).
-                #call the function that does the (memory aware) pathfinding:
-                performGraphToolCalculations( fileName, path, algorithm, drawGraphs, debug, memoryMode )
+                        #Part 2 of 2: Do the ELAPSED TIME assessment:
+                        memoryMode = False # assess (collect) elapsed time statistics only (not memory stats).
+                        #call the function that does the (non-memory aware) pathfinding, but get timing info:
+                        elapsed_time = performGraphToolCalculations( fileName, path, algorithm, drawGraphs, debug, memoryMode, workers, inputData )
+                        elapsed_time = format( float(elapsed_time), '.4f') #bring it all through, let subsequent scripts change precision as they need.
+                        print("RESULTS|%s|elapsedTime|%s\n" % (algorithmName, elapsed_time) )
 
-                #Part 2 of 2: Do the ELAPSED TIME assessment:
-                memoryMode = False # assess (collect) elapsed time statistics only (not memory stats).
-                #call the function that does the (non-memory aware) pathfinding, but get timing info:
-                elapsed_time = performGraphToolCalculations( fileName, path, algorithm, drawGraphs, debug, memoryMode )
-                elapsed_time = format( float(elapsed_time), '.4f') #bring it all through, let subsequent scripts change precision as they need.
-                print("RESULTS|%s|elapsedTime|%s\n" % (algorithmName, elapsed_time) )
+                releaseInputData( inputData )
 
+    workers.close()
     print ("\nDone.\n")
 
 
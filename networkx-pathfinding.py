@@ -7,13 +7,18 @@ from pylab import rcParams
 import sys
 import os
 import timeit
+import time
 import functools
 import gc
+import contextlib
 from memory_profiler import profile
 from memory_profiler import memory_usage
 from memory_profiler import LogFile
 import guppy
-import multiprocessing
+
+import graph_formats
+import graph_metadata
+import graph_workers
 
 
 # Created: 12-17-2016
@@ -38,17 +43,18 @@ and
 http://stackoverflow.com/questions/5086430/how-to-pass-parameters-of-a-function-when-using-timeit-timer
 """
 
+ALGORITHM_NAMES = { 1: 'A-star', 2: 'Bellman-Ford', 3: 'Dijkstra' }
+
+#modules imported up front into the worker processes' forkserver (see graph_workers.py),
+# i.e., everything this script imports at the top:
+WORKER_PRELOAD = ['pandas', 'networkx', 'pylab', 'memory_profiler', 'guppy', 'graph_formats', 'graph_metadata']
+
 #globals:
 #memory_profiler_out_file = 'memory_profiler.log'
 ##mpLogFile=open(memory_profiler_out_file,'w+')
 #sys.stdout = LogFile(memory_profiler_out_file)
 
 
-############################################################
-def isNotEmpty(s):
-    return bool(s and s.strip())
-
-
 ############################################################
 def createFilePath( fileName, path, debug=False):
 
@@ -121,6 +127,135 @@ def checkPath( path, debug=False):
         return False
 
 
+############################################################
+#
+# Returns the list of algorithms (1, 2, or 3) given on the command line: one
+# algorithm, a comma-separated list of them (e.g., '1,3'), or 'all'. Numbers
+# out of range are clamped to 1..3.
+#
+def parseAlgorithms( value ):
+    if str(value).lower() == 'all':
+        return sorted( ALGORITHM_NAMES )
+    algorithms = []
+    for item in str(value).split(','):
+        algorithm = min( max( int(item), 1 ), 3 )
+        if algorithm not in algorithms: algorithms.append( algorithm )
+    return algorithms
+
+
+############################################################
+#
+# Builds the undirected NetworkX graph from the input data, which is either the
+# descriptor of CSR arrays in shared memory (see graph_workers.SharedCsr), a
+# Pandas adjacency matrix (read from a CSV file), a (number of nodes, edge array)
+# pair (read from an edge list CSV file), or the name of a CSR binary graph file
+# (see graph_formats.py).
+#
+def buildGraph( input_data ):
+    if isinstance(input_data, dict):
+        shm, offsets, neighbors = graph_workers.attachCsr( input_data )
+        G = csrToNetworkX( offsets, neighbors )
+        del offsets, neighbors  #(views of the shared memory, which can't be closed while they exist)
+        shm.close()
+        return G
+    if isinstance(input_data, str):
+        offsets, neighbors = graph_formats.loadCsr( input_data )
+        return csrToNetworkX( offsets, neighbors )
+    if isinstance(input_data, tuple):
+        numNodes, edges = input_data
+        return edgesToNetworkX( numNodes, edges )
+    return nx.Graph( input_data.values )
+
+
+############################################################
+#
+# Builds an undirected NetworkX graph from an (E x 2) edge array, with
+# add_edges_from(), i.e. in O(N + E) rather than the O(N*N) of scanning an
+# adjacency matrix. Like nx.Graph( adjacency matrix ), every edge gets a 'weight' of 1.
+#
+def edgesToNetworkX( numNodes, edges ):
+    G = nx.Graph()
+    G.add_nodes_from( range(numNodes) )
+    G.add_edges_from( edges.tolist(), weight=1 )
+    return G
+
+
+############################################################
+#
+# Builds an undirected NetworkX graph straight from memory-mapped CSR arrays.
+#
+def csrToNetworkX( offsets, neighbors ):
+    return edgesToNetworkX( len(offsets) - 1, graph_formats.csrToEdges(offsets, neighbors) )
+
+
+############################################################
+#
+# Checks a path length found against the true distance from the graph's
+# metadata sidecar file (written by the graph generator, see graph_metadata.py),
+# when there is one: prints the expected path length, and a WARNING line if
+# they don't match. A path length of -1 (an unreachable destination) gets a
+# WARNING line too.
+#
+def checkPathLength( graphPathFile, algorithmName, pathLength ):
+    if pathLength < 0:
+        print("WARNING|%s|destination node unreachable" % algorithmName)
+    metadata = graph_metadata.findMetadata( graphPathFile )
+    if metadata is None or metadata.get('distance') is None:
+        return
+    print("RESULTS|%s|expectedPathLength|%d" % (algorithmName, metadata['distance']) )
+    if pathLength != metadata['distance']:
+        print("WARNING|%s|pathLength %d does not match the expected path length %d" % (algorithmName, pathLength, metadata['distance']) )
+
+
+############################################################
+#
+# Loads a graph file for the pathfinding, in the parent process, and returns
+# (input_data, sharedGraph, load time in ns), where input_data is what the
+# worker processes build the graph from (see buildGraph()).
+#
+# A CSR binary file is memory-mapped by the worker processes instead, so only
+# its file name is passed along (and its loading is timed as part of the
+# 'build' phase). Other graphs are read (adjacency matrix CSV files into
+# Pandas, which decompresses '.gz' and '.xz' files), and handed to the workers
+# as CSR arrays in shared memory (sharedGraph, see graph_workers.SharedCsr),
+# so only a small descriptor of them is passed along.
+#
+# Loaded once, a graph can be used for any number of pathfinding runs; free it
+# with releaseInputData() afterwards.
+#
+def loadInputData( csvPathFile ):
+    load_start = time.perf_counter_ns()
+    if csvPathFile.endswith('.csr'):
+        return csvPathFile, None, time.perf_counter_ns() - load_start
+
+    if graph_formats.stripCompressionSuffix(csvPathFile).endswith('.edges'):
+        numNodes, edges = graph_formats.readEdgeList(csvPathFile)
+    elif csvPathFile.endswith('.delta'):
+        numNodes, edges = graph_formats.loadDeltaEdges(csvPathFile)
+    else:
+        matrix = pd.read_csv(csvPathFile, header=None).values
+        numNodes, edges = len(matrix), graph_formats.denseToEdges(matrix)
+    sharedGraph = graph_workers.SharedCsr( *graph_formats.edgesToCsr(numNodes, edges) )
+    return sharedGraph.descriptor, sharedGraph, time.perf_counter_ns() - load_start
+
+
+def releaseInputData( inputData ):
+    sharedGraph = inputData[1]
+    if sharedGraph is not None: sharedGraph.close()
+
+
+############################################################
+#
+# Prints the time of each phase of a timing run (see graph_workers.PHASES), in
+# nanoseconds, e.g. 'RESULTS|A-star|searchTime(ns)|52100', for the results parser.
+# These go ahead of the elapsedTime line, which ends the record block.
+#
+def printPhaseTimes( algorithmName, phaseTimes ):
+    for phase in graph_workers.PHASES:
+        if phase in phaseTimes:
+            print("RESULTS|%s|%sTime(ns)|%d" % (algorithmName, phase, phaseTimes[phase]) )
+
+
 ############################################################
 # NetworkX graph manipulations
 #
@@ -138,13 +273,23 @@ def checkPath( path, debug=False):
 # and then be displayed, so you could then close that one... ad infinitum.
 # So, set the showGraph parameter to true, only during testing.
 #
+# An edge list CSV file (a '.edges' file), a CSR binary graph file (a '.csr'
+# file), or a delta graph file (a '.delta' file) can be given instead of the
+# adjacency matrix CSV file (see graph_formats.py).
+#
 # The pathfinding algorithm parameter accepts a 1, 2, or 3, 
 # which (alphabetical order) indicates the following:
 #   1 = A* (A-star) algorithm   <--- this is the default
 #   2 = Bellman-Ford algorithm
 #   3 = Dijkstra's algorithm
 #
-def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=10, viewHeight=10, showGraph=False, debug=False, memoryMode=False):
+# The pathfinding runs in a worker process of 'workers' (a graph_workers.WorkerPool,
+# shared by all of the calls); without one, a pool is started just for this call.
+#
+# The graph file is loaded by loadInputData(), unless it already has been
+# ('inputData'), e.g. to run several algorithms on it.
+#
+def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=10, viewHeight=10, showGraph=False, debug=False, memoryMode=False, workers=None, inputData=None):
 
     algorithm = int(algorithm)
     viewWidth = int(viewWidth)
@@ -172,8 +317,13 @@ def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=
 
     csvPathFile = os.path.join(path, adjMatrixFileName)
 
-    #read adjacency matrix file into pandas:
-    input_data = pd.read_csv(csvPathFile, header=None)
+    ownWorkers = workers is None
+    if ownWorkers: workers = graph_workers.WorkerPool( WORKER_PRELOAD )
+
+    #load the graph file (unless the caller already has), see loadInputData():
+    ownInput = inputData is None
+    if ownInput: inputData = loadInputData( csvPathFile )
+    input_data, sharedGraph, load_time = inputData
     #if debug: print ("\nPandas: input_data = \n%s" % input_data)
 
     start_time = 0.0
@@ -187,32 +337,25 @@ def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=
         else:
             start_time = timeit.default_timer() #get the start time
 
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_data"] = input_data
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runAstar(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runAstar, args=(state,) )
-        if (memoryMode): 
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runAstar, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
+        if (memoryMode):
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runAstar, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runAstarNoMem, args=(state,) )
-        
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runAstarNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|A-star|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|A-star|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|A-star|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|A-star|path|%s" % str(results["path"]) )
+            checkPathLength( csvPathFile, "A-star", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "A-star", dict(results["phaseTimes"], load=load_time) )
 
     elif algorithm == 2:
         if debug: print("Algorithm: Bellman-Ford")
@@ -222,32 +365,25 @@ def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=
         else:
             start_time = timeit.default_timer() #get the start time
         
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_data"] = input_data
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runBellmanFord(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runBellmanFord, args=(state,) )
-        if (memoryMode): 
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runBellmanFord, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
+        if (memoryMode):
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runBellmanFord, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runBellmanFordNoMem, args=(state,) )
-        
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runBellmanFordNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|Bellman-Ford|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|Bellman-Ford|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|Bellman-Ford|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|Bellman-Ford|path|%s" % str(results["path"]) )
+            checkPathLength( csvPathFile, "Bellman-Ford", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "Bellman-Ford", dict(results["phaseTimes"], load=load_time) )
 
     elif algorithm == 3:
         if debug: print("Algorithm: Dijkstra")
@@ -257,37 +393,30 @@ def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=
         else:
             start_time = timeit.default_timer() #get the start time
 
-        manager = multiprocessing.Manager()
-        state = manager.list()
-        state.append({})
-        args = state[0]
+        args = {}
         args["input_data"] = input_data
         args["debug"] = debug
-        state[0] = args
-        #start_time = timeit.default_timer() #get the start time
-        #runDijkstra(G, startNode, destNode)
-        #p = multiprocessing.Process(target=runDijkstra, args=(state,) )
+        #runs in a worker process (see graph_workers.py), which hands back the results:
         if (memoryMode):
-            #run the decorated version to collect memory use statistics:
-            p = multiprocessing.Process(target=runDijkstra, args=(state,) )
+            #run the decorated version to collect memory use statistics (in a fresh worker):
+            results = workers.run( runDijkstra, args, recycle=True )
         else:
             #do not run the decorated version (i.e., don't collect memory usage data):
-            p = multiprocessing.Process(target=runDijkstraNoMem, args=(state,) )
-
-        p.start()
-        p.join() #wait for child process to finish.
+            results = workers.run( runDijkstraNoMem, args )
         
         if (memoryMode):
-            print("RESULTS|Dijkstra|pathLength|%d" % int(state[0]["pathLength"]) )
-            print("RESULTS|Dijkstra|path|%s" % str(state[0]["path"]) )
+            print("RESULTS|Dijkstra|pathLength|%d" % int(results["pathLength"]) )
+            print("RESULTS|Dijkstra|path|%s" % str(results["path"]) )
+            checkPathLength( csvPathFile, "Dijkstra", int(results["pathLength"]) )
         else:
             end_time = timeit.default_timer() #get the end time
             elapsed_time = end_time - start_time
+            printPhaseTimes( "Dijkstra", dict(results["phaseTimes"], load=load_time) )
 
     if showGraph == True:
         #Prepare the graphical display. Set graph display to x,y screen inches:
         rcParams['figure.figsize'] = viewWidth, viewHeight
-        G = nx.Graph( input_data.values ) 
+        G = buildGraph( input_data )
         nx.draw_circular(G, with_labels=True) #draw circular graph
         #nx.draw(G, with_labels=True)
         #nx.draw_spectral(G, with_labels=True)
@@ -301,6 +430,8 @@ def performNetworkXCalculations(adjMatrixFileName, path, algorithm=1, viewWidth=
     #cleanup:
     del input_data
     del csvPathFile
+    if ownInput: releaseInputData( inputData )
+    if ownWorkers: workers.close()
 
     #Done:
     if (memoryMode):
@@ -325,7 +456,8 @@ def runAstarNoMem(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -336,20 +468,28 @@ def runAstarNoMem(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeList) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
-    aStarPath = nx.astar_path(G, startNode, destNode )
+    search_start = time.perf_counter_ns()
+    try:
+        aStarPath = nx.astar_path(G, startNode, destNode )
+    except nx.NetworkXNoPath:
+        aStarPath = []  #unreachable destination (e.g., a disconnected graph), recorded as a path length of -1
+    search_end = time.perf_counter_ns()
     #aStarPathLength = nx.astar_path_length(G, startNode, destNode )
     aStarPathLength = len(aStarPath)
 
+    reconstruct_end = time.perf_counter_ns()
+
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = aStarPathLength - 1 #subtract 1 to not include the source node
     args["path"] = aStarPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -377,7 +517,8 @@ def runAstar(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -388,20 +529,28 @@ def runAstar(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeList) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
-    aStarPath = nx.astar_path(G, startNode, destNode )
+    search_start = time.perf_counter_ns()
+    try:
+        aStarPath = nx.astar_path(G, startNode, destNode )
+    except nx.NetworkXNoPath:
+        aStarPath = []  #unreachable destination (e.g., a disconnected graph), recorded as a path length of -1
+    search_end = time.perf_counter_ns()
     #aStarPathLength = nx.astar_path_length(G, startNode, destNode )
     aStarPathLength = len(aStarPath)
 
+    reconstruct_end = time.perf_counter_ns()
+
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = aStarPathLength - 1 #subtract 1 to not include the source node
     args["path"] = aStarPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -421,7 +570,8 @@ def runBellmanFordNoMem(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -432,11 +582,13 @@ def runBellmanFordNoMem(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
+    search_start = time.perf_counter_ns()
     pred, dist = nx.bellman_ford(G, startNode )
+    search_end = time.perf_counter_ns()
     #print ("bellmanFord: pred = %s") % sorted(pred.items())
     #print ("bellmanFord: dist = %s") % sorted(dist.items())
 
@@ -450,10 +602,13 @@ def runBellmanFordNoMem(state):
     currNode = destNode #set current node to destination node
     #The following loop will start from the destination and work our way back to 
     # the start node, one node link at a time:
-    while currNode != startNode:  #start with destination node...
+    #an unreachable destination (e.g., in a disconnected graph) has no distance, and no predecessor:
+    unreachable = destNode not in dist
+    while currNode != startNode and not unreachable:  #start with destination node...
         bfPath.append( path[currNode] ) #append the predecessor node...
         currNode = path[currNode] #update the current node... keep looping backwards.
     bfPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: bfPath = []
     #print("bellmanFordPath = %s" % bfpath)
 
     #2/2. For Bellman-Ford distance, convert the dist list into a K-V dictionary, 
@@ -461,13 +616,16 @@ def runBellmanFordNoMem(state):
     # then get that list entry's associated value.
     # This value represents the Bellman-Ford distance to the destination node:
     bfPathLengthsAll = dict(dist)
-    bfPathLength = bfPathLengthsAll[destNode]
+    bfPathLength = bfPathLengthsAll.get(destNode, -1)   #-1 = unreachable
+
+    reconstruct_end = time.perf_counter_ns()
 
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = bfPathLength #already includes a -1 for path length.
     args["path"] = bfPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -495,7 +653,8 @@ def runBellmanFord(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -506,11 +665,13 @@ def runBellmanFord(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
+    search_start = time.perf_counter_ns()
     pred, dist = nx.bellman_ford(G, startNode )
+    search_end = time.perf_counter_ns()
     #print ("bellmanFord: pred = %s") % sorted(pred.items())
     #print ("bellmanFord: dist = %s") % sorted(dist.items())
 
@@ -524,10 +685,13 @@ def runBellmanFord(state):
     currNode = destNode #set current node to destination node
     #The following loop will start from the destination and work our way back to 
     # the start node, one node link at a time:
-    while currNode != startNode:  #start with destination node...
+    #an unreachable destination (e.g., in a disconnected graph) has no distance, and no predecessor:
+    unreachable = destNode not in dist
+    while currNode != startNode and not unreachable:  #start with destination node...
         bfPath.append( path[currNode] ) #append the predecessor node...
         currNode = path[currNode] #update the current node... keep looping backwards.
     bfPath.reverse() #now reverse the list, so it displays in correct order
+    if unreachable: bfPath = []
     #print("bellmanFordPath = %s" % bfpath)
 
     #2/2. For Bellman-Ford distance, convert the dist list into a K-V dictionary, 
@@ -535,13 +699,16 @@ def runBellmanFord(state):
     # then get that list entry's associated value.
     # This value represents the Bellman-Ford distance to the destination node:
     bfPathLengthsAll = dict(dist)
-    bfPathLength = bfPathLengthsAll[destNode]
+    bfPathLength = bfPathLengthsAll.get(destNode, -1)   #-1 = unreachable
+
+    reconstruct_end = time.perf_counter_ns()
 
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = bfPathLength #already includes a -1 for path length.
     args["path"] = bfPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -561,7 +728,8 @@ def runDijkstraNoMem(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -572,20 +740,28 @@ def runDijkstraNoMem(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeList) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
-    dijkstraPath = nx.dijkstra_path(G, startNode, destNode )
+    search_start = time.perf_counter_ns()
+    try:
+        dijkstraPath = nx.dijkstra_path(G, startNode, destNode )
+    except nx.NetworkXNoPath:
+        dijkstraPath = []  #unreachable destination (e.g., a disconnected graph), recorded as a path length of -1
+    search_end = time.perf_counter_ns()
     #dijkstraPathLength = nx.dijkstra_path_length(G, startNode, destNode )
     dijkstraPathLength = len(dijkstraPath)
 
+    reconstruct_end = time.perf_counter_ns()
+
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = dijkstraPathLength - 1 #subtract 1 to not include the source node
     args["path"] = dijkstraPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -613,7 +789,8 @@ def runDijkstra(state):
 
     #load NetworkX with adjacency matrix graph data (via Pandas)
     #G = nx.DiGraph( input_data.values ) #for directed graphs
-    G = nx.Graph( input_data.values )  #for undirected graphs
+    build_start = time.perf_counter_ns() #time each phase on its own (see graph_workers.PHASES)
+    G = buildGraph( input_data )  #for undirected graphs
 
     #Get list of nodes:
     nodeList = G.nodes()
@@ -624,20 +801,28 @@ def runDijkstra(state):
     #determine start and destination nodes for pathfinding purposes
     startNode = 1 #start node will always be node 1.
     #destNode = len(nodeListData)/2 + 1 #destination node will always be in the middle.
-    destNode = len(nodeList)/2 + 1 #destination node will always be in the middle.
+    destNode = len(nodeList)//2 + 1 #destination node will always be in the middle.
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeListData) )
     #if debug: print ("Number of nodes in this graph: %d" % len(nodeList) )
     if debug: print ("Start node: %d.  Destination node: %d." % (startNode, destNode) )
 
-    dijkstraPath = nx.dijkstra_path(G, startNode, destNode )
+    search_start = time.perf_counter_ns()
+    try:
+        dijkstraPath = nx.dijkstra_path(G, startNode, destNode )
+    except nx.NetworkXNoPath:
+        dijkstraPath = []  #unreachable destination (e.g., a disconnected graph), recorded as a path length of -1
+    search_end = time.perf_counter_ns()
     #dijkstraPathLength = nx.dijkstra_path_length(G, startNode, destNode )
     dijkstraPathLength = len(dijkstraPath)
 
+    reconstruct_end = time.perf_counter_ns()
+
     #Return results by loading the list shared between processes.
     state.append({})
     args = state[0]
     args["pathLength"] = dijkstraPathLength - 1 #subtract 1 to not include the source node
     args["path"] = dijkstraPath
+    args["phaseTimes"] = graph_workers.phaseTimes( [build_start, search_start, search_end, reconstruct_end], graph_workers.PHASES[1:] )
     state[0] = args
 
 
@@ -650,14 +835,23 @@ def runDijkstra(state):
 def main():
 
     #print ("In run_tests()")
-    print ("\nUsage:\n %s [path to input CSV files] [algorithm: 1, 2, or 3] [showGraphs: 0 or 1] [debugMode: 0 or 1] [forceGC: 0 or 1]\n" % str(sys.argv[0]) )
-    print ("Where algorithm: 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra.\n")
+    print ("\nUsage:\n %s [path to input CSV files] [algorithm: 1, 2, 3, a list such as 1,3, or all] [showGraphs: 0 or 1] [debugMode: 0 or 1] [forceGC: 0 or 1]\n" % str(sys.argv[0]) )
+    print ("Where algorithm: 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra.")
+    print ("With several algorithms, each graph file is loaded once, and every algorithm is run on it in turn.\n")
+    print ("Options (after the parameters above):")
+    print ("  --format csv|edges|csr|delta   input graph file format (default csv); edges = edge list CSV files,")
+    print ("                           csr = compact CSR binary files, delta = differences from the ring lattice.")
+    print ("                           csv and edges files can also be gzip or xz compressed ('.gz' or '.xz' suffix).")
+    print ("  --repeat N               run each algorithm N times on each graph file (default 1), one record")
+    print ("                           block per run, each with a 'REPETITION|<run number>' line (if N > 1).")
+    print ("  --warmup M               first do M untimed (timing mode) runs of each algorithm on each graph")
+    print ("                           file, with their output discarded (default 0).\n")
     print ("To save program output for parsing, redirect ('>') stdout to text file.")
     print ("e.g.,\n  python  %s  inputSubDir  3  0  1  0  >  ./temp/output.txt \n\n" % str(sys.argv[0]) )
 
 
     path = str(sys.argv[1])
-    if isNotEmpty(path) == False:
+    if graph_formats.isNotEmpty(path) == False:
         print("Target folder cannot be null or blank.")
         sys.exit(1)
     else:
@@ -669,14 +863,7 @@ def main():
             print("Found target folder: %s" % path)
 
 
-    algorithm = int(sys.argv[2])
-    if algorithm < 1: algorithm = 1
-    if algorithm > 3: algorithm = 3
-    algorithmName = ''
-    if algorithm == 1: algorithmName = 'A-star'
-    elif algorithm == 2: algorithmName = 'Bellman-Ford'
-    elif algorithm == 3: algorithmName = 'Dijkstra'
-    else: algorithmName = 'Unknown'
+    algorithms = parseAlgorithms( sys.argv[2] )
 
 
     displayGraphs = int(sys.argv[3])
@@ -695,10 +882,26 @@ def main():
     print ("Forced garbage collection = %r" % forceGC)
 
 
+    inputFormat = str( graph_formats.getOption('--format', 'csv') ).lower()
+    if inputFormat not in ('csr', 'edges', 'delta'): inputFormat = 'csv'
+    print ("Input graph file format = %s" % inputFormat)
+
+    #text graph files can also be gzip or xz compressed (e.g., 'graph_1.csv.gz'):
+    inputExtensions = ('.' + inputFormat,)
+    if inputFormat not in ('csr', 'delta'):
+        inputExtensions += tuple( '.' + inputFormat + suffix for suffix in graph_formats.COMPRESSION_SUFFIXES.values() )
+
+
+    #the runs of each algorithm on each graph file, in this process (the graph file is loaded once for all of them):
+    repeat = max( 1, int( graph_formats.getOption('--repeat', 1) ) )
+    warmup = max( 0, int( graph_formats.getOption('--warmup', 0) ) )
+    print ("Repetitions = %d, warm-up runs = %d" % (repeat, warmup))
+
+
     advert = "(where 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra)"
     print("Running NetworkX pathfinding with user-selected options:\n"),
-    print("  inputFilePath=%s\n  algorithm=%d  %s\n  displayGraphs=%s\n  debug=%s\n  forceGarbageCollection=%s\n" 
-        % (path, algorithm, advert, displayGraphs, debug, forceGC) )
+    print("  inputFilePath=%s\n  algorithm=%s  %s\n  displayGraphs=%s\n  debug=%s\n  forceGarbageCollection=%s\n" 
+        % (path, ','.join( str(a) for a in algorithms ), advert, displayGraphs, debug, forceGC) )
 
 
     viewWidthInches = 10    #to do - parameterize this
@@ -733,34 +936,52 @@ def main():
     #This version separates the elapsed time measurement from the memory consumption 
     #measurement, so that one measurement has no potential to interfere with the other.
     memoryMode = False # True = collect memory consumption statistics only (no elapsed time stats). False = collect elapsed time statistics only (not memory stats).
-    print("\nProcessing graph files (CSV format) in subdir: '%s'" % path)
+    workers = graph_workers.WorkerPool( WORKER_PRELOAD ) #the pathfinding worker processes, for all of the files
+    print("\nProcessing graph files (%s format) in subdir: '%s'" % (inputFormat.upper(), path) )
     count = 0
     for root, dirs, files in os.walk (path):
         for fileName in files:
-            if fileName.endswith('.csv'):
+            if fileName.endswith(inputExtensions):
                 count += 1
 
-                #Force a garbage collection before data collection:
-                if forceGC:
-                    gc.enable()
-                    gc.collect()
+                #load the graph file once, for all of the algorithms' runs:
+                inputData = loadInputData( os.path.join(path, fileName) )
+
+                for algorithm in algorithms:
+                    algorithmName = ALGORITHM_NAMES[algorithm]
+
+                    #Warm-up runs (timing mode only: the memory runs each start a fresh
+                    # worker process anyway), with their output discarded:
+                    with open(os.devnull, 'w') as devNull, contextlib.redirect_stdout(devNull):
+                        for _ in range(warmup):
+                            performNetworkXCalculations( fileName, path, algorithm, viewWidthInches, viewHeightInches, False, debug, False, workers, inputData )
+
+                    for repetition in range(1, repeat + 1):
+                        #Force a garbage collection before data collection:
+                        if forceGC:
+                            gc.enable()
+                            gc.collect()
+
+                        print ("ALGORITHM|%s" % algorithmName)
+                        print ("INFILECOUNTER|%d" % count)
+                        print ("INFILENAME|%s" % fileName)
+                        if repeat > 1: print ("REPETITION|%d" % repetition)
 
-                print ("ALGORITHM|%s" % algorithmName)
-                print ("INFILECOUNTER|%d" % count)
-                print ("INFILENAME|%s" % fileName)
+                        #Part 1 of 2: Do the MEMORY CONSUMPTION assessment:
+                        memoryMode = True # assess (collect) memory consumption statistics only (no elapsed time stats).
+                        #call the function that does the (memory aware) pathfinding:
+                        performNetworkXCalculations( fileName, path, algorithm, viewWidthInches, viewHeightInches, displayGraphs, debug, memoryMode, workers, inputData )
 
-                #Part 1 of 2: Do the MEMORY CONSUMPTION assessment:
-                memoryMode = True # assess (collect) memory consumption statistics only (no elapsed time stats).
-                #call the function that does the (memory aware) pathfinding:
-                performNetworkXCalculations( fileName, path, algorithm, viewWidthInches, viewHeightInches, displayGraphs, debug, memoryMode )
+                        #Part 2 of 2: Do the ELAPSED TIME assessment:
+                        memoryMode = False # assess (collect) elapsed time statistics only (not memory stats).
+                        #call the function that does the (non-memory aware) pathfinding, but get timing info:
+                        elapsed_time = performNetworkXCalculations( fileName, path, algorithm, viewWidthInches, viewHeightInches, displayGraphs, debug, memoryMode, workers, inputData )
+                        elapsed_time = format( float(elapsed_time), '.4f') #bring it all through, let subsequent scripts change precision as they need.
+                        print("RESULTS|%s|elapsedTime|%s\n" % (algorithmName, elapsed_time) )
 
-                #Part 2 of 2: Do the ELAPSED TIME assessment:
-                memoryMode = False # assess (collect) elapsed time statistics only (not memory stats).
-                #call the function that does the (non-memory aware) pathfinding, but get timing info:
-                elapsed_time = performNetworkXCalculations( fileName, path, algorithm, viewWidthInches, viewHeightInches, displayGraphs, debug, memoryMode )
-                elapsed_time = format( float(elapsed_time), '.4f') #bring it all through, let subsequent scripts change precision as they need.
-                print("RESULTS|%s|elapsedTime|%s\n" % (algorithmName, elapsed_time) )
+                releaseInputData( inputData )
 
+    workers.close()
     print ("\nDone.\n")
 
 
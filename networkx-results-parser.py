@@ -2,6 +2,9 @@ import sys
 import os
 import csv
 
+import graph_formats
+import graph_workers
+
 
 # Created: 12-17-2016
 #
@@ -13,11 +16,6 @@ import csv
 # input CSV graph files.
 
 
-############################################################
-def isNotEmpty(s):
-    return bool(s and s.strip())
-
-
 ############################################################
 def createFilePath( fileName, path, debug=False):
 
@@ -98,19 +96,10 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
     
     finalPathFileName = createFilePath( csvFileName, path, debug)
 
-    file = open(finalPathFileName, 'w')
-    file.truncate() #delete existing file contents (if any)
-    x,y = 0, 0
-    delim = delimiter
-    for y in range(maxHeight):
-        line = ""
-        for x in range(maxWidth):
-            line += str(matrix[x][y])
-            if (x < maxWidth-1):
-                line = line + delim
-            if (x >= maxWidth-1):
-                file.write(line + "\n")
-    file.close()
+    #serialize whole blocks of rows at a time (see graph_formats.py):
+    with open(finalPathFileName, 'wb') as file:
+        rowBlocks = graph_formats.denseRowBlocks( matrix, maxWidth, maxHeight )
+        graph_formats.writeAdjacencyCsv( file, rowBlocks, delimiter )
     return finalPathFileName #return output filename
 
 
@@ -129,6 +118,7 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
 #   ALGORITHM|A-star
 #   INFILECOUNTER|1
 #   INFILENAME|large2000_1.csv
+#   REPETITION|1                (only with the '--repeat N' option, N > 1)
 #   RESULTS|A-star|memoryConsumption(MB)|...
 #   
 #   Filename: networkx-docstudy.py
@@ -145,6 +135,10 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
 #   
 #   RESULTS|A-star|pathLength|3
 #   RESULTS|A-star|path|[1, 1999, 1997, 1001]
+#   RESULTS|A-star|loadTime(ns)|1520310
+#   RESULTS|A-star|buildTime(ns)|4113052
+#   RESULTS|A-star|searchTime(ns)|52100
+#   RESULTS|A-star|reconstructTime(ns)|8015
 #   RESULTS|A-star|elapsedTime|1.680891991
 #
 #<end of record block>
@@ -166,17 +160,26 @@ def writeCsvFile( fileNamePrefix, csvExtention, path, delimiter, maxWidth, maxHe
 # (4) path length (for that algorithm) -- an integer
 # (5) elapsedTime in seconds (for that algorithm)
 #
+# Plus the time of each phase of the timing run (load, build, search, and
+# reconstruct; see graph_workers.PHASES), converted to seconds. These columns are left blank
+# for output from older versions of the pathfinding program, without them.
+#
+# With 'repetition', only the record blocks of that run of the algorithm on each
+# graph file are written (see the pathfinding program's '--repeat' option, and
+# its 'REPETITION|<run number>' lines); record blocks without a REPETITION line
+# count as run 1.
+#
 # Currently, we don't care about the actual node path. 
 # We marginally care about the path length only because these may be interesting from
 # a statistical analysis perspective, as these records may be "outliers" in MANOVA.
 #
-def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm = 'A-star', debug=False):
+def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm = 'A-star', debug=False, repetition=None):
 
     outCsvPathFileName = createFilePath ( (outCsvFileNamePrefix + outCsvFileExt), path, debug)
     outFile = open(outCsvPathFileName, 'wt')    #will overwrite existing file (if there)
     #write column header line (comma separated) to the output file:
     #headerLine = 'ALGORITHM,FILE_NAME,PATH_LENGTH,ELAPSED_TIME,MEMORY_CONSUMED,MIN_MEMORY,MAX_MEMORY\n'
-    headerLine = 'ALGORITHM,FILE_NAME,PATH_LENGTH,ELAPSED_TIME,MEMORY_CONSUMED\n'
+    headerLine = 'ALGORITHM,FILE_NAME,PATH_LENGTH,ELAPSED_TIME,MEMORY_CONSUMED,' + ','.join( phase.upper() + '_TIME' for phase in graph_workers.PHASES ) + '\n'
     outFile.write( headerLine )
 
 
@@ -189,6 +192,8 @@ def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm
         graphFileName = ''
         pathLength = ''
         elapsedTime = ''
+        phaseTimes = {}
+        recordRepetition = 1
         memoryConsumed = '0.0'
         #minMemory = '0.0'
         #maxMemory = '0.0'
@@ -231,6 +236,9 @@ def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm
                 elif buffering == False and line.startswith('INFILENAME|'):
                     graphFileName = parseLine( line, 1, '|', debug)
 
+                elif buffering == False and line.startswith('REPETITION|'):
+                    recordRepetition = int( parseLine( line, 1, '|', debug) )
+
                 #Get memory consumption data. Basically buffer all memory data until 
                 # we reach the next section ('pathLength'). Then send the buffered data 
                 # to the function which handles it.
@@ -241,6 +249,10 @@ def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm
                 elif buffering == False and line.startswith('RESULTS|' + algorithm + '|pathLength|'):
                     pathLength = parseLine( line, 3, '|', debug)
             
+                #the phase times of the timing run, in ns (e.g., 'RESULTS|A-star|searchTime(ns)|52100'):
+                elif buffering == False and line.startswith('RESULTS|' + algorithm + '|') and line.split('|')[2].endswith('Time(ns)'):
+                    phaseTimes[ parseLine( line, 2, '|', debug)[:-len('Time(ns)')] ] = parseLine( line, 3, '|', debug)
+
                 #elif buffering == False and line.startswith('RESULTS|' + algorithm + '|elapsedTime(ms)|'):
                 elif buffering == False and line.startswith('RESULTS|' + algorithm + '|elapsedTime|'):
                     elapsedTime = parseLine( line, 3, '|', debug)
@@ -248,10 +260,10 @@ def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm
             
             
                 #If we gathered all data, then write it to output CSV file:
-                if isNotEmpty(algName) \
-                    and isNotEmpty(graphFileName) \
-                    and isNotEmpty(pathLength) \
-                    and isNotEmpty(elapsedTime) \
+                if graph_formats.isNotEmpty(algName) \
+                    and graph_formats.isNotEmpty(graphFileName) \
+                    and graph_formats.isNotEmpty(pathLength) \
+                    and graph_formats.isNotEmpty(elapsedTime) \
                     and buffering == False and len(buffer) > 0:
                     #and buffering == False:
                     
@@ -264,17 +276,24 @@ def parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithm
                     #elapsedTime = format( float(elapsedTime), '.4f')
                     #memoryConsumed = format( float(memoryConsumed), '.4f')
                     
-                    #Write the combined line, comma-separated, to the target CSV file:
-                    #dataLine = algName + ',' + graphFileName + ',' + pathLength + ',' + elapsedTime + ',' + memoryConsumed + ',' + minMemory + ',' + maxMemory + '\n'
-                    dataLine = algName + ',' + graphFileName + ',' + pathLength + ',' + elapsedTime + ',' + memoryConsumed + '\n'
-                    #print(">>dataLine = %s" % dataLine )
-                    outFile.write( dataLine )
+                    #Write the combined line, comma-separated, to the target CSV file
+                    # (unless it's from a run other than the selected one):
+                    if repetition is None or recordRepetition == repetition:
+                        #dataLine = algName + ',' + graphFileName + ',' + pathLength + ',' + elapsedTime + ',' + memoryConsumed + ',' + minMemory + ',' + maxMemory + '\n'
+                        dataLine = algName + ',' + graphFileName + ',' + pathLength + ',' + elapsedTime + ',' + memoryConsumed
+                        for phase in graph_workers.PHASES:
+                            dataLine += ',' + ( format( int(phaseTimes[phase]) / 1e9, '.9f') if phase in phaseTimes else '' )
+                        dataLine += '\n'
+                        #print(">>dataLine = %s" % dataLine )
+                        outFile.write( dataLine )
                     
                     #clear out data for next iteration:
                     algName = ''
                     graphFileName = ''
                     pathLength = ''
                     elapsedTime = ''
+                    phaseTimes = {}
+                    recordRepetition = 1
                     memoryConsumed = '0.0'
                     #minMemory = '0.0'
                     #maxMemory = '0.0'
@@ -301,7 +320,7 @@ def parseLine( line, indexFieldToExtract=0, delimiter='', debug=False ):
     line = line.strip()
     
     #tokenize string by delimiter, then extract and return desired index field:
-    if isNotEmpty(delimiter):
+    if graph_formats.isNotEmpty(delimiter):
         data = line.split(delimiter)
     else:
         data = line.split()
@@ -635,22 +654,23 @@ def parseTargetedMemoryConsumptionBuffer( buffer, algorithm = 'A-star', debug=Fa
 def run_parser():
 
     print ("\nProgram to parse NetworkX pathfinding results.")
-    print ("\nUsage:\n %s [path to files: str] [input file: str] [output filename prefix: str] [algorithm: 1, 2 or 3] [debugMode: 0 or 1]" \
+    print ("\nUsage:\n %s [path to files: str] [input file: str] [output filename prefix: str] [algorithm: 1, 2 or 3] [debugMode: 0 or 1] [--repetition R]" \
         % str(sys.argv[0]) )
+    print ("With '--repetition R', only the results of run R of each graph file are written (see the '--repeat' option of the pathfinding program).")
     print ("e.g.,\n  python  %s  aSubDir  inFile.txt  outFileNamePrefix  1  0\n" \
         % str(sys.argv[0]) )
 
     path = str(sys.argv[1])
-    if isNotEmpty(path) == False: path = "output"
+    if graph_formats.isNotEmpty(path) == False: path = "output"
 
     #get first command line parameter after script name
     inFileName = str(sys.argv[2])
-    if isNotEmpty(inFileName) == False: 
+    if graph_formats.isNotEmpty(inFileName) == False: 
         print("Error: input file name cannot be empty/null. Exiting.")
         sys.exit(1)
 
     outCsvFileNamePrefix = str(sys.argv[3])
-    if isNotEmpty(outCsvFileNamePrefix) == False:
+    if graph_formats.isNotEmpty(outCsvFileNamePrefix) == False:
         outCsvFileNamePrefix = inFileName + "_parsed"  #give it a default name
 
     algorithm = int(sys.argv[4])
@@ -667,10 +687,13 @@ def run_parser():
     elif debug == 0: debug = False
     else: debug = False
 
+    repetition = graph_formats.getOption('--repetition')
+    if repetition is not None: repetition = max( 1, int(repetition) )
+
     advert = "(where 1 = A* (A-star), 2 = Bellman-Ford, 3 = Dijkstra)"
     print("Running with user-selected options:\n"),
-    print("  filePath=%s\n  inFileName=%s\n  outCsvFileNamePrefix=%s\n  algorithm=%d  %s\n debugMode=%s\n" \
-        % (path, inFileName, outCsvFileNamePrefix, algorithm, advert, debug) )
+    print("  filePath=%s\n  inFileName=%s\n  outCsvFileNamePrefix=%s\n  algorithm=%d  %s\n debugMode=%s\n  repetition=%s\n" \
+        % (path, inFileName, outCsvFileNamePrefix, algorithm, advert, debug, repetition if repetition is not None else 'all') )
 
     outCsvFileExt = ".csv"
 
@@ -684,7 +707,7 @@ def run_parser():
         if debug: print("Found input CSV file %s" % inPathFile )
 
     #call method to parse file:
-    parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithmName, debug)
+    parseFile( inPathFile, path, outCsvFileNamePrefix, outCsvFileExt, algorithmName, debug, repetition)
 
 
 ############################################################
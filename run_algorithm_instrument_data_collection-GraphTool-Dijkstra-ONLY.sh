@@ -39,6 +39,15 @@
 # #2. Then run this script: 'run_algorithm_instrument_data_collection.sh'
 #
 #
+# Each pathfinding run below does 5 runs (a-e) of its algorithm on each graph
+# file, after 1 warm-up run, all in the one Python process (see the '--repeat'
+# and '--warmup' options of the pathfinding scripts); so Python, NetworkX or
+# Graph-Tool, and each graph file, are loaded only once, instead of once per
+# run. The parsers then split the raw output back into the a-e runs (see their
+# '--repetition' option), for the CSV collation script
+# ('run_algorithm_instrument_csv_collation.sh'). Its csv_combiner.py keeps the
+# phase time columns (LOAD_TIME, etc.) of each run, along with the others.
+#
 # For reference on useful Bash script pause commands, see:
 # http://stackoverflow.com/questions/21620406/how-do-i-pause-my-shell-script-for-1-second-before-continuing
 # e.g., 
@@ -69,81 +78,21 @@ echo
 
 <<COMMENT
 
-# Warm up the Python virtual machine (Graph-Tool).
-echo "Warming up Graph-Tool... (for Graph-Tool A*)"
-date
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] Graph-Tool: A* (grp 1)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  wlcx_gt_astar_grp1a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  wlcx_gt_astar_grp1b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  wlcx_gt_astar_grp1c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  wlcx_gt_astar_grp1d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  >  wlcx_gt_astar_grp1e.txt
-sleep 4s
-
-
-# Warm up the Python virtual machine (Graph-Tool).
-echo "Warming up Graph-Tool... (for Graph-Tool Bellman-Ford)"
-date
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  graphtool-pathfinding.py  graphtool-astar_grp1  1  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_astar_grp1.txt
+
+
 echo "[Wilcoxon] Graph-Tool: Bellman-Ford (grp 1)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  wlcx_gt_bellford_grp1a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  wlcx_gt_bellford_grp1b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  wlcx_gt_bellford_grp1c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  wlcx_gt_bellford_grp1d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  >  wlcx_gt_bellford_grp1e.txt
-sleep 4s
+date
+python  graphtool-pathfinding.py  graphtool-bellmanford_grp1  2  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_bellford_grp1.txt
 
 COMMENT
 
 
-# Warm up the Python virtual machine (Graph-Tool).
-echo "Warming up Graph-Tool... (for Graph-Tool Dijkstra)"
-date
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] Graph-Tool: Dijkstra (grp 1)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  wlcx_gt_dijk_grp1a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  wlcx_gt_dijk_grp1b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  wlcx_gt_dijk_grp1c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  wlcx_gt_dijk_grp1d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  >  wlcx_gt_dijk_grp1e.txt
-sleep 4s
+date
+python  graphtool-pathfinding.py  graphtool-dijkstra_grp1  3  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_dijk_grp1.txt
 
 
 ###########################################
@@ -152,81 +101,21 @@ echo "STEP 2: Generating GRAPH-TOOL data for Wilcoxon pairs test (within-group,
 echo
 <<COMMENT
 
-# Warm up the Python virtual machine (Graph-Tool).
-echo "Warming up Graph-Tool... (for Graph-Tool A*)"
-date
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] Graph-Tool: A* (grp 2)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  wlcx_gt_astar_grp2a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  wlcx_gt_astar_grp2b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  wlcx_gt_astar_grp2c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  wlcx_gt_astar_grp2d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  >  wlcx_gt_astar_grp2e.txt
-sleep 4s
-
-
-# Warm up the Python virtual machine (Graph-Tool).
-echo "Warming up Graph-Tool... (for Graph-Tool Bellman-Ford)"
-date
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  graphtool-pathfinding.py  graphtool-astar_grp2  1  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_astar_grp2.txt
+
+
 echo "[Wilcoxon] Graph-Tool: Bellman-Ford (grp 2)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  wlcx_gt_bellford_grp2a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  wlcx_gt_bellford_grp2b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  wlcx_gt_bellford_grp2c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  wlcx_gt_bellford_grp2d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  >  wlcx_gt_bellford_grp2e.txt
-sleep 4s
+date
+python  graphtool-pathfinding.py  graphtool-bellmanford_grp2  2  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_bellford_grp2.txt
 
 
 COMMENT
 
-# Warm up the Python virtual machine (Graph-Tool).
-#echo "Warming up Graph-Tool... (for Graph-Tool Dijkstra)"
-date
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] Graph-Tool: Dijkstra (grp 2)"
-echo '.'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  wlcx_gt_dijk_grp2a.txt
-sleep 4s
-echo '..'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  wlcx_gt_dijk_grp2b.txt
-sleep 4s
-echo '...'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  wlcx_gt_dijk_grp2c.txt
-sleep 4s
-echo '....'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  wlcx_gt_dijk_grp2d.txt
-sleep 4s
-echo '.....'
-python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  >  wlcx_gt_dijk_grp2e.txt
-sleep 4s
+date
+python  graphtool-pathfinding.py  graphtool-dijkstra_grp2  3  0  0  0  --repeat 5  --warmup 1  >  wlcx_gt_dijk_grp2.txt
 
 
 
@@ -238,77 +127,17 @@ sleep 4s
 echo
 echo "STEP 3: Generating NETWORKX data for Wilcoxon pairs test (within-group, using Group1 files for input):"
 echo
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX A*)"
-date
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] NetworkX: A* (grp 1):"
-echo '.'
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  wlcx_nx_astar_grp1a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  wlcx_nx_astar_grp1b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  wlcx_nx_astar_grp1c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  wlcx_nx_astar_grp1d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  >  wlcx_nx_astar_grp1e.txt
-sleep 4s
-
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX Bellman-Ford)"
-date
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  networkx-pathfinding.py  networkx-astar_grp1  1  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_astar_grp1.txt
+
 echo "[Wilcoxon] NetworkX: Bellman-Ford (grp 1)"
-echo '.'
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  wlcx_nx_bellford_grp1a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  wlcx_nx_bellford_grp1b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  wlcx_nx_bellford_grp1c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  wlcx_nx_bellford_grp1d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  >  wlcx_nx_bellford_grp1e.txt
-sleep 4s
-
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX Dijkstra)"
-date
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  networkx-pathfinding.py  networkx-bellmanford_grp1  2  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_bellford_grp1.txt
+
 echo "[Wilcoxon] NetworkX: Dijkstra (grp 1)"
-echo '.'
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  wlcx_nx_dijk_grp1a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  wlcx_nx_dijk_grp1b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  wlcx_nx_dijk_grp1c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  wlcx_nx_dijk_grp1d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  >  wlcx_nx_dijk_grp1e.txt
-sleep 4s
+date
+python  networkx-pathfinding.py  networkx-dijkstra_grp1  3  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_dijk_grp1.txt
 
 
 
@@ -316,77 +145,17 @@ sleep 4s
 echo
 echo "STEP 4: Generating NETWORKX data for Wilcoxon pairs test (within-group, using Group2 files for input):"
 echo
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX A*)"
-date
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
-date
 echo "[Wilcoxon] NetworkX: A* (grp 2):"
-echo '.'
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  wlcx_nx_astar_grp2a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  wlcx_nx_astar_grp2b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  wlcx_nx_astar_grp2c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  wlcx_nx_astar_grp2d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  >  wlcx_nx_astar_grp2e.txt
-sleep 4s
-
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX Bellman-Ford)"
-date
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  networkx-pathfinding.py  networkx-astar_grp2  1  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_astar_grp2.txt
+
 echo "[Wilcoxon] NetworkX: Bellman-Ford (grp 2)"
-echo '.'
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  wlcx_nx_bellford_grp2a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  wlcx_nx_bellford_grp2b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  wlcx_nx_bellford_grp2c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  wlcx_nx_bellford_grp2d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  >  wlcx_nx_bellford_grp2e.txt
-sleep 4s
-
-# Warm up the Python virtual machine (NetworkX).
-echo "Warming up NetworkX... (for NetworkX Dijkstra)"
-date
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  /dev/null
-sleep 4s
-echo "Warmup complete."
 date
+python  networkx-pathfinding.py  networkx-bellmanford_grp2  2  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_bellford_grp2.txt
+
 echo "[Wilcoxon] NetworkX: Dijkstra (grp 2)"
-echo '.'
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  wlcx_nx_dijk_grp2a.txt
-sleep 4s
-echo '..'
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  wlcx_nx_dijk_grp2b.txt
-sleep 4s
-echo '...'
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  wlcx_nx_dijk_grp2c.txt
-sleep 4s
-echo '....'
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  wlcx_nx_dijk_grp2d.txt
-sleep 4s
-echo '.....'
-python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  >  wlcx_nx_dijk_grp2e.txt
-sleep 4s
+date
+python  networkx-pathfinding.py  networkx-dijkstra_grp2  3  0  0  0  --repeat 5  --warmup 1  >  wlcx_nx_dijk_grp2.txt
 
 
 
@@ -399,54 +168,30 @@ date
 # Prepare the Wilcoxon data files:
 rm -rf instrument-analysis-graphtool-wilcoxon
 mkdir  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp1a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp1b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp1c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp1d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp1e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_astar_grp1.txt  instrument-analysis-graphtool-wilcoxon
 
 
-mv  wlcx_gt_bellford_grp1a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp1b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp1c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp1d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp1e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_bellford_grp1.txt  instrument-analysis-graphtool-wilcoxon
 
 
 COMMENT
 
-mv  wlcx_gt_dijk_grp1a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp1b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp1c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp1d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp1e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_dijk_grp1.txt  instrument-analysis-graphtool-wilcoxon
 echo "Moved Wilcoxon Graph-Tool data (grp 1) to folder: 'instrument-analysis-graphtool-wilcoxon'"
 date
 sleep 2s
 
 <<COMMENT
 
-mv  wlcx_gt_astar_grp2a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp2b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp2c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp2d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_astar_grp2e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_astar_grp2.txt  instrument-analysis-graphtool-wilcoxon
 
 
-mv  wlcx_gt_bellford_grp2a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp2b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp2c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp2d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_bellford_grp2e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_bellford_grp2.txt  instrument-analysis-graphtool-wilcoxon
 
 
 COMMENT
 
-mv  wlcx_gt_dijk_grp2a.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp2b.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp2c.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp2d.txt  instrument-analysis-graphtool-wilcoxon
-mv  wlcx_gt_dijk_grp2e.txt  instrument-analysis-graphtool-wilcoxon
+mv  wlcx_gt_dijk_grp2.txt  instrument-analysis-graphtool-wilcoxon
 echo "Moved Wilcoxon Graph-Tool data (grp 2) to folder: 'instrument-analysis-graphtool-wilcoxon'"
 date
 sleep 2s
@@ -455,44 +200,20 @@ sleep 2s
 <<COMMENT
 rm -rf instrument-analysis-networkx-wilcoxon
 mkdir  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp1a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp1b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp1c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp1d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp1e.txt  instrument-analysis-networkx-wilcoxon
-
-mv  wlcx_nx_bellford_grp1a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp1b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp1c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp1d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp1e.txt  instrument-analysis-networkx-wilcoxon
-
-mv  wlcx_nx_dijk_grp1a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp1b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp1c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp1d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp1e.txt  instrument-analysis-networkx-wilcoxon
+mv  wlcx_nx_astar_grp1.txt  instrument-analysis-networkx-wilcoxon
+
+mv  wlcx_nx_bellford_grp1.txt  instrument-analysis-networkx-wilcoxon
+
+mv  wlcx_nx_dijk_grp1.txt  instrument-analysis-networkx-wilcoxon
 echo "Moved Wilcoxon NetworkX data (grp 1) to folder: 'instrument-analysis-networkx-wilcoxon'"
 date
 sleep 2s
 
-mv  wlcx_nx_astar_grp2a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp2b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp2c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp2d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_astar_grp2e.txt  instrument-analysis-networkx-wilcoxon
-
-mv  wlcx_nx_bellford_grp2a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp2b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp2c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp2d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_bellford_grp2e.txt  instrument-analysis-networkx-wilcoxon
-
-mv  wlcx_nx_dijk_grp2a.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp2b.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp2c.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp2d.txt  instrument-analysis-networkx-wilcoxon
-mv  wlcx_nx_dijk_grp2e.txt  instrument-analysis-networkx-wilcoxon
+mv  wlcx_nx_astar_grp2.txt  instrument-analysis-networkx-wilcoxon
+
+mv  wlcx_nx_bellford_grp2.txt  instrument-analysis-networkx-wilcoxon
+
+mv  wlcx_nx_dijk_grp2.txt  instrument-analysis-networkx-wilcoxon
 echo "Moved Wilcoxon NetworkX data (grp 2) to folder: 'instrument-analysis-networkx-wilcoxon'"
 date
 sleep 2s
@@ -504,31 +225,31 @@ echo
 echo "STEP 6: Parsing GRAPH-TOOL Wilcoxon raw output files (grp 1)..."
 date
 echo "A* grp1"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1a.txt  wlcx_gt_astar_grp1a-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1b.txt  wlcx_gt_astar_grp1b-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1c.txt  wlcx_gt_astar_grp1c-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1d.txt  wlcx_gt_astar_grp1d-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1e.txt  wlcx_gt_astar_grp1e-PARSED  1  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1.txt  wlcx_gt_astar_grp1a-PARSED  1  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1.txt  wlcx_gt_astar_grp1b-PARSED  1  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1.txt  wlcx_gt_astar_grp1c-PARSED  1  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1.txt  wlcx_gt_astar_grp1d-PARSED  1  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp1.txt  wlcx_gt_astar_grp1e-PARSED  1  0  --repetition 5
 sleep 2s
 
 
 echo "Bellman-Ford grp1"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1a.txt  wlcx_gt_bellford_grp1a-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1b.txt  wlcx_gt_bellford_grp1b-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1c.txt  wlcx_gt_bellford_grp1c-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1d.txt  wlcx_gt_bellford_grp1d-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1e.txt  wlcx_gt_bellford_grp1e-PARSED  2  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1.txt  wlcx_gt_bellford_grp1a-PARSED  2  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1.txt  wlcx_gt_bellford_grp1b-PARSED  2  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1.txt  wlcx_gt_bellford_grp1c-PARSED  2  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1.txt  wlcx_gt_bellford_grp1d-PARSED  2  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp1.txt  wlcx_gt_bellford_grp1e-PARSED  2  0  --repetition 5
 sleep 2s
 
 
 COMMENT
 
 echo "Dijkstra grp1"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1a.txt  wlcx_gt_dijk_grp1a-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1b.txt  wlcx_gt_dijk_grp1b-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1c.txt  wlcx_gt_dijk_grp1c-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1d.txt  wlcx_gt_dijk_grp1d-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1e.txt  wlcx_gt_dijk_grp1e-PARSED  3  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1.txt  wlcx_gt_dijk_grp1a-PARSED  3  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1.txt  wlcx_gt_dijk_grp1b-PARSED  3  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1.txt  wlcx_gt_dijk_grp1c-PARSED  3  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1.txt  wlcx_gt_dijk_grp1d-PARSED  3  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp1.txt  wlcx_gt_dijk_grp1e-PARSED  3  0  --repetition 5
 sleep 2s
 echo "Completed parsing GRAPH-TOOL Wilcoxon raw output files (grp 1)."
 date
@@ -544,20 +265,20 @@ date
 
 <<COMMENT
 echo "A* grp2"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2a.txt  wlcx_gt_astar_grp2a-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2b.txt  wlcx_gt_astar_grp2b-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2c.txt  wlcx_gt_astar_grp2c-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2d.txt  wlcx_gt_astar_grp2d-PARSED  1  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2e.txt  wlcx_gt_astar_grp2e-PARSED  1  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2.txt  wlcx_gt_astar_grp2a-PARSED  1  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2.txt  wlcx_gt_astar_grp2b-PARSED  1  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2.txt  wlcx_gt_astar_grp2c-PARSED  1  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2.txt  wlcx_gt_astar_grp2d-PARSED  1  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_astar_grp2.txt  wlcx_gt_astar_grp2e-PARSED  1  0  --repetition 5
 sleep 2s
 
 
 echo "Bellman-Ford grp2"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2a.txt  wlcx_gt_bellford_grp2a-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2b.txt  wlcx_gt_bellford_grp2b-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2c.txt  wlcx_gt_bellford_grp2c-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2d.txt  wlcx_gt_bellford_grp2d-PARSED  2  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2e.txt  wlcx_gt_bellford_grp2e-PARSED  2  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2.txt  wlcx_gt_bellford_grp2a-PARSED  2  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2.txt  wlcx_gt_bellford_grp2b-PARSED  2  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2.txt  wlcx_gt_bellford_grp2c-PARSED  2  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2.txt  wlcx_gt_bellford_grp2d-PARSED  2  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_bellford_grp2.txt  wlcx_gt_bellford_grp2e-PARSED  2  0  --repetition 5
 sleep 2s
 
 
@@ -565,11 +286,11 @@ COMMENT
 
 
 echo "Dijkstra grp2"
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2a.txt  wlcx_gt_dijk_grp2a-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2b.txt  wlcx_gt_dijk_grp2b-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2c.txt  wlcx_gt_dijk_grp2c-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2d.txt  wlcx_gt_dijk_grp2d-PARSED  3  0
-python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2e.txt  wlcx_gt_dijk_grp2e-PARSED  3  0
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2.txt  wlcx_gt_dijk_grp2a-PARSED  3  0  --repetition 1
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2.txt  wlcx_gt_dijk_grp2b-PARSED  3  0  --repetition 2
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2.txt  wlcx_gt_dijk_grp2c-PARSED  3  0  --repetition 3
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2.txt  wlcx_gt_dijk_grp2d-PARSED  3  0  --repetition 4
+python  graphtool-results-parser.py  instrument-analysis-graphtool-wilcoxon/  wlcx_gt_dijk_grp2.txt  wlcx_gt_dijk_grp2e-PARSED  3  0  --repetition 5
 sleep 2s
 echo "Completed parsing GRAPH-TOOL Wilcoxon raw output files (grp 2)."
 date
@@ -583,39 +304,39 @@ echo
 echo "STEP 8: Parsing NETWORKX Wilcoxon raw output files (grp 1)..."
 date
 echo "A* grp1"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1a.txt  wlcx_nx_astar_grp1a-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1.txt  wlcx_nx_astar_grp1a-PARSED  1  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1b.txt  wlcx_nx_astar_grp1b-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1.txt  wlcx_nx_astar_grp1b-PARSED  1  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1c.txt  wlcx_nx_astar_grp1c-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1.txt  wlcx_nx_astar_grp1c-PARSED  1  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1d.txt  wlcx_nx_astar_grp1d-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1.txt  wlcx_nx_astar_grp1d-PARSED  1  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1e.txt  wlcx_nx_astar_grp1e-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp1.txt  wlcx_nx_astar_grp1e-PARSED  1  0  --repetition 5
 sleep 2s
 
 echo "Bellman-Ford grp1"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1a.txt  wlcx_nx_bellford_grp1a-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1.txt  wlcx_nx_bellford_grp1a-PARSED  2  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1b.txt  wlcx_nx_bellford_grp1b-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1.txt  wlcx_nx_bellford_grp1b-PARSED  2  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1c.txt  wlcx_nx_bellford_grp1c-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1.txt  wlcx_nx_bellford_grp1c-PARSED  2  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1d.txt  wlcx_nx_bellford_grp1d-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1.txt  wlcx_nx_bellford_grp1d-PARSED  2  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1e.txt  wlcx_nx_bellford_grp1e-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp1.txt  wlcx_nx_bellford_grp1e-PARSED  2  0  --repetition 5
 sleep 2s
 
 echo "Dijkstra grp1"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1a.txt  wlcx_nx_dijk_grp1a-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1.txt  wlcx_nx_dijk_grp1a-PARSED  3  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1b.txt  wlcx_nx_dijk_grp1b-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1.txt  wlcx_nx_dijk_grp1b-PARSED  3  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1c.txt  wlcx_nx_dijk_grp1c-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1.txt  wlcx_nx_dijk_grp1c-PARSED  3  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1d.txt  wlcx_nx_dijk_grp1d-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1.txt  wlcx_nx_dijk_grp1d-PARSED  3  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1e.txt  wlcx_nx_dijk_grp1e-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp1.txt  wlcx_nx_dijk_grp1e-PARSED  3  0  --repetition 5
 sleep 2s
 echo "Completed parsing NETWORKX Wilcoxon raw output files (grp 1)."
 date
@@ -628,39 +349,39 @@ echo
 echo "STEP 9: Parsing NETWORKX Wilcoxon raw output files (grp 2)..."
 date
 echo "A* grp2"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2a.txt  wlcx_nx_astar_grp2a-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2.txt  wlcx_nx_astar_grp2a-PARSED  1  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2b.txt  wlcx_nx_astar_grp2b-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2.txt  wlcx_nx_astar_grp2b-PARSED  1  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2c.txt  wlcx_nx_astar_grp2c-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2.txt  wlcx_nx_astar_grp2c-PARSED  1  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2d.txt  wlcx_nx_astar_grp2d-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2.txt  wlcx_nx_astar_grp2d-PARSED  1  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2e.txt  wlcx_nx_astar_grp2e-PARSED  1  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_astar_grp2.txt  wlcx_nx_astar_grp2e-PARSED  1  0  --repetition 5
 sleep 2s
 
 echo "Bellman-Ford grp2"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2a.txt  wlcx_nx_bellford_grp2a-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2.txt  wlcx_nx_bellford_grp2a-PARSED  2  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2b.txt  wlcx_nx_bellford_grp2b-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2.txt  wlcx_nx_bellford_grp2b-PARSED  2  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2c.txt  wlcx_nx_bellford_grp2c-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2.txt  wlcx_nx_bellford_grp2c-PARSED  2  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2d.txt  wlcx_nx_bellford_grp2d-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2.txt  wlcx_nx_bellford_grp2d-PARSED  2  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2e.txt  wlcx_nx_bellford_grp2e-PARSED  2  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_bellford_grp2.txt  wlcx_nx_bellford_grp2e-PARSED  2  0  --repetition 5
 sleep 2s
 
 echo "Dijkstra grp2"
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2a.txt  wlcx_nx_dijk_grp2a-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2.txt  wlcx_nx_dijk_grp2a-PARSED  3  0  --repetition 1
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2b.txt  wlcx_nx_dijk_grp2b-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2.txt  wlcx_nx_dijk_grp2b-PARSED  3  0  --repetition 2
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2c.txt  wlcx_nx_dijk_grp2c-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2.txt  wlcx_nx_dijk_grp2c-PARSED  3  0  --repetition 3
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2d.txt  wlcx_nx_dijk_grp2d-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2.txt  wlcx_nx_dijk_grp2d-PARSED  3  0  --repetition 4
 sleep 1s
-python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2e.txt  wlcx_nx_dijk_grp2e-PARSED  3  0
+python  networkx-results-parser.py  instrument-analysis-networkx-wilcoxon/  wlcx_nx_dijk_grp2.txt  wlcx_nx_dijk_grp2e-PARSED  3  0  --repetition 5
 sleep 2s
 echo "Completed parsing NETWORKX Wilcoxon raw output files (grp 2)."
 date
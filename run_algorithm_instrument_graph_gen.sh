@@ -25,7 +25,7 @@
 
 echo
 echo "Usage:"
-echo "run_graph_gen.sh -f {folder name: str} -c {count: int} -d {dimension: int} -k {cluster depth: int} -p {randomization factor: float} -n {filename prefix: str} -r {number to random stratify: int}"
+echo "run_graph_gen.sh -f {folder name: str} -c {count: int} -d {dimension: int} -k {cluster depth: int} -p {randomization factor: float} -n {filename prefix: str} -r {number to random stratify: int} [-s {seed: int}] [-x {cache folder: str}]"
 echo
 echo "Where 'count' is the number of graph files to generate PER GRAPH ANALYSIS FRAMEWORK (currently two frameworks are used)."
 echo " and 'dimension' is the X dimension of the square grid map (thus will also be the Y dimension too)."
@@ -43,6 +43,9 @@ echo
 echo "To generate 901 large (1000x1000) grid maps per graph analysis framework (901*2=1802 total), with p = 1.0% (i.e., p=0.01), connection depth of 2, stratify then random assign 150 per each of 12 groups:"
 echo ". run_algorithm_instrument_graph_gen.sh -o 'graphs_1000x1000' -c 901 -d 1000 -k 2  -p 0.01  -n 'large_1000x1000_k2_p01_' -r 150"
 echo
+echo "Optionally, give a seed (-s) to make the graphs reproducible, and a cache folder (-x) to reuse graphs"
+echo "already generated with the same inputs and seed, e.g., append:  -s 20170122  -x 'graph_cache'"
+echo
 echo "Make sure that (r * 6) <= c, since there are 6 groups (per graph analysis framework) to which 'c' samples must be divided into."
 echo
 echo
@@ -87,6 +90,16 @@ do
         NUMSTRATIFY="$2"
         shift # past argument
         ;;
+
+        -s|--seed)
+        SEED="$2"
+        shift # past argument
+        ;;
+
+        -x|--cache)
+        CACHE="$2"
+        shift # past argument
+        ;;
         
         *)
          # unknown option
@@ -112,6 +125,8 @@ echo Clustering depth = $K
 echo Randomization coefficient = $P
 echo Output filename prefix = $N
 echo Number to random stratify into each treatment group = $NUMSTRATIFY
+echo Random seed = $SEED
+echo Generation cache folder = $CACHE
 echo
 date
 echo
@@ -167,7 +182,16 @@ mkdir $OUTFOLDER
 
 #PART 2. Random generate the graph files
 echo "Running Python script to generate " $COUNT " graphs."
-python graph_generator.py $COUNT $DIMENSION $K $P $OUTFOLDER $N graphml 1 0
+GENOPTIONS=""
+if [ -n "$SEED" ]
+then
+      GENOPTIONS="$GENOPTIONS --seed $SEED"
+fi
+if [ -n "$CACHE" ]
+then
+      GENOPTIONS="$GENOPTIONS --cache $CACHE"
+fi
+python graph_generator.py $COUNT $DIMENSION $K $P $OUTFOLDER $N graphml 1 0 $GENOPTIONS
 sleep 3s
 
 